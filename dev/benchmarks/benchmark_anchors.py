@@ -0,0 +1,89 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark validating anchor-heavy schema files.
+
+Generates a schema file where one `&std_metrics` block is aliased into every
+column, and compares validating every occurrence of it with validating it once.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_anchors.py
+"""
+
+import os
+import tempfile
+import time
+
+from lightdash_pre_commit.hooks.limits import ResourceLimits, load_yaml_document
+from lightdash_pre_commit.parsers.anchors import validate_shared
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+NUM_MODELS = 20
+NUM_COLUMNS = 50
+NUM_METRICS = 30
+REPEAT = 3
+
+
+def make_document() -> str:
+    lines = ["version: 2", "models:"]
+    for model in range(NUM_MODELS):
+        lines += [f"  - name: model_{model}", "    columns:"]
+        for column in range(NUM_COLUMNS):
+            lines.append(f"      - name: column_{column}")
+            if model == 0 and column == 0:
+                lines += ["        config: &std_config", "          meta:"]
+                lines += ["            dimension:", "              type: number"]
+                lines.append("            metrics:")
+                for metric in range(NUM_METRICS):
+                    lines += [
+                        f"              metric_{metric}:",
+                        "                type: sum",
+                        f"                description: Metric {metric}",
+                        "                round: 2",
+                    ]
+            else:
+                lines.append("        config: *std_config")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "schema.yml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(make_document())
+        limits = ResourceLimits(max_alias_expansion=None)
+        document = load_yaml_document(path, limits)
+
+    def measure(validate) -> float:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            validate()
+        return (time.perf_counter() - start) / REPEAT
+
+    every_time = measure(lambda: LightdashV25.model_validate(document.data))
+    once_time = measure(
+        lambda: validate_shared(LightdashV25, document.data, document.shared)
+    )
+
+    print(
+        f"{NUM_MODELS * NUM_COLUMNS} columns aliasing {NUM_METRICS} metrics, "
+        f"{len(document.shared)} shared mapping(s)"
+    )
+    print(f"every occurrence: {every_time * 1000:8.1f} ms")
+    print(f"once:             {once_time * 1000:8.1f} ms")
+    print(f"speedup:          {every_time / once_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
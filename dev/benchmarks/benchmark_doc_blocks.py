@@ -0,0 +1,78 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark indexing the doc blocks of a project and resolving references.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_doc_blocks.py
+"""
+
+import os
+import tempfile
+import time
+
+from lightdash_pre_commit.hooks.doc_blocks import DocBlockIndex, update_index
+
+NUM_FILES = 500
+BLOCKS_PER_FILE = 40
+NUM_REFERENCES = 100_000
+
+
+def write_docs(directory: str) -> list:
+    paths = []
+    for number in range(NUM_FILES):
+        path = os.path.join(directory, f"docs_{number}.md")
+        with open(path, "w", encoding="utf-8") as file:
+            for block in range(BLOCKS_PER_FILE):
+                file.write(
+                    f"{{% docs field_{number}_{block} %}}\n"
+                    f"Field {block} of model {number}, described at length.\n"
+                    "{% enddocs %}\n\n"
+                )
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = write_docs(temp_dir)
+
+        index = DocBlockIndex()
+        start = time.perf_counter()
+        update_index(index, paths)
+        build_time = time.perf_counter() - start
+
+        # A run with a persisted index only stats the files
+        restored = DocBlockIndex.from_dict(index.to_dict())
+        start = time.perf_counter()
+        update_index(restored, paths)
+        warm_time = time.perf_counter() - start
+
+    descriptions = [
+        f"{{{{ doc('field_{number % NUM_FILES}_{number % BLOCKS_PER_FILE}') }}}}"
+        for number in range(NUM_REFERENCES)
+    ]
+    start = time.perf_counter()
+    for description in descriptions:
+        restored.resolve(description)
+    resolve_time = time.perf_counter() - start
+
+    print(f"{len(index)} doc blocks in {NUM_FILES} files")
+    print(f"build:       {build_time * 1000:8.1f} ms")
+    print(f"warm:        {warm_time * 1000:8.1f} ms")
+    print(f"resolve:     {resolve_time * 1000:8.1f} ms ({NUM_REFERENCES} references)")
+
+
+if __name__ == "__main__":
+    main()
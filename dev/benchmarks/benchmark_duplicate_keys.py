@@ -0,0 +1,86 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark looking for duplicate keys while loading a clean schema file.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_duplicate_keys.py
+"""
+
+import os
+import tempfile
+import time
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.limits import find_duplicate_keys, load_yaml_document
+
+NUM_MODELS = 100
+NUM_COLUMNS = 50
+REPEAT = 3
+
+
+def make_document() -> str:
+    lines = ["version: 2", "models:"]
+    for model in range(NUM_MODELS):
+        lines += [f"  - name: model_{model}", "    columns:"]
+        for column in range(NUM_COLUMNS):
+            lines += [
+                f"      - name: column_{column}",
+                f"        description: Column {column} of model {model}",
+                "        config:",
+                "          meta:",
+                "            dimension:",
+                "              type: number",
+                "            metrics:",
+                f"              sum_{column}:",
+                "                type: sum",
+                "                round: 2",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "schema.yml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(make_document())
+
+        def measure(duplicate_keys: bool) -> float:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                load_yaml_document(path, duplicate_keys=duplicate_keys)
+            return (time.perf_counter() - start) / REPEAT
+
+        without_time = measure(False)
+        with_time = measure(True)
+        with open(path, "r", encoding="utf-8") as file:
+            node = yaml.compose(file, Loader=yaml.SafeLoader)
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        find_duplicate_keys(node)
+    find_time = (time.perf_counter() - start) / REPEAT
+
+    print(f"{NUM_MODELS * NUM_COLUMNS} columns")
+    print(f"load:                     {without_time * 1000:8.1f} ms")
+    print(f"load with duplicate keys: {with_time * 1000:8.1f} ms")
+    print(
+        f"find duplicate keys:      {find_time * 1000:8.1f} ms "
+        f"({find_time / without_time:.1%} of the load)"
+    )
+
+
+if __name__ == "__main__":
+    main()
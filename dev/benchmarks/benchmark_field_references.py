@@ -0,0 +1,100 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark resolving the field reference graph of a project.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_field_references.py
+"""
+
+import random
+import time
+
+from lightdash_pre_commit.hooks.field_references import (
+    FieldReferenceIndex,
+    empty_model,
+    extract_references,
+)
+
+NUM_MODELS = 2000
+FIELDS_PER_MODEL = 50
+JOINS_PER_MODEL = 2
+# Last model, which no other model joins
+LEAF = f"model_{NUM_MODELS - 1}"
+
+
+def build_models(rng: random.Random, version: int):
+    models = {}
+    for number in range(NUM_MODELS):
+        entry = empty_model()
+        # Models only join earlier models and fields only refer to earlier
+        # fields of their model, so the graph has no cycle
+        entry["joins"] = {
+            f"joined_{join}": f"model_{rng.randrange(number)}"
+            for join in range(JOINS_PER_MODEL if number else 0)
+        }
+        for field in range(FIELDS_PER_MODEL):
+            references = [
+                f"${{field_{rng.randrange(field)}}}" for _ in range(2 if field else 0)
+            ]
+            references.extend(
+                f"${{{alias}.field_{rng.randrange(FIELDS_PER_MODEL)}}}"
+                for alias in entry["joins"]
+            )
+            entry["fields"][f"field_{field}"] = extract_references(
+                f"COALESCE({' + '.join(references)}, ${{TABLE}}.v{version})"
+            )
+            entry["dimensions"].append(f"field_{field}")
+        models[f"model_{number}"] = entry
+    return models
+
+
+def main() -> None:
+    rng = random.Random(0)
+    start = time.perf_counter()
+    models = build_models(rng, 0)
+    extract_time = time.perf_counter() - start
+
+    index = FieldReferenceIndex()
+    start = time.perf_counter()
+    for name, entry in models.items():
+        index.update_file(f"models/{name}.yml", [0, 0], {name: entry})
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = index.resolve(models)
+    resolve_time = time.perf_counter() - start
+    errors = sum(len(model_errors) for model_errors in results.values())
+
+    # Changing a model only re-resolves the models whose explores reach it
+    changed = dict(models[LEAF])
+    changed["fields"] = dict(changed["fields"], field_0=["field_1"])
+    index.update_file(f"models/{LEAF}.yml", [1, 0], {LEAF: changed})
+    start = time.perf_counter()
+    results = index.resolve(models)
+    update_time = time.perf_counter() - start
+    cycles = sum(len(model_errors) for model_errors in results.values())
+
+    print(f"{NUM_MODELS * FIELDS_PER_MODEL} fields in {NUM_MODELS} models")
+    print(f"extract:     {extract_time * 1000:8.1f} ms")
+    print(f"build:       {build_time * 1000:8.1f} ms")
+    print(f"resolve:     {resolve_time * 1000:8.1f} ms ({errors} errors)")
+    print(
+        f"update:      {update_time * 1000:8.1f} ms "
+        f"({len(index.resolved)} models re-resolved, {cycles} errors)"
+    )
+
+
+if __name__ == "__main__":
+    main()
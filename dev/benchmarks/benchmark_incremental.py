@@ -0,0 +1,102 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark re-checking a large schema file after a one-column edit.
+
+Generates a schema file with hundreds of models, edits one column of one
+model, and compares validating and checking the whole file with re-checking
+only the edited model against the results stored for the others.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_incremental.py
+"""
+
+import copy
+import time
+
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
+    FindDuplicateDimensionsAndMetricsV2,
+)
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.traversal import run_checkers
+from lightdash_pre_commit.hooks.utils import check_models
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+from lightdash_pre_commit.parsers.projection import validate_projection
+
+NUM_MODELS = 300
+NUM_COLUMNS = 30
+REPEAT = 5
+
+
+def make_document() -> dict:
+    return {
+        "version": 2,
+        "models": [
+            {
+                "name": f"model_{model}",
+                "columns": [
+                    {
+                        "name": f"column_{column}",
+                        "config": {
+                            "meta": {
+                                "dimension": {"type": "number"},
+                                "metrics": {
+                                    f"total_{column}": {"type": "sum"},
+                                    f"average_{column}": {"type": "average"},
+                                },
+                            }
+                        },
+                    }
+                    for column in range(NUM_COLUMNS)
+                ],
+            }
+            for model in range(NUM_MODELS)
+        ],
+    }
+
+
+def main() -> None:
+    document = make_document()
+    edited = copy.deepcopy(document)
+    edited["models"][NUM_MODELS // 2]["columns"][0]["description"] = "Edited"
+
+    def full() -> None:
+        data = validate_projection(LightdashV25, edited)
+        run_checkers(data, [FindDuplicateDimensionsAndMetricsV2()], edited)
+
+    def incremental() -> float:
+        cache = ModelResultCache()
+        check_models(
+            document, LightdashV25, [FindDuplicateDimensionsAndMetricsV2()], cache
+        )
+        start = time.perf_counter()
+        check_models(
+            edited, LightdashV25, [FindDuplicateDimensionsAndMetricsV2()], cache
+        )
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        full()
+    full_time = (time.perf_counter() - start) / REPEAT
+    incremental_time = sum(incremental() for _ in range(REPEAT)) / REPEAT
+
+    print(f"{NUM_MODELS} models of {NUM_COLUMNS} columns, one column edited")
+    print(f"whole file:  {full_time * 1000:8.1f} ms")
+    print(f"incremental: {incremental_time * 1000:8.1f} ms")
+    print(f"speedup:     {full_time / incremental_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
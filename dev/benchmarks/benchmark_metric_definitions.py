@@ -0,0 +1,79 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark clustering the metrics of a project by definition.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_metric_definitions.py
+"""
+
+import random
+import time
+
+from lightdash_pre_commit.hooks.metric_definitions import (
+    MetricDefinition,
+    MetricDefinitionIndex,
+    metric_fingerprint,
+)
+
+NUM_FILES = 500
+METRICS_PER_FILE = 100
+TYPES = ("sum", "count", "count_distinct", "average", "max")
+COLUMNS = [f"column_{number}" for number in range(200)]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    files = {}
+    start = time.perf_counter()
+    for file_number in range(NUM_FILES):
+        model = f"model_{file_number % 50}"
+        files[f"models/file_{file_number}.yml"] = [
+            MetricDefinition(
+                fingerprint=metric_fingerprint(
+                    rng.choice(TYPES),
+                    f"  {rng.choice(['SUM', 'sum'])}( ${{TABLE}}.{rng.choice(COLUMNS)} )",
+                    model,
+                ),
+                model=model,
+                name=f"metric_{file_number}_{number}",
+                column=None,
+            )
+            for number in range(METRICS_PER_FILE)
+        ]
+    fingerprint_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = MetricDefinitionIndex()
+    for file_path, definitions in files.items():
+        index.update_file(file_path, [0, 0], definitions)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters = sum(len(index.duplicates_in_file(file_path)) for file_path in files)
+    query_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.update_file("models/file_0.yml", [1, 0], files["models/file_0.yml"][:50])
+    update_time = time.perf_counter() - start
+
+    print(f"{NUM_FILES * METRICS_PER_FILE} metrics in {NUM_FILES} files")
+    print(f"fingerprint: {fingerprint_time * 1000:8.1f} ms")
+    print(f"build:       {build_time * 1000:8.1f} ms")
+    print(f"clusters:    {query_time * 1000:8.1f} ms ({clusters} reported)")
+    print(f"update file: {update_time * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark migrating a project to the dbt 1.10 layout with and without workers.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_migration.py
+"""
+
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from lightdash_pre_commit.cli import main as cli_main
+
+NUM_FILES = 1000
+NUM_COLUMNS = 20
+
+
+def make_document(number: int) -> str:
+    lines = [
+        "version: 2",
+        "models:",
+        f"  - name: model_{number}",
+        "    meta:",
+        "      joins:",
+        f"        - join: model_{number - 1}",
+        f"          sql_on: ${{model_{number}.id}} = ${{model_{number - 1}.id}}",
+        "    columns:",
+    ]
+    for column in range(NUM_COLUMNS):
+        lines += [
+            f"      - name: column_{column}",
+            f"        description: Column {column} of model {number}",
+            "        meta:",
+            "          dimension:",
+            "            type: number",
+            "          metrics:",
+            f"            sum_{column}:",
+            "              type: sum",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def measure(jobs: int) -> float:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for number in range(NUM_FILES):
+            path = os.path.join(temp_dir, f"model_{number}.yml")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(make_document(number))
+            paths.append(path)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            exit_code = cli_main(["migrate", f"--jobs={jobs}", *paths])
+        elapsed = time.perf_counter() - start
+    assert exit_code == 0
+    return elapsed
+
+
+def main() -> None:
+    serial = measure(1)
+    parallel = measure(0)
+    print(f"{NUM_FILES} files of {NUM_COLUMNS} columns")
+    print(f"serial:      {serial * 1000:8.1f} ms")
+    print(
+        f"parallel:    {parallel * 1000:8.1f} ms "
+        f"({os.cpu_count()} processes, {serial / parallel:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark "did you mean" queries of the nearest-name index.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_name_index.py
+"""
+
+import random
+import time
+
+from lightdash_pre_commit.hooks.name_index import NameIndex, bounded_levenshtein
+
+NUM_NAMES = 20_000
+NUM_QUERIES = 1_000
+WORDS = (
+    "order customer created updated at id total revenue count user session amount "
+    "date status region product item price discount tax net gross first last name"
+).split()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    names = set()
+    while len(names) < NUM_NAMES:
+        names.add("_".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))))
+    queries = []
+    for name in rng.sample(sorted(names), NUM_QUERIES):
+        position = rng.randrange(len(name))
+        queries.append(name[:position] + name[position + 1 :])
+
+    start = time.perf_counter()
+    index = NameIndex(names)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        index.suggest(query)
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries[:50]:
+        sorted(
+            (distance, name)
+            for name in names
+            for distance in [bounded_levenshtein(query, name, 2)]
+            if distance is not None
+        )[:3]
+    naive_time = (time.perf_counter() - start) / 50 * NUM_QUERIES
+
+    print(f"{NUM_NAMES} names, {NUM_QUERIES} queries")
+    print(f"build:   {build_time * 1000:8.1f} ms")
+    print(f"indexed: {indexed_time / NUM_QUERIES * 1000:8.3f} ms per query")
+    print(f"naive:   {naive_time / NUM_QUERIES * 1000:8.3f} ms per query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the naming conventions matcher.
+
+Compares the compiled rule set against evaluating every rule one by one, with
+hundreds of rules and tens of thousands of field names.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_naming_conventions.py
+"""
+
+import random
+import re
+import time
+
+from lightdash_pre_commit.hooks.check_naming_conventions import (
+    METRIC_TYPES,
+    NamingConventionsConfig,
+    NamingRuleSet,
+)
+
+NUM_BANNED_WORDS = 400
+NUM_FORBIDDEN_PATTERNS = 100
+NUM_PREFIXES_PER_TYPE = 10
+NUM_NAMES = 50_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    def make_word() -> str:
+        return "".join(rng.choice(letters) for _ in range(rng.randint(3, 7)))
+
+    banned_words = [make_word() for _ in range(NUM_BANNED_WORDS)]
+    forbidden_patterns = [
+        f"{make_word()}_[0-9]+" for _ in range(NUM_FORBIDDEN_PATTERNS)
+    ]
+    prefixes = {
+        metric_type: [make_word() + "_" for _ in range(NUM_PREFIXES_PER_TYPE)]
+        for metric_type in METRIC_TYPES
+    }
+    metric_types = sorted(METRIC_TYPES)
+    fields = []
+    for _ in range(NUM_NAMES):
+        metric_type = rng.choice(metric_types)
+        words = [make_word() for _ in range(rng.randint(1, 3))]
+        # Most names follow the conventions, as in a real project
+        if rng.random() < 0.95:
+            words.insert(0, rng.choice(prefixes[metric_type])[:-1])
+        fields.append(("_".join(words), metric_type))
+    num_rules = (
+        NUM_BANNED_WORDS
+        + NUM_FORBIDDEN_PATTERNS
+        + NUM_PREFIXES_PER_TYPE * len(METRIC_TYPES)
+        + 2
+    )
+
+    start = time.perf_counter()
+    rule_set = NamingRuleSet(
+        NamingConventionsConfig.model_validate(
+            {
+                "metrics": {"max_length": 40, "prefixes": prefixes},
+                "banned_words": banned_words,
+                "forbidden_patterns": forbidden_patterns,
+            }
+        )
+    )
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combined_hits = sum(
+        1
+        for name, metric_type in fields
+        if rule_set.check_name(name, "metrics", metric_type)
+    )
+    combined_time = time.perf_counter() - start
+
+    pattern = re.compile(r"^[a-z][a-z0-9_]*$")
+    banned_patterns = [
+        re.compile(rf"(?<![A-Za-z0-9]){word}(?![A-Za-z0-9])") for word in banned_words
+    ]
+    compiled_forbidden = [re.compile(pattern) for pattern in forbidden_patterns]
+    prefix_patterns = {
+        metric_type: [re.compile(re.escape(prefix)) for prefix in values]
+        for metric_type, values in prefixes.items()
+    }
+    start = time.perf_counter()
+    naive_hits = 0
+    for name, metric_type in fields:
+        violated = not pattern.match(name) or len(name) > 40
+        violated |= not any(p.match(name) for p in prefix_patterns[metric_type])
+        violated |= any(p.search(name) for p in banned_patterns)
+        violated |= any(p.search(name) for p in compiled_forbidden)
+        naive_hits += violated
+    naive_time = time.perf_counter() - start
+
+    print(f"{num_rules} rules, {NUM_NAMES} names")
+    print(f"compile:     {compile_time * 1000:8.1f} ms")
+    print(
+        f"combined:    {combined_time * 1000:8.1f} ms ({combined_hits} violating names)"
+    )
+    print(f"rule by rule:{naive_time * 1000:8.1f} ms ({naive_hits} violating names)")
+    print(f"speedup:     {naive_time / combined_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark validating and checking a single very large schema file in parallel.
+
+Generates a schema file with a thousand models and compares validating and
+checking its models in the process of the hook with splitting them into
+chunks across a pool of workers, one per CPU. The pool is started before the
+measurement, as a hook reuses it for every large file of a run.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_parallel.py
+"""
+
+import os
+import time
+from typing import Optional
+
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
+    FindDuplicateDimensionsAndMetricsV2,
+)
+from lightdash_pre_commit.hooks.parallel import ModelPool
+from lightdash_pre_commit.hooks.utils import check_models
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+NUM_MODELS = 1000
+NUM_COLUMNS = 30
+REPEAT = 3
+
+
+def make_document() -> dict:
+    return {
+        "version": 2,
+        "models": [
+            {
+                "name": f"model_{model}",
+                "columns": [
+                    {
+                        "name": f"column_{column}",
+                        "config": {
+                            "meta": {
+                                "dimension": {"type": "number"},
+                                "metrics": {
+                                    f"total_{column}": {"type": "sum"},
+                                    f"average_{column}": {"type": "average"},
+                                },
+                            }
+                        },
+                    }
+                    for column in range(NUM_COLUMNS)
+                ],
+            }
+            for model in range(NUM_MODELS)
+        ],
+    }
+
+
+def measure(document: dict, pool: Optional[ModelPool] = None) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        check_models(
+            document, LightdashV25, [FindDuplicateDimensionsAndMetricsV2()], pool=pool
+        )
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main() -> None:
+    document = make_document()
+    serial_time = measure(document)
+    pool = ModelPool(0)
+    try:
+        # Start the workers
+        measure(document, pool)
+        parallel_time = measure(document, pool)
+    finally:
+        pool.close()
+
+    print(f"{NUM_MODELS} models of {NUM_COLUMNS} columns, {os.cpu_count()} CPUs")
+    print(f"serial:   {serial_time * 1000:8.1f} ms")
+    print(f"parallel: {parallel_time * 1000:8.1f} ms ({pool.jobs} jobs)")
+    print(f"speedup:  {serial_time / parallel_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark validating the projection of test-heavy schema files.
+
+Generates schema files where most bytes are dbt tests and sources, as in
+projects that test every column, and compares validating the full documents
+with validating their projections onto what Lightdash reads.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_projection.py
+"""
+
+import time
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+from lightdash_pre_commit.parsers.projection import (
+    project_document,
+    validate_projection,
+)
+
+NUM_FILES = 20
+NUM_MODELS = 20
+NUM_COLUMNS = 30
+NUM_SOURCE_TABLES = 50
+REPEAT = 3
+
+
+def make_column(index: int) -> dict:
+    return {
+        "name": f"column_{index}",
+        "description": "A column",
+        "data_tests": [
+            "not_null",
+            "unique",
+            {
+                "accepted_values": {
+                    "values": [f"value_{value}" for value in range(20)],
+                    "config": {
+                        "severity": "warn",
+                        "where": "updated_at > '2024-01-01'",
+                    },
+                }
+            },
+            {"relationships": {"to": "ref('customers')", "field": "customer_id"}},
+        ],
+        "config": {"meta": {"dimension": {"type": "string"}}},
+    }
+
+
+def make_document(file_index: int) -> dict:
+    return {
+        "version": 2,
+        "models": [
+            {
+                "name": f"model_{file_index}_{model}",
+                "data_tests": [
+                    {"dbt_utils.expression_is_true": {"expression": f"column_{i} >= 0"}}
+                    for i in range(5)
+                ],
+                "config": {
+                    "meta": {"metrics": {"row_count": {"type": "count", "sql": "1"}}}
+                },
+                "columns": [make_column(column) for column in range(NUM_COLUMNS)],
+            }
+            for model in range(NUM_MODELS)
+        ],
+        "sources": [
+            {
+                "name": "raw",
+                "tables": [
+                    {
+                        "name": f"table_{table}",
+                        "columns": [make_column(column) for column in range(10)],
+                    }
+                    for table in range(NUM_SOURCE_TABLES)
+                ],
+            }
+        ],
+    }
+
+
+def main() -> None:
+    documents = [make_document(index) for index in range(NUM_FILES)]
+    total_bytes = sum(len(yaml.safe_dump(document)) for document in documents)
+    projected_bytes = sum(
+        len(yaml.safe_dump(project_document(document))) for document in documents
+    )
+
+    def measure(validate) -> float:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            for document in documents:
+                validate(document)
+        return (time.perf_counter() - start) / REPEAT
+
+    full_time = measure(LightdashV25.model_validate)
+    projection_time = measure(
+        lambda document: validate_projection(LightdashV25, document)
+    )
+
+    print(
+        f"{NUM_FILES} files, {total_bytes / 1024 / 1024:.1f} MiB of YAML, "
+        f"{projected_bytes / total_bytes:.0%} of it read by Lightdash"
+    )
+    print(f"full:       {full_time * 1000:8.1f} ms")
+    print(f"projection: {projection_time * 1000:8.1f} ms")
+    print(f"speedup:    {full_time / projection_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark finding near-duplicate labels with MinHash and LSH.
+
+Usage:
+    PYTHONPATH=src python dev/benchmarks/benchmark_similar_fields.py
+"""
+
+import random
+import time
+
+from lightdash_pre_commit.hooks.limits import MIB
+from lightdash_pre_commit.hooks.minhash import SimilarityIndex, jaccard, shingles
+
+NUM_TEXTS = 20_000
+NUM_PAIRWISE = 2_000
+THRESHOLD = 0.6
+NUM_WORDS = 2_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    # Labels mostly share a few common words such as "Total" and "Count"
+    words = [f"word{number}" for number in range(NUM_WORDS)]
+    weights = [1 / (rank + 1) for rank in range(NUM_WORDS)]
+    texts = [
+        " ".join(rng.choices(words, weights, k=rng.randint(2, 6)))
+        for _ in range(NUM_TEXTS)
+    ]
+
+    for max_memory in (256 * MIB, 16 * MIB):
+        start = time.perf_counter()
+        index: SimilarityIndex[int] = SimilarityIndex(THRESHOLD, max_memory)
+        for number, text in enumerate(texts):
+            index.add(number, text)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        similar = index.similar()
+        query_time = time.perf_counter() - start
+        print(
+            f"{max_memory // MIB:4d} MiB cap: build {build_time * 1000:8.1f} ms, "
+            f"compare {query_time * 1000:8.1f} ms in {index.passes} passes"
+            + (" (truncated) " if index.truncated else " ")
+            + f"index {index.memory() / MIB:5.1f} MiB "
+            f"({len(similar)} similar texts, bands={index.bands}, rows={index.rows})"
+        )
+
+    token_sets = [shingles(text) for text in texts[:NUM_PAIRWISE]]
+    start = time.perf_counter()
+    pairs = 0
+    for position, left in enumerate(token_sets):
+        for right in token_sets[position + 1 :]:
+            pairs += jaccard(left, right) >= THRESHOLD
+    pairwise_time = time.perf_counter() - start
+    scale = (NUM_TEXTS / NUM_PAIRWISE) ** 2
+    print(f"pairwise (extrapolated): {pairwise_time * scale * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
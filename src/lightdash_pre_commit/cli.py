@@ -0,0 +1,177 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Sequence
+
+from lightdash_pre_commit.hooks.discovery import (
+    add_discovery_arguments,
+    iter_file_paths,
+)
+from lightdash_pre_commit.hooks.history import (
+    HISTORY_ENV,
+    HistoryError,
+    read_history,
+    summarize_history,
+)
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.migration import migrate_file
+from lightdash_pre_commit.hooks.sharding import ShardError, merge_partials
+
+# Files sent to a worker at once, as migrating a single file is quick
+MIGRATE_CHUNK_SIZE = 16
+
+
+def merge(args: argparse.Namespace) -> int:
+    """Combine the partial results of sharded runs into one report."""
+    try:
+        results, exit_code = merge_partials(args.partials)
+    except ShardError as e:
+        print(e)
+        return 2
+    for file_path, errors in results:
+        print(f"Errors found in '{file_path}':")
+        for error in errors:
+            print(f"  {error}")
+    return exit_code
+
+
+def stats(args: argparse.Namespace) -> int:
+    """Summarize the trends of the run history of the hooks."""
+    if not args.history_file:
+        print(f"No run history: pass --history-file or set ${HISTORY_ENV}")
+        return 2
+    try:
+        records = read_history(args.history_file)
+    except HistoryError as e:
+        print(e)
+        return 2
+    print(summarize_history(records, hook=args.hook, last=args.last, top=args.top))
+    return 0
+
+
+def migrate(args: argparse.Namespace) -> int:
+    """Move the meta and tags of models and columns under config, for dbt 1.10."""
+    file_paths = list(iter_file_paths(args))
+    if not file_paths:
+        print("No files provided.")
+        return 0
+
+    migrate_one = partial(
+        migrate_file, limits=ResourceLimits.from_args(args), write=not args.check
+    )
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if jobs > 1 and len(file_paths) > 1:
+        # Parsing and validating hold the GIL, so the workers are processes
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(migrate_one, file_paths, chunksize=MIGRATE_CHUNK_SIZE)
+            )
+    else:
+        results = [migrate_one(file_path) for file_path in file_paths]
+
+    exit_code = 0
+    migrated = 0
+    for result in results:
+        if result.errors:
+            exit_code = 1
+            print(f"Errors found in '{result.file_path}':")
+            for error in result.errors:
+                print(f"  {error}")
+        elif result.migrated:
+            migrated += 1
+            print(
+                f"{'Would migrate' if args.check else 'Migrated'} "
+                f"'{result.file_path}' ({result.migrated} models and columns)"
+            )
+    print(
+        f"{migrated} of {len(file_paths)} files "
+        f"{'to migrate' if args.check else 'migrated'}"
+    )
+    if args.check and migrated:
+        exit_code = 1
+    return exit_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the command line tool."""
+    parser = argparse.ArgumentParser(
+        prog="lightdash-pre-commit",
+        description="Tools around the Lightdash pre-commit hooks",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    merge_parser = subparsers.add_parser(
+        "merge", help="Combine the partial results of hooks run with --shard"
+    )
+    merge_parser.add_argument(
+        "partials", nargs="+", help="Partial result files written by the shards"
+    )
+    merge_parser.set_defaults(func=merge)
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="Summarize the run history recorded with --history-file"
+    )
+    stats_parser.add_argument(
+        "--history-file",
+        default=os.environ.get(HISTORY_ENV) or None,
+        help=f"Path of the run history (default: ${HISTORY_ENV})",
+    )
+    stats_parser.add_argument(
+        "--hook", default=None, help="Only summarize the runs of this hook"
+    )
+    stats_parser.add_argument(
+        "--last",
+        type=int,
+        default=None,
+        help="Only summarize the last N runs of each hook",
+    )
+    stats_parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Number of files slowing down listed per hook (default: 5)",
+    )
+    stats_parser.set_defaults(func=stats)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate",
+        help="Migrate schema files in place from the dbt 1.9 layout to the "
+        "dbt 1.10 layout",
+    )
+    migrate_parser.add_argument("filenames", nargs="*", help="Filenames to migrate")
+    migrate_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report the files to migrate, failing if there are any",
+    )
+    migrate_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of processes migrating files (0 for one per CPU, default: 0)",
+    )
+    add_discovery_arguments(migrate_parser)
+    add_limit_arguments(migrate_parser)
+    migrate_parser.set_defaults(func=migrate)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -13,17 +13,75 @@
 # limitations under the License.
 
 import abc
-from typing import List, Union
+from typing import Any, Callable, ClassVar, Dict, List, Tuple, Type, Union
 
+from pydantic import BaseModel
+
+from lightdash_pre_commit.hooks.traversal import (
+    VISITOR_METHODS,
+    ColumnNode,
+    DimensionNode,
+    MetricNode,
+    ModelNode,
+    run_checkers,
+)
 from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
 from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
 
 
-# ruff: noqa: B024
+# ruff: noqa: B024, B027
 class BaseChecker(abc.ABC):
-    """Base class for all checkers."""
+    """Base class for all checkers.
+
+    A checker registers callbacks for the nodes it is interested in by overriding
+    the `visit_*` methods. All the checkers enabled for a hook are driven by a
+    single traversal of each document (see `run_checkers`).
+    """
+
+    # Parser classes whose documents the checker accepts
+    parser_classes: ClassVar[Tuple[Type[BaseModel], ...]] = (LightdashV20, LightdashV25)
+    # Whether the errors of a model only depend on the model itself, so that
+    # they can be reused while the model is unchanged (see ModelResultCache)
+    model_scoped: ClassVar[bool] = False
+
+    def __init__(self) -> None:
+        self.errors: List[str] = []
 
     @classmethod
     def check(cls, data: Union[LightdashV20, LightdashV25], **kwargs) -> List[str]:
         """Check the data and return a list of errors."""
-        raise NotImplementedError
+        return run_checkers(data, [cls(**kwargs)]).errors
+
+    def registered_callbacks(self) -> Dict[str, Callable[[Any], None]]:
+        """Get the visitor callbacks overridden by the checker."""
+        return {
+            method: getattr(self, method)
+            for method in VISITOR_METHODS
+            if getattr(type(self), method) is not getattr(BaseChecker, method)
+        }
+
+    def start_document(self, data: Union[LightdashV20, LightdashV25]) -> None:
+        """Reset the per-document state before a document is traversed."""
+        if not isinstance(data, self.parser_classes):
+            expected = " or ".join(klass.__name__ for klass in self.parser_classes)
+            raise ValueError(f"Expected 'data' keyword argument of type {expected}")
+        self.errors = []
+
+    def visit_model(self, node: ModelNode) -> None:
+        """Called when entering a model."""
+
+    def leave_model(self, node: ModelNode) -> None:
+        """Called after all the fields of a model are visited."""
+
+    def visit_column(self, node: ColumnNode) -> None:
+        """Called for each named column."""
+
+    def visit_metric(self, node: MetricNode) -> None:
+        """Called for each model-level or column-level metric."""
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        """Called for each column dimension and additional dimension."""
+
+    def finish_document(self, data: Union[LightdashV20, LightdashV25]) -> List[str]:
+        """Return the errors found in the document."""
+        return self.errors
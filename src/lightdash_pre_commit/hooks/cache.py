@@ -0,0 +1,88 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+# Bump when the layout of any persisted cache changes
+CACHE_FORMAT_VERSION = 3
+
+DEFAULT_CACHE_DIR = ".lightdash-pre-commit-cache"
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser, contents: str) -> None:
+    """Add the `--cache-dir` option to a hook.
+
+    Args:
+        parser: Argument parser of the hook
+        contents: What the hook persists in the cache, e.g., "the join graph"
+    """
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Directory persisting {contents} between runs (e.g., {DEFAULT_CACHE_DIR})",
+    )
+
+
+def file_signature(file_path: str) -> Optional[List[int]]:
+    """Get a cheap signature of a file to detect changes between runs.
+
+    Returns:
+        [mtime_ns, size] of the file, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_cache(cache_path: str, kind: str) -> Dict[str, Any]:
+    """Load a persisted cache, returning an empty one if it is missing or stale.
+
+    Args:
+        cache_path: Path to the cache file
+        kind: Name of the cache, guarding against loading another cache's file
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_FORMAT_VERSION
+        or data.get("kind") != kind
+    ):
+        return {}
+    return data.get("data") or {}
+
+
+def save_cache(cache_path: str, kind: str, data: Dict[str, Any]) -> None:
+    """Atomically persist a cache so that concurrent runs never see a partial file."""
+    cache_dir = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(cache_dir, exist_ok=True)
+    payload = {"version": CACHE_FORMAT_VERSION, "kind": kind, "data": data}
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(payload, file, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
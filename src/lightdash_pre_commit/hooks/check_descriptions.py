@@ -0,0 +1,316 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments, load_cache, save_cache
+from lightdash_pre_commit.hooks.discovery import (
+    MARKDOWN_EXTENSIONS,
+    DiscoveryError,
+    add_discovery_arguments,
+    load_project,
+    walk_yaml_files,
+)
+from lightdash_pre_commit.hooks.doc_blocks import (
+    DocBlock,
+    DocBlockIndex,
+    update_index,
+)
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.name_index import NameIndex, did_you_mean
+from lightdash_pre_commit.hooks.projects import (
+    add_project_arguments,
+    find_project_root,
+    run_per_project,
+)
+from lightdash_pre_commit.hooks.sharding import ShardReport, add_shard_arguments
+from lightdash_pre_commit.hooks.traversal import DimensionNode, MetricNode, ModelNode
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+CACHE_KIND = "doc_blocks"
+DEFAULT_MIN_LENGTH = 10
+DEFAULT_FORBIDDEN_TERMS = ("TODO", "TBD", "FIXME")
+
+
+@dataclass
+class DescriptionRules:
+    """What the descriptions of a project must satisfy."""
+
+    min_length: int = DEFAULT_MIN_LENGTH
+    forbidden_terms: Sequence[str] = DEFAULT_FORBIDDEN_TERMS
+    require_model: bool = False
+    require_metric: bool = True
+    require_dimension: bool = False
+    _forbidden: Optional[Pattern[str]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.forbidden_terms:
+            self._forbidden = re.compile(
+                r"(?<![A-Za-z0-9])(?:"
+                + "|".join(map(re.escape, self.forbidden_terms))
+                + r")(?![A-Za-z0-9])",
+                re.IGNORECASE,
+            )
+
+    def violations(self, text: str) -> List[str]:
+        """Explain why a resolved description is of poor quality."""
+        violations = []
+        if len(text.strip()) < self.min_length:
+            violations.append(
+                f"has a description shorter than {self.min_length} characters"
+            )
+        if self._forbidden is not None:
+            for term in dict.fromkeys(
+                match.group(0) for match in self._forbidden.finditer(text)
+            ):
+                violations.append(
+                    f"has a description containing the placeholder '{term}'"
+                )
+        return violations
+
+
+class DescriptionChecker(BaseChecker):
+    """Check the descriptions of models, metrics and dimensions.
+
+    The `{{ doc(...) }}` references of a description are resolved against the
+    doc block index before its quality is checked.
+    """
+
+    def __init__(
+        self, doc_blocks: DocBlockIndex, rules: Optional[DescriptionRules] = None
+    ) -> None:
+        super().__init__()
+        self.doc_blocks = doc_blocks
+        self.rules = rules or DescriptionRules()
+        # Violations of each resolved description, as many fields share a doc block
+        self._violations: Dict[str, List[str]] = {}
+        self._suggestions: Optional[NameIndex] = None
+
+    def _check(self, subject: str, description: Optional[str], required: bool) -> None:
+        if not description:
+            if required:
+                self.errors.append(f"{subject} has no description")
+            return
+        text, blocks, missing = self.doc_blocks.resolve(description)
+        for name in missing:
+            if self._suggestions is None:
+                self._suggestions = NameIndex(self.doc_blocks.names())
+            self.errors.append(
+                f"{subject} refers to the missing doc block '{name}'"
+                + did_you_mean(self._suggestions.suggest(name))
+            )
+        if missing:
+            return
+        violations = self._violations.get(text)
+        if violations is None:
+            violations = self._violations[text] = self.rules.violations(text)
+        source = self._source(blocks)
+        for violation in violations:
+            self.errors.append(f"{subject} {violation}{source}")
+
+    def _source(self, blocks: List[DocBlock]) -> str:
+        """Point at the doc block a resolved description comes from."""
+        if len(blocks) != 1:
+            return ""
+        block = blocks[0]
+        ambiguous = len(self.doc_blocks.get(block.name)) > 1
+        return (
+            f" (doc block '{block.name}' in {block.location()}"
+            + (", defined more than once" if ambiguous else "")
+            + ")"
+        )
+
+    def visit_model(self, node: ModelNode) -> None:
+        self._check(
+            f"Model '{node.name}'",
+            getattr(node.model, "description", None),
+            self.rules.require_model,
+        )
+
+    def visit_metric(self, node: MetricNode) -> None:
+        self._check(
+            f"Metric '{node.name}' in model '{node.model.name}'",
+            getattr(node.metric, "description", None),
+            self.rules.require_metric,
+        )
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        dimension = node.dimension
+        description = getattr(dimension, "description", None)
+        if description is None and not node.additional:
+            # A column dimension is described by its column unless overridden
+            description = getattr(node.column.column, "description", None)
+        kind = "Additional dimension" if node.additional else "Dimension"
+        self._check(
+            f"{kind} '{node.name}' in model '{node.model.name}'",
+            description,
+            self.rules.require_dimension and not getattr(dimension, "hidden", None),
+        )
+
+
+def find_docs_directories(
+    args: argparse.Namespace, file_paths: Sequence[str]
+) -> List[str]:
+    """Find the directories whose Markdown files define doc blocks.
+
+    These are the `--docs-path` directories and the docs paths of the dbt
+    project of `--project-dir` and of the projects of the files.
+    """
+    directories: List[str] = list(args.docs_path)
+    projects = [args.project_dir] if args.project_dir is not None else []
+    roots: Dict[str, Optional[str]] = {}
+    for root in dict.fromkeys(
+        find_project_root(file_path, roots) for file_path in file_paths
+    ):
+        if root is None:
+            continue
+        try:
+            projects.append(load_project(root))
+        except DiscoveryError:
+            continue
+    for project in projects:
+        directories.extend(
+            os.path.join(project.root, docs_path) for docs_path in project.docs_paths
+        )
+    return list(dict.fromkeys(os.path.normpath(path) for path in directories))
+
+
+def find_markdown_files(directories: Sequence[str]) -> List[str]:
+    """Find the Markdown files under directories, skipping those ignored by git."""
+    found: Dict[str, None] = {}
+    for directory in directories:
+        if os.path.isdir(directory):
+            for file_path in walk_yaml_files(directory, extensions=MARKDOWN_EXTENSIONS):
+                found[os.path.normpath(file_path)] = None
+    return list(found)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check the descriptions of Lightdash models, metrics and "
+        "dimensions, resolving their doc blocks"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--min-length",
+        type=int,
+        default=DEFAULT_MIN_LENGTH,
+        help=f"Minimum length of a description (default: {DEFAULT_MIN_LENGTH})",
+    )
+    parser.add_argument(
+        "--forbidden-terms",
+        default=",".join(DEFAULT_FORBIDDEN_TERMS),
+        help="Comma-separated placeholder terms a description may not contain "
+        f"(default: {','.join(DEFAULT_FORBIDDEN_TERMS)})",
+    )
+    parser.add_argument(
+        "--require-model-desc",
+        action="store_true",
+        help="Require a description on every model",
+    )
+    parser.add_argument(
+        "--require-metric-desc",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Require a description on every metric (default: true)",
+    )
+    parser.add_argument(
+        "--require-dimension-desc",
+        action="store_true",
+        help="Require a description on every dimension that is not hidden",
+    )
+    parser.add_argument(
+        "--docs-path",
+        action="append",
+        default=[],
+        help="Directory whose Markdown files define doc blocks, in addition to "
+        "the docs paths of the dbt projects (repeatable)",
+    )
+    add_cache_arguments(parser, "the doc block index")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    rules = DescriptionRules(
+        min_length=args.min_length,
+        forbidden_terms=[
+            term.strip() for term in args.forbidden_terms.split(",") if term.strip()
+        ],
+        require_model=args.require_model_desc,
+        require_metric=args.require_metric_desc,
+        require_dimension=args.require_dimension_desc,
+    )
+    cache_path = (
+        os.path.join(args.cache_dir, f"{CACHE_KIND}.json") if args.cache_dir else None
+    )
+    index = DocBlockIndex.from_dict(
+        load_cache(cache_path, CACHE_KIND) if cache_path else {}
+    )
+
+    # Doc blocks are looked up in the projects of all the files, but only the
+    # files of the shard are checked
+    report = ShardReport.from_args("check-descriptions", args)
+    file_paths = report.read_all_file_paths()
+    recorder = RunRecorder.from_args(report.hook, args, file_paths)
+    with recorder.stage("index doc blocks"):
+        markdown_paths = find_markdown_files(find_docs_directories(args, file_paths))
+        # Previously indexed files are re-checked so that deleted files are dropped
+        markdown_paths = list(dict.fromkeys(markdown_paths + index.indexed_files()))
+        update_index(index, markdown_paths)
+
+    checker = DescriptionChecker(index, rules)
+    limits = ResourceLimits.from_args(args)
+    exit_code = 0
+    for file_path in report:
+        errors, success = process_single_file(
+            file_path, LightdashV25, checker, limits=limits, recorder=recorder
+        )
+        report.add(file_path, errors)
+        if not success:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    if cache_path:
+        with recorder.stage("save cache"):
+            save_cache(cache_path, CACHE_KIND, index.to_dict())
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
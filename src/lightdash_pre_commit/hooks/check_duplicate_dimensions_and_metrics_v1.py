@@ -13,171 +13,25 @@
 # limitations under the License.
 
 import argparse
-from typing import Dict, List, Optional, Sequence
-
-from lightdash_pre_commit.hooks.base import BaseChecker
+from typing import Dict, Optional, Sequence
+
+from lightdash_pre_commit.hooks.cache import add_cache_arguments
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.duplicates import DuplicateNamesChecker
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.parallel import ModelPool, add_parallel_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import ShardReport, add_shard_arguments
 from lightdash_pre_commit.hooks.utils import process_single_file
-from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20, Model
+from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
 
 
-class FindDuplicateDimensionsAndMetricsV1(BaseChecker):
+class FindDuplicateDimensionsAndMetricsV1(DuplicateNamesChecker):
     """Find duplicate names across metrics and dimensions for dbt 1.9 or earlier."""
 
-    @classmethod
-    def check(cls, data: LightdashV20) -> List[str]:  # type: ignore[override]
-        """Check the data and return a list of errors."""
-        if not isinstance(data, LightdashV20):
-            raise ValueError("Expected 'data' keyword argument of type LightdashV20")
-
-        all_errors: List[str] = []
-
-        # Check for duplicates within each model individually
-        if data.models:
-            for model in data.models:
-                model_name = model.name or "unknown_model"
-                model_errors = cls._check_single_model(model, model_name)
-                all_errors.extend(model_errors)
-
-        return all_errors
-
-    @classmethod
-    def _check_single_model(cls, model: Model, model_name: str) -> List[str]:
-        """Check for duplicates within a single model."""
-        all_names: Dict[str, List[str]] = {}  # Track names and their sources
-        errors: List[str] = []
-
-        # Process model-level metrics
-        if model.meta and model.meta.metrics:
-            for metric_name in model.meta.metrics.keys():
-                if metric_name not in all_names:
-                    all_names[metric_name] = []
-                all_names[metric_name].append("model-level metric")
-
-        # Check for metrics and dimensions defined at the column level
-        if model.columns:
-            for column in model.columns:
-                if not column.meta or not column.name:
-                    continue
-
-                column_name = column.name
-
-                # Process column-level dimensions (the column name itself becomes a dimension)
-                if column.meta.dimension:
-                    if column_name not in all_names:
-                        all_names[column_name] = []
-                    all_names[column_name].append(f"column '{column_name}' dimension")
-
-                # Process column-level additional dimensions
-                if column.meta.additional_dimensions:
-                    for ad_dim_name in column.meta.additional_dimensions.keys():
-                        if ad_dim_name not in all_names:
-                            all_names[ad_dim_name] = []
-                        all_names[ad_dim_name].append(
-                            f"additional dimension in column '{column_name}'"
-                        )
-
-                # Process column-level metrics
-                if column.meta.metrics:
-                    for metric_name in column.meta.metrics.keys():
-                        if metric_name not in all_names:
-                            all_names[metric_name] = []
-                        all_names[metric_name].append(
-                            f"metric in column '{column_name}'"
-                        )
-
-        # Check for duplicates within this model
-        for name, sources in all_names.items():
-            if len(sources) > 1:
-                errors.append(
-                    f"Duplicate name '{name}' used {len(sources)} times: {', '.join(sources)} in model '{model_name}'"
-                )
-
-        return errors
-
-    @classmethod
-    def find_duplicates_dimensions(cls, model: Model) -> List[str]:
-        """Find duplicate names within dimensions in a Lightdash DBT 2.0 model."""
-        dimension_names: Dict[str, List[str]] = (
-            {}
-        )  # Track dimension names and their sources
-        errors: List[str] = []
-        model_name = model.name or "unknown_model"
-
-        # Check for dimensions defined at the column level
-        if model.columns:
-            for column in model.columns:
-                if not column.meta or not column.name:
-                    continue
-
-                column_name = column.name
-
-                # Process column-level dimensions (the column name itself becomes a dimension)
-                if column.meta.dimension:
-                    if column_name not in dimension_names:
-                        dimension_names[column_name] = []
-                    dimension_names[column_name].append(
-                        f"column '{column_name}' dimension"
-                    )
-
-                # Process column-level additional dimensions
-                if column.meta.additional_dimensions:
-                    for ad_dim_name in column.meta.additional_dimensions.keys():
-                        if ad_dim_name not in dimension_names:
-                            dimension_names[ad_dim_name] = []
-                        dimension_names[ad_dim_name].append(
-                            f"additional dimension in column '{column_name}'"
-                        )
-
-        # Check for duplicates within dimensions
-        for name, sources in dimension_names.items():
-            if len(sources) > 1:
-                errors.append(
-                    f"Duplicate dimension name '{name}' used {len(sources)} times "
-                    f"in model '{model_name}': {', '.join(sources)}"
-                )
-
-        return errors
-
-    @classmethod
-    def find_duplicates_metrics(cls, model: Model) -> List[str]:
-        """Find duplicate names within metrics in a Lightdash DBT 2.0 model."""
-        metric_names: Dict[str, List[str]] = {}  # Track metric names and their sources
-        errors: List[str] = []
-        model_name = model.name or "unknown_model"
-
-        # Process model-level metrics
-        if model.meta and model.meta.metrics:
-            for metric_name in model.meta.metrics.keys():
-                if metric_name not in metric_names:
-                    metric_names[metric_name] = []
-                metric_names[metric_name].append("model-level metric")
-
-        # Check for metrics defined at the column level
-        if model.columns:
-            for column in model.columns:
-                if not column.meta or not column.name:
-                    continue
-
-                column_name = column.name
-
-                # Process column-level metrics
-                if column.meta.metrics:
-                    for metric_name in column.meta.metrics.keys():
-                        if metric_name not in metric_names:
-                            metric_names[metric_name] = []
-                        metric_names[metric_name].append(
-                            f"metric in column '{column_name}'"
-                        )
-
-        # Check for duplicates within metrics
-        for name, sources in metric_names.items():
-            if len(sources) > 1:
-                errors.append(
-                    f"Duplicate metric name '{name}' used {len(sources)} times "
-                    f"in model '{model_name}': {', '.join(sources)}"
-                )
-
-        return errors
+    parser_classes = (LightdashV20,)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -190,21 +44,48 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Show detailed information about checked files",
     )
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_cache_arguments(parser, "the results of unchanged models")
+    add_history_arguments(parser)
+    add_parallel_arguments(parser)
+    add_project_arguments(parser)
     args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
 
-    if not args.filenames:
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
         print("No files provided to check.")
         return 0
 
+    limits = ResourceLimits.from_args(args)
+    report = ShardReport.from_args("check-duplicate-dimensions-and-metrics-v1", args)
+    recorder = RunRecorder.from_args(report.hook, args, report.all_file_paths)
+    model_cache = ModelResultCache.from_args(report.hook, args)
+    pool = ModelPool.from_args(args)
     error_flag = False
-    total_files = len(args.filenames)
     processed_files = 0
+    timings: Dict[str, float] = {}
 
-    for file_path in args.filenames:
+    for file_path in report:
         errors, _ = process_single_file(
-            file_path, LightdashV20, FindDuplicateDimensionsAndMetricsV1
+            file_path,
+            LightdashV20,
+            FindDuplicateDimensionsAndMetricsV1,
+            timings,
+            limits=limits,
+            recorder=recorder,
+            model_cache=model_cache,
+            pool=pool,
+            duplicate_keys=True,
         )
         processed_files += 1
+        report.add(file_path, errors)
 
         if errors:
             print(f"Errors found in '{file_path}':")
@@ -215,11 +96,21 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             print(f"✓ No duplicates found in '{file_path}'")
 
     if args.verbose:
+        total_files = len(report.file_paths)
         print(f"\nProcessed {processed_files}/{total_files} files.")
+        for checker_name, elapsed in timings.items():
+            print(f"Time spent in {checker_name}: {elapsed:.3f}s")
         if not error_flag:
             print("All files passed duplicate checks!")
 
-    return 1 if error_flag else 0
+    exit_code = 1 if error_flag else 0
+    if pool is not None:
+        pool.close()
+    report.write(exit_code)
+    if model_cache is not None:
+        model_cache.save()
+    recorder.write(exit_code)
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -13,116 +13,25 @@
 # limitations under the License.
 
 import argparse
-from typing import Dict, List, Optional, Sequence
-
-from lightdash_pre_commit.hooks.base import BaseChecker
+from typing import Optional, Sequence
+
+from lightdash_pre_commit.hooks.cache import add_cache_arguments
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.duplicates import DuplicateNamesChecker
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.parallel import ModelPool, add_parallel_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import ShardReport, add_shard_arguments
 from lightdash_pre_commit.hooks.utils import process_single_file
 from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
 
 
-class FindDuplicateDimensionsAndMetricsV2(BaseChecker):
+class FindDuplicateDimensionsAndMetricsV2(DuplicateNamesChecker):
     """Find duplicate names across metrics and dimensions for dbt 1.10 or later."""
 
-    @classmethod
-    def check(cls, data: LightdashV25) -> List[str]:  # type: ignore[override]
-        """Check the data and return a list of errors."""
-        if not isinstance(data, LightdashV25):
-            raise ValueError("Expected 'data' keyword argument of type LightdashV25")
-
-        all_errors: List[str] = []
-
-        # Check for duplicates within each model individually
-        if data.models:
-            for model in data.models:
-                model_name = model.name or "unknown_model"
-                model_errors = cls._check_single_model(model, model_name)
-                all_errors.extend(model_errors)
-
-        return all_errors
-
-    @classmethod
-    def _check_single_model(cls, model, model_name: str) -> List[str]:
-        """Check for duplicates within a single model."""
-        all_names: Dict[str, List[str]] = {}  # Track names and their sources
-        errors: List[str] = []
-
-        # Get model-level meta (handle different model types)
-        model_meta = None
-        if hasattr(model, "meta") and model.meta:
-            model_meta = model.meta
-        elif (
-            hasattr(model, "config")
-            and model.config
-            and hasattr(model.config, "meta")
-            and model.config.meta
-        ):
-            model_meta = model.config.meta
-
-        # Process model-level metrics
-        if model_meta and hasattr(model_meta, "metrics") and model_meta.metrics:
-            for metric_name in model_meta.metrics.keys():
-                if metric_name not in all_names:
-                    all_names[metric_name] = []
-                all_names[metric_name].append("model-level metric")
-
-        # Check for metrics and dimensions defined at the column level
-        if hasattr(model, "columns") and model.columns:
-            for column in model.columns:
-                if not hasattr(column, "name") or not column.name:
-                    continue
-
-                column_name = column.name
-
-                # Get column meta (handle different column types)
-                column_meta = None
-                if hasattr(column, "meta") and column.meta:
-                    column_meta = column.meta
-                elif (
-                    hasattr(column, "config")
-                    and column.config
-                    and hasattr(column.config, "meta")
-                    and column.config.meta
-                ):
-                    column_meta = column.config.meta
-
-                if not column_meta:
-                    continue
-
-                # Process column-level dimensions (the column name itself becomes a dimension)
-                if hasattr(column_meta, "dimension") and column_meta.dimension:
-                    if column_name not in all_names:
-                        all_names[column_name] = []
-                    all_names[column_name].append(f"column '{column_name}' dimension")
-
-                # Process column-level additional dimensions
-                if (
-                    hasattr(column_meta, "additional_dimensions")
-                    and column_meta.additional_dimensions
-                ):
-                    for ad_dim_name in column_meta.additional_dimensions.keys():
-                        if ad_dim_name not in all_names:
-                            all_names[ad_dim_name] = []
-                        all_names[ad_dim_name].append(
-                            f"additional dimension in column '{column_name}'"
-                        )
-
-                # Process column-level metrics
-                if hasattr(column_meta, "metrics") and column_meta.metrics:
-                    for metric_name in column_meta.metrics.keys():
-                        if metric_name not in all_names:
-                            all_names[metric_name] = []
-                        all_names[metric_name].append(
-                            f"metric in column '{column_name}'"
-                        )
-
-        # Check for duplicates within this model
-        for name, sources in all_names.items():
-            if len(sources) > 1:
-                errors.append(
-                    f"Duplicate name '{name}' used {len(sources)} times: {', '.join(sources)} in model '{model_name}'"
-                )
-
-        return errors
+    parser_classes = (LightdashV25,)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -131,22 +40,54 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         description="Check for duplicate dimensions and metrics in Lightdash DBT files"
     )
     parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_cache_arguments(parser, "the results of unchanged models")
+    add_history_arguments(parser)
+    add_parallel_arguments(parser)
+    add_project_arguments(parser)
     args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
 
-    if not args.filenames:
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
         print("No files provided.")
         return 0
 
+    limits = ResourceLimits.from_args(args)
+    report = ShardReport.from_args("check-duplicate-dimensions-and-metrics-v2", args)
+    recorder = RunRecorder.from_args(report.hook, args, report.all_file_paths)
+    model_cache = ModelResultCache.from_args(report.hook, args)
+    pool = ModelPool.from_args(args)
     exit_code = 0
-    for file_path in args.filenames:
+    for file_path in report:
         errors, success = process_single_file(
-            file_path, LightdashV25, FindDuplicateDimensionsAndMetricsV2
+            file_path,
+            LightdashV25,
+            FindDuplicateDimensionsAndMetricsV2,
+            limits=limits,
+            recorder=recorder,
+            model_cache=model_cache,
+            pool=pool,
+            duplicate_keys=True,
         )
         if not success:
             exit_code = 1
+        report.add(file_path, errors)
         for error in errors:
             print(error)
 
+    if pool is not None:
+        pool.close()
+    report.write(exit_code)
+    if model_cache is not None:
+        model_cache.save()
+    recorder.write(exit_code)
     return exit_code
 
 
@@ -0,0 +1,196 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments, load_cache, save_cache
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.metric_definitions import (
+    Location,
+    MetricDefinition,
+    MetricDefinitionIndex,
+    metric_fingerprint,
+)
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import add_shard_arguments
+from lightdash_pre_commit.hooks.traversal import MetricNode, ModelNode, get_raw_meta
+from lightdash_pre_commit.hooks.utils import read_project_files, update_file_index
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+CACHE_KIND = "metric_definitions"
+
+
+class MetricDefinitionCollector(BaseChecker):
+    """Collect the fingerprint of the definition of each metric."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.definitions: List[MetricDefinition] = []
+        self.raw_columns: Dict[str, Any] = {}
+
+    def start_document(self, data) -> None:
+        super().start_document(data)
+        self.definitions = []
+
+    def visit_model(self, node: ModelNode) -> None:
+        raw_columns = node.raw.get("columns") if isinstance(node.raw, dict) else None
+        self.raw_columns = {
+            column.get("name"): column
+            for column in raw_columns or []
+            if isinstance(column, dict)
+        }
+
+    def visit_metric(self, node: MetricNode) -> None:
+        metric = node.metric
+        column = node.column.name if node.column else None
+        # Column-level metrics aggregate their column unless they set `sql`
+        sql = metric.sql or f"${{TABLE}}.{column}"
+        # The generated parsers drop `filters`, so read them from the raw mapping
+        owner = self.raw_columns.get(column) if column else node.model.raw
+        raw_metric = (get_raw_meta(owner).get("metrics") or {}).get(node.name)
+        filters = raw_metric.get("filters") if isinstance(raw_metric, dict) else None
+        self.definitions.append(
+            MetricDefinition(
+                fingerprint=metric_fingerprint(
+                    getattr(metric.type, "value", str(metric.type)),
+                    sql,
+                    node.model.name,
+                    filters if isinstance(filters, list) else None,
+                    metric.percentile,
+                ),
+                model=node.model.name,
+                name=node.name,
+                column=column,
+            )
+        )
+
+
+def update_index(
+    index: MetricDefinitionIndex,
+    file_paths: Sequence[str],
+    limits: Optional[ResourceLimits] = None,
+    recorder: Optional[RunRecorder] = None,
+) -> Dict[str, List[str]]:
+    """Re-index the files that changed since they were indexed.
+
+    Files that could not be parsed are dropped from the index, so that their
+    errors are reported again by the next run.
+
+    Returns:
+        Errors of the files that could not be parsed
+    """
+
+    def _store(
+        file_path: str, signature: List[int], collector: MetricDefinitionCollector
+    ) -> None:
+        index.update_file(file_path, signature, collector.definitions)
+
+    return update_file_index(
+        index,
+        file_paths,
+        LightdashV25,
+        MetricDefinitionCollector,
+        _store,
+        limits=limits,
+        recorder=recorder,
+    )
+
+
+def format_cluster(file_path: str, cluster: List[Location]) -> str:
+    """Describe a cluster of metrics sharing a definition, with their locations."""
+    locations = [
+        f"'{definition.name}' in model '{definition.model}'"
+        + (f" ('{path}')" if path != file_path else "")
+        for path, definition in cluster
+    ]
+    return (
+        "Metrics with the same type, SQL and filters: "
+        f"{', '.join(locations[:-1])} and {locations[-1]}"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check for metrics defined more than once under different names"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Directory whose YAML files are indexed to find duplicates across "
+        "the project (repeatable)",
+    )
+    add_cache_arguments(parser, "the metric definitions")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    cache_path = (
+        os.path.join(args.cache_dir, f"{CACHE_KIND}.json") if args.cache_dir else None
+    )
+    index = MetricDefinitionIndex.from_dict(
+        load_cache(cache_path, CACHE_KIND) if cache_path else {}
+    )
+
+    report, project_paths, recorder = read_project_files(
+        "check-duplicate-metric-definitions", args, index.indexed_files()
+    )
+    file_errors = update_index(
+        index, project_paths, ResourceLimits.from_args(args), recorder
+    )
+
+    exit_code = 0
+    for file_path in report:
+        errors = list(file_errors.get(file_path, []))
+        errors.extend(
+            format_cluster(file_path, cluster)
+            for cluster in index.duplicates_in_file(file_path)
+        )
+        report.add(file_path, errors)
+        if errors:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    if cache_path:
+        with recorder.stage("save cache"):
+            save_cache(cache_path, CACHE_KIND, index.to_dict())
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,171 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from lightdash_pre_commit.hooks.cache import add_cache_arguments, load_cache, save_cache
+from lightdash_pre_commit.hooks.config import ConfigError, load_config
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import add_history_arguments
+from lightdash_pre_commit.hooks.join_graph import ExploreStats, JoinGraphIndex
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import add_shard_arguments
+from lightdash_pre_commit.hooks.utils import read_project_files
+from lightdash_pre_commit.hooks.validate_joins import CACHE_KIND, update_index
+
+# Stat of each budget and how an explore over it is reported
+BUDGETS = {
+    "max_fields": ("fields", "has {value} fields"),
+    "max_join_depth": ("join_depth", "joins {value} levels deep"),
+    "max_always_joins": ("always_joins", "has {value} joins with always: true"),
+    "max_time_fields": ("time_fields", "has {value} generated time interval fields"),
+}
+
+
+class ExploreBudget(BaseModel):
+    """Budgets of an explore, where None disables a budget."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_fields: Optional[int] = Field(default=1000, ge=0)
+    max_join_depth: Optional[int] = Field(default=3, ge=0)
+    max_always_joins: Optional[int] = Field(default=3, ge=0)
+    max_time_fields: Optional[int] = Field(default=300, ge=0)
+
+
+class ExploreBudgetsConfig(ExploreBudget):
+    """The `explore_budgets` section of the configuration file."""
+
+    # Budgets of specific explores, overriding the budgets above
+    explores: Dict[str, Dict[str, Optional[int]]] = {}
+
+    def budget_of(self, explore: str) -> ExploreBudget:
+        """Get the budgets of an explore."""
+        defaults = self.model_dump(exclude={"explores"})
+        return ExploreBudget.model_validate(
+            {**defaults, **self.explores.get(explore, {})}
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "ExploreBudgetsConfig":
+        """Validate the `explore_budgets` section of the configuration."""
+        try:
+            budgets = cls.model_validate(config.get("explore_budgets") or {})
+            for explore in budgets.explores:
+                budgets.budget_of(explore)
+        except ValidationError as e:
+            raise ConfigError(f"Invalid explore budgets: {e}") from e
+        return budgets
+
+
+def check_budget(name: str, stats: ExploreStats, budget: ExploreBudget) -> List[str]:
+    """Report the stats of an explore over its budgets."""
+    errors: List[str] = []
+    for key, (attribute, description) in BUDGETS.items():
+        limit = getattr(budget, key)
+        value = getattr(stats, attribute)
+        if limit is not None and value > limit:
+            errors.append(
+                f"Explore '{name}' {description.format(value=value)}, "
+                f"over its budget of {limit} ({key})"
+            )
+    return errors
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check the size and complexity of Lightdash explores against "
+        "budgets"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="Path to the configuration file (default: .lightdash-pre-commit.yaml)",
+    )
+    parser.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Directory whose YAML files are indexed to resolve join targets (repeatable)",
+    )
+    add_cache_arguments(parser, "the join graph")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    try:
+        budgets = ExploreBudgetsConfig.from_config(load_config(args.config))
+    except ConfigError as e:
+        print(e)
+        return 2
+
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    # The join graph is shared with validate-joins
+    cache_path = (
+        os.path.join(args.cache_dir, f"{CACHE_KIND}.json") if args.cache_dir else None
+    )
+    index = JoinGraphIndex.from_dict(
+        load_cache(cache_path, CACHE_KIND) if cache_path else {}
+    )
+
+    report, project_paths, recorder = read_project_files(
+        "check-explore-budgets", args, index.indexed_files()
+    )
+    file_errors = update_index(
+        index, project_paths, ResourceLimits.from_args(args), recorder
+    )
+
+    exit_code = 0
+    for file_path in report:
+        errors = list(file_errors.get(file_path, []))
+        with recorder.stage("measure"):
+            explores = index.stats(index.models_in_file(file_path))
+        for name, stats in explores.items():
+            errors.extend(check_budget(name, stats, budgets.budget_of(name)))
+        report.add(file_path, errors)
+        if errors:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    if cache_path:
+        with recorder.stage("save cache"):
+            save_cache(cache_path, CACHE_KIND, index.to_dict())
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
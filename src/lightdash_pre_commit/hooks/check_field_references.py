@@ -0,0 +1,189 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments, load_cache, save_cache
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.field_references import (
+    FieldReferenceIndex,
+    empty_model,
+    extract_references,
+)
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import add_shard_arguments
+from lightdash_pre_commit.hooks.time_intervals import generated_names
+from lightdash_pre_commit.hooks.traversal import (
+    DimensionNode,
+    MetricNode,
+    ModelNode,
+    get_raw_meta,
+)
+from lightdash_pre_commit.hooks.utils import read_project_files, update_file_index
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+CACHE_KIND = "field_references"
+
+
+class FieldReferenceCollector(BaseChecker):
+    """Collect the references, joins and default time dimensions of each model."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.models: Dict[str, Dict[str, Any]] = {}
+
+    def start_document(self, data) -> None:
+        super().start_document(data)
+        self.models = {}
+
+    def visit_model(self, node: ModelNode) -> None:
+        entry = self.models.setdefault(node.name, empty_model())
+        joins = node.meta.joins if node.meta and node.meta.joins else []
+        # The generated parsers drop `alias`, so read it from the raw mapping
+        raw_joins = get_raw_meta(node.raw).get("joins")
+        if not isinstance(raw_joins, list) or len(raw_joins) != len(joins):
+            raw_joins = [{}] * len(joins)
+        for join, raw_join in zip(joins, raw_joins, strict=True):
+            alias = raw_join.get("alias") if isinstance(raw_join, dict) else None
+            entry["joins"][str(alias or join.join)] = join.join
+        time_dimension = getattr(node.meta, "default_time_dimension", None)
+        if time_dimension is not None:
+            entry["time_dimensions"].append([None, time_dimension.field])
+
+    def visit_metric(self, node: MetricNode) -> None:
+        entry = self.models[node.model.name]
+        entry["fields"][node.name] = extract_references(node.metric.sql)
+        time_dimension = getattr(node.metric, "default_time_dimension", None)
+        if time_dimension is not None:
+            entry["time_dimensions"].append([node.name, time_dimension.field])
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        entry = self.models[node.model.name]
+        dimension = node.dimension
+        entry["fields"][node.name] = extract_references(getattr(dimension, "sql", None))
+        entry["dimensions"].append(node.name)
+        if getattr(dimension, "type", None) is None:
+            # The type of the column comes from the warehouse
+            entry["untyped"].append(node.name)
+        for _, name in generated_names(node.name, dimension):
+            entry["fields"][name] = [node.name]
+            entry["dimensions"].append(name)
+
+
+def update_index(
+    index: FieldReferenceIndex,
+    file_paths: Sequence[str],
+    limits: Optional[ResourceLimits] = None,
+    recorder: Optional[RunRecorder] = None,
+) -> Dict[str, List[str]]:
+    """Re-index the files that changed since they were indexed.
+
+    Files that could not be parsed are dropped from the index, so that their
+    errors are reported again by the next run.
+
+    Returns:
+        Errors of the files that could not be parsed
+    """
+
+    def _store(
+        file_path: str, signature: List[int], collector: FieldReferenceCollector
+    ) -> None:
+        index.update_file(file_path, signature, collector.models)
+
+    return update_file_index(
+        index,
+        file_paths,
+        LightdashV25,
+        FieldReferenceCollector,
+        _store,
+        limits=limits,
+        recorder=recorder,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check the ${...} field references and default time dimensions "
+        "of Lightdash metrics and dimensions"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Directory whose YAML files are indexed to resolve references to "
+        "joined models (repeatable)",
+    )
+    add_cache_arguments(parser, "the field reference graph")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    cache_path = (
+        os.path.join(args.cache_dir, f"{CACHE_KIND}.json") if args.cache_dir else None
+    )
+    index = FieldReferenceIndex.from_dict(
+        load_cache(cache_path, CACHE_KIND) if cache_path else {}
+    )
+
+    report, project_paths, recorder = read_project_files(
+        "check-field-references", args, index.indexed_files()
+    )
+    file_errors = update_index(
+        index, project_paths, ResourceLimits.from_args(args), recorder
+    )
+
+    exit_code = 0
+    for file_path in report:
+        errors = list(file_errors.get(file_path, []))
+        with recorder.stage("resolve"):
+            models = index.resolve(index.models_in_file(file_path))
+        for model_errors in models.values():
+            errors.extend(model_errors)
+        report.add(file_path, errors)
+        if errors:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    if cache_path:
+        with recorder.stage("save cache"):
+            save_cache(cache_path, CACHE_KIND, index.to_dict())
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
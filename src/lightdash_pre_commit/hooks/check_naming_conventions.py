@@ -0,0 +1,381 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import re
+from enum import Enum
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments
+from lightdash_pre_commit.hooks.config import ConfigError, load_config
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import ShardReport, add_shard_arguments
+from lightdash_pre_commit.hooks.traversal import DimensionNode, MetricNode
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25, Type
+
+DEFAULT_PATTERN = r"^[a-z][a-z0-9_]*$"
+
+METRIC_TYPES = frozenset(metric_type.value for metric_type in Type)
+
+# Names are split into words at anything but letters and digits
+_WORD_BOUNDARY_BEFORE = r"(?<![A-Za-z0-9])"
+_WORD_BOUNDARY_AFTER = r"(?![A-Za-z0-9])"
+
+
+class Casing(Enum):
+    snake_case = "snake_case"
+    lower_case = "lower_case"
+
+
+CASING_PATTERNS = {
+    Casing.snake_case: r"[a-z][a-z0-9]*(?:_[a-z0-9]+)*",
+    Casing.lower_case: r"[^A-Z]*",
+}
+
+
+class FieldNamingConfig(BaseModel):
+    """Naming rules of a kind of field."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    pattern: Optional[str] = DEFAULT_PATTERN
+    max_length: Optional[int] = None
+    casing: Optional[Casing] = None
+
+
+class MetricNamingConfig(FieldNamingConfig):
+    """Naming rules of metrics, with prefixes and suffixes by metric type."""
+
+    prefixes: Dict[str, List[str]] = {}
+    suffixes: Dict[str, List[str]] = {}
+
+
+class NamingConventionsConfig(BaseModel):
+    """The `naming_conventions` section of the configuration file."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    metrics: MetricNamingConfig = MetricNamingConfig()
+    dimensions: FieldNamingConfig = FieldNamingConfig()
+    additional_dimensions: FieldNamingConfig = FieldNamingConfig()
+    banned_words: List[str] = []
+    forbidden_patterns: List[str] = []
+
+
+def trie_pattern(words: Sequence[str]) -> str:
+    """Build a regular expression matching any of the words.
+
+    The alternation is factored as a trie (e.g., `t(?:mp|e(?:mp|st))`), so the
+    regular expression engine walks it like an automaton instead of trying every
+    word at each position.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, dict]) -> str:
+        optional = "" in node
+        branches = [
+            re.escape(char) + _build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return _build(trie)
+
+
+class _FieldMatcher:
+    """Rules of a kind of field, compiled into a single conformance expression."""
+
+    def __init__(
+        self,
+        config: FieldNamingConfig,
+        prefixes: Sequence[str] = (),
+        suffixes: Sequence[str] = (),
+    ) -> None:
+        self.pattern: Optional[Pattern[str]] = (
+            re.compile(config.pattern) if config.pattern else None
+        )
+        self.max_length = config.max_length
+        self.casing = config.casing
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+
+        lookaheads = []
+        if config.pattern:
+            lookaheads.append(f"(?={config.pattern})")
+        if self.prefixes:
+            lookaheads.append(f"(?={trie_pattern(self.prefixes)})")
+        if self.suffixes:
+            lookaheads.append(
+                "(?=.*(?:" + "|".join(map(re.escape, self.suffixes)) + r")\Z)"
+            )
+        if self.max_length is not None:
+            lookaheads.append(f"(?=.{{0,{self.max_length}}}\\Z)")
+        if self.casing is not None:
+            lookaheads.append(f"(?={CASING_PATTERNS[self.casing]}\\Z)")
+        self.conformance: Optional[Pattern[str]] = (
+            re.compile("".join(lookaheads), re.DOTALL) if lookaheads else None
+        )
+
+    def violations(self, name: str) -> List[str]:
+        """Explain why a name does not conform. Only called on the slow path."""
+        violations = []
+        if self.pattern is not None and not self.pattern.match(name):
+            violations.append(f"does not match the pattern '{self.pattern.pattern}'")
+        if self.prefixes and not name.startswith(self.prefixes):
+            violations.append(
+                "must start with one of: "
+                + ", ".join(f"'{prefix}'" for prefix in self.prefixes)
+            )
+        if self.suffixes and not name.endswith(self.suffixes):
+            violations.append(
+                "must end with one of: "
+                + ", ".join(f"'{suffix}'" for suffix in self.suffixes)
+            )
+        if self.max_length is not None and len(name) > self.max_length:
+            violations.append(f"is longer than {self.max_length} characters")
+        if self.casing is not None and not re.fullmatch(
+            CASING_PATTERNS[self.casing], name
+        ):
+            violations.append(f"is not {self.casing.value}")
+        return violations
+
+
+class NamingRuleSet:
+    """All the naming rules, compiled once.
+
+    Checking a name costs one match of the conformance expression of its kind
+    (pattern, prefixes, suffixes, length and casing combined as lookaheads) and
+    one search of a single expression combining all the banned words and
+    forbidden patterns, however many rules are configured. The rules are only
+    evaluated one by one to explain the violations of a non-conforming name.
+    """
+
+    def __init__(self, config: NamingConventionsConfig) -> None:
+        metrics = config.metrics
+        unknown_types = (set(metrics.prefixes) | set(metrics.suffixes)) - METRIC_TYPES
+        if unknown_types:
+            raise ConfigError(
+                f"Unknown metric types in naming conventions: {', '.join(sorted(unknown_types))}"
+            )
+        self._metrics_default = _FieldMatcher(metrics)
+        self._metrics_by_type = {
+            metric_type: _FieldMatcher(
+                metrics,
+                prefixes=metrics.prefixes.get(metric_type, ()),
+                suffixes=metrics.suffixes.get(metric_type, ()),
+            )
+            for metric_type in set(metrics.prefixes) | set(metrics.suffixes)
+        }
+        self._dimensions = _FieldMatcher(config.dimensions)
+        self._additional_dimensions = _FieldMatcher(config.additional_dimensions)
+
+        self._banned_words: Optional[Pattern[str]] = None
+        prohibited = []
+        if config.banned_words:
+            banned = (
+                _WORD_BOUNDARY_BEFORE
+                + "(?i:"
+                + trie_pattern([word.lower() for word in config.banned_words])
+                + ")"
+                + _WORD_BOUNDARY_AFTER
+            )
+            self._banned_words = re.compile(banned)
+            prohibited.append(banned)
+        self._forbidden_patterns = [
+            re.compile(pattern) for pattern in config.forbidden_patterns
+        ]
+        prohibited.extend(f"(?:{pattern})" for pattern in config.forbidden_patterns)
+        self._prohibited: Optional[Pattern[str]] = (
+            re.compile("|".join(prohibited)) if prohibited else None
+        )
+        self._cache: Dict[Tuple[str, str, Optional[str]], List[str]] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "NamingRuleSet":
+        """Compile the `naming_conventions` section of the configuration."""
+        try:
+            return cls(
+                NamingConventionsConfig.model_validate(
+                    config.get("naming_conventions") or {}
+                )
+            )
+        except ValidationError as e:
+            raise ConfigError(f"Invalid naming conventions: {e}") from e
+        except re.error as e:
+            raise ConfigError(f"Invalid pattern in naming conventions: {e}") from e
+
+    def check_name(
+        self, name: str, kind: str, metric_type: Optional[str] = None
+    ) -> List[str]:
+        """Check a name against the rules of its kind.
+
+        Args:
+            name: Name of the field
+            kind: One of `metrics`, `dimensions` and `additional_dimensions`
+            metric_type: Type of the metric, if the field is a metric
+
+        Returns:
+            Descriptions of the violated rules
+        """
+        key = (name, kind, metric_type)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        if kind == "metrics":
+            matcher = self._metrics_by_type.get(
+                metric_type or "", self._metrics_default
+            )
+        elif kind == "dimensions":
+            matcher = self._dimensions
+        else:
+            matcher = self._additional_dimensions
+
+        violations: List[str] = []
+        if matcher.conformance is not None and not matcher.conformance.match(name):
+            violations.extend(matcher.violations(name))
+        if self._prohibited is not None and self._prohibited.search(name):
+            violations.extend(self._prohibitions(name))
+        self._cache[key] = violations
+        return violations
+
+    def _prohibitions(self, name: str) -> List[str]:
+        violations = []
+        if self._banned_words is not None:
+            for match in self._banned_words.finditer(name):
+                violations.append(f"contains the banned word '{match.group(0)}'")
+        for pattern in self._forbidden_patterns:
+            if pattern.search(name):
+                violations.append(f"matches the forbidden pattern '{pattern.pattern}'")
+        return violations
+
+
+class NamingConventionsChecker(BaseChecker):
+    """Check the names of metrics and dimensions against the naming conventions."""
+
+    model_scoped = True
+
+    def __init__(self, rule_set: Optional[NamingRuleSet] = None) -> None:
+        super().__init__()
+        self.rule_set = rule_set or NamingRuleSet(NamingConventionsConfig())
+
+    def visit_metric(self, node: MetricNode) -> None:
+        for violation in self.rule_set.check_name(
+            node.name, "metrics", node.metric.type.value
+        ):
+            self.errors.append(
+                f"Metric '{node.name}' in model '{node.model.name}' {violation}"
+            )
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        if node.additional:
+            kind, label = "additional_dimensions", "Additional dimension"
+        else:
+            kind, label = "dimensions", "Dimension"
+        for violation in self.rule_set.check_name(node.name, kind):
+            self.errors.append(
+                f"{label} '{node.name}' in model '{node.model.name}' {violation}"
+            )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check the naming conventions of Lightdash metrics and dimensions"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="Path to the configuration file (default: .lightdash-pre-commit.yaml)",
+    )
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_cache_arguments(parser, "the results of unchanged models")
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    try:
+        naming_config = load_config(args.config).get("naming_conventions") or {}
+        rule_set = NamingRuleSet.from_config({"naming_conventions": naming_config})
+    except ConfigError as e:
+        print(e)
+        return 2
+
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    checker = NamingConventionsChecker(rule_set)
+    limits = ResourceLimits.from_args(args)
+    report = ShardReport.from_args("check-naming-conventions", args)
+    recorder = RunRecorder.from_args(report.hook, args, report.all_file_paths)
+    # The results of a model depend on the naming conventions
+    model_cache = ModelResultCache.from_args(
+        report.hook, args, json.dumps(naming_config, sort_keys=True, default=str)
+    )
+    exit_code = 0
+    for file_path in report:
+        errors, success = process_single_file(
+            file_path,
+            LightdashV25,
+            checker,
+            limits=limits,
+            recorder=recorder,
+            model_cache=model_cache,
+        )
+        report.add(file_path, errors)
+        if not success:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    report.write(exit_code)
+    if model_cache is not None:
+        model_cache.save()
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
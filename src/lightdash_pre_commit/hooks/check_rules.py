@@ -0,0 +1,515 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import functools
+import json
+import re
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments
+from lightdash_pre_commit.hooks.config import ConfigError, load_config
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import ShardReport, add_shard_arguments
+from lightdash_pre_commit.hooks.traversal import (
+    ColumnNode,
+    DimensionNode,
+    MetricNode,
+    ModelNode,
+    get_raw_meta,
+)
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+# Value of a path that is not in the YAML
+MISSING = object()
+
+
+class RuleTarget(Enum):
+    models = "models"
+    columns = "columns"
+    metrics = "metrics"
+    dimensions = "dimensions"
+
+
+class ConditionConfig(BaseModel):
+    """Operators a value is tested with. All the operators given must hold."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    present: Optional[bool] = None
+    equals: Any = None
+    not_equals: Any = None
+    one_of: Optional[List[Any]] = None
+    none_of: Optional[List[Any]] = None
+    matches: Optional[str] = None
+    max_length: Optional[int] = None
+
+
+class RuleConfig(BaseModel):
+    """A rule of the `rules` section of the configuration file."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    id: str
+    target: RuleTarget
+    where: Dict[str, Any] = {}
+    require: Dict[str, Any]
+    message: Optional[str] = None
+
+
+class RulesConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    rules: List[RuleConfig] = []
+
+
+def _is_present(value: Any) -> bool:
+    return value is not MISSING and value is not None and value != ""
+
+
+class Condition:
+    """A test of the value at a path of a node, compiled from its configuration.
+
+    A scalar configuration is shorthand for `equals`, and a list for `one_of`.
+    """
+
+    def __init__(self, path: str, config: Any) -> None:
+        self.path = tuple(path.split("."))
+        if not all(self.path):
+            raise ValueError(f"invalid path '{path}'")
+        if isinstance(config, dict):
+            condition = ConditionConfig.model_validate(config)
+            operators = condition.model_fields_set
+        elif isinstance(config, list):
+            condition, operators = ConditionConfig(one_of=config), {"one_of"}
+        else:
+            condition, operators = ConditionConfig(equals=config), {"equals"}
+        if not operators:
+            raise ValueError(f"no operator given for '{path}'")
+
+        self.tests: List[Tuple[Callable[[Any], bool], str]] = []
+        # The value the path must be equal to, used to index the rule
+        self.equals: Any = MISSING
+        if "present" in operators:
+            present = condition.present
+            self.tests.append(
+                (
+                    lambda value: _is_present(value) == present,
+                    "must be set" if present else "must not be set",
+                )
+            )
+        if "equals" in operators:
+            expected = condition.equals
+            self.equals = expected
+            self.tests.append(
+                (lambda value: value == expected, f"must be {json.dumps(expected)}")
+            )
+        if "not_equals" in operators:
+            unexpected = condition.not_equals
+            self.tests.append(
+                (
+                    lambda value: value != unexpected,
+                    f"must not be {json.dumps(unexpected)}",
+                )
+            )
+        if condition.one_of is not None:
+            allowed = list(condition.one_of)
+            self.tests.append(
+                (
+                    lambda value: value is not MISSING and value in allowed,
+                    "must be one of " + ", ".join(map(json.dumps, allowed)),
+                )
+            )
+        if condition.none_of is not None:
+            forbidden = list(condition.none_of)
+            self.tests.append(
+                (
+                    lambda value: value is MISSING or value not in forbidden,
+                    "must not be one of " + ", ".join(map(json.dumps, forbidden)),
+                )
+            )
+        if condition.matches is not None:
+            pattern = re.compile(condition.matches)
+            self.tests.append(
+                (
+                    lambda value: isinstance(value, str)
+                    and pattern.fullmatch(value) is not None,
+                    f"must match the pattern '{pattern.pattern}'",
+                )
+            )
+        if condition.max_length is not None:
+            max_length = condition.max_length
+            self.tests.append(
+                (
+                    lambda value: not isinstance(value, (str, list, dict))
+                    or len(value) <= max_length,
+                    f"must not be longer than {max_length}",
+                )
+            )
+
+    def failures(self, value: Any) -> List[str]:
+        """Describe the tests the value fails."""
+        name = ".".join(self.path)
+        return [
+            f"{name} {description}"
+            for test, description in self.tests
+            if not test(value)
+        ]
+
+
+class Rule:
+    """A rule compiled into the conditions selecting its nodes and those they must meet."""
+
+    def __init__(self, index: int, config: RuleConfig) -> None:
+        self.index = index
+        self.id = config.id
+        self.target = config.target
+        self.message = config.message
+        self.where = [
+            self._condition(f"where.{path}", path, value)
+            for path, value in config.where.items()
+        ]
+        self.require = [
+            self._condition(f"require.{path}", path, value)
+            for path, value in config.require.items()
+        ]
+        if not self.require:
+            raise ConfigError(f"Rule '{self.id}' requires nothing")
+        # The first equality of `where`, if any, indexes the rule
+        self.key: Optional[Condition] = next(
+            (
+                condition
+                for condition in self.where
+                if condition.equals is not MISSING and _hashable(condition.equals)
+            ),
+            None,
+        )
+
+    def _condition(self, location: str, path: str, value: Any) -> Condition:
+        try:
+            return Condition(path, value)
+        except (ValueError, ValidationError, re.error) as e:
+            raise ConfigError(f"Invalid rule '{self.id}' at {location}: {e}") from e
+
+    def violations(self, resolve: Callable[[Tuple[str, ...]], Any]) -> List[str]:
+        """Check a node the rule applies to, describing the requirements it fails."""
+        for condition in self.where:
+            if condition.failures(resolve(condition.path)):
+                return []
+        failures: List[str] = []
+        for condition in self.require:
+            failures.extend(condition.failures(resolve(condition.path)))
+        return failures
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _TargetRules:
+    """The rules of a kind of node, indexed by the value of their first equality.
+
+    A node only evaluates the rules without an equality and those whose
+    equality holds, looked up with one resolution of each indexed path, so
+    hundreds of rules keyed on e.g. the metric type cost a few lookups per node.
+    """
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self.unindexed: List[Rule] = []
+        self.indexed: Dict[Tuple[str, ...], Dict[Any, List[Rule]]] = {}
+        for rule in rules:
+            if rule.key is None:
+                self.unindexed.append(rule)
+            else:
+                self.indexed.setdefault(rule.key.path, {}).setdefault(
+                    rule.key.equals, []
+                ).append(rule)
+
+    def candidates(self, resolve: Callable[[Tuple[str, ...]], Any]) -> List[Rule]:
+        """The rules that may apply to a node, in the order of the configuration."""
+        candidates = list(self.unindexed)
+        for path, rules_by_value in self.indexed.items():
+            value = resolve(path)
+            if _hashable(value):
+                candidates.extend(rules_by_value.get(value, ()))
+        if self.indexed:
+            candidates.sort(key=lambda rule: rule.index)
+        return candidates
+
+
+class RuleSet:
+    """All the rules of the configuration, compiled once."""
+
+    def __init__(self, config: RulesConfig) -> None:
+        ids = [rule.id for rule in config.rules]
+        duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+        if duplicates:
+            raise ConfigError(f"Duplicate rule ids: {', '.join(duplicates)}")
+        rules = [Rule(index, rule) for index, rule in enumerate(config.rules)]
+        self.targets: Dict[RuleTarget, _TargetRules] = {
+            target: _TargetRules([rule for rule in rules if rule.target is target])
+            for target in RuleTarget
+            if any(rule.target is target for rule in rules)
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "RuleSet":
+        """Compile the `rules` section of the configuration.
+
+        Compiled rule sets are reused for identical sections, e.g., by the
+        projects of a monorepo sharing their rules.
+        """
+        try:
+            key = json.dumps(config.get("rules") or [], sort_keys=True)
+        except (TypeError, ValueError) as e:
+            raise ConfigError(f"Invalid rules: {e}") from e
+        return _compile(key)
+
+    def violations(
+        self, target: RuleTarget, resolve: Callable[[Tuple[str, ...]], Any]
+    ) -> List[Tuple[Rule, List[str]]]:
+        """Check a node against the rules of its kind."""
+        target_rules = self.targets.get(target)
+        if target_rules is None:
+            return []
+        violations = []
+        for rule in target_rules.candidates(resolve):
+            failures = rule.violations(resolve)
+            if failures:
+                violations.append((rule, failures))
+        return violations
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(rules_json: str) -> RuleSet:
+    try:
+        return RuleSet(RulesConfig.model_validate({"rules": json.loads(rules_json)}))
+    except ValidationError as e:
+        raise ConfigError(f"Invalid rules: {e}") from e
+
+
+def _dump(node: Any) -> Dict[str, Any]:
+    """The mapping of a validated node, when its raw YAML is not available."""
+    if isinstance(node, BaseModel):
+        return node.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return {}
+
+
+def _resolver(
+    raw: Any, name: str, target: RuleTarget
+) -> Callable[[Tuple[str, ...]], Any]:
+    """Resolve the paths of a node, memoized for the rules of the node.
+
+    `name` is the name of the node, and `meta` the Lightdash meta of a model
+    or column in either dbt layout.
+    """
+    memo: Dict[Tuple[str, ...], Any] = {}
+
+    def resolve(path: Tuple[str, ...]) -> Any:
+        if path in memo:
+            return memo[path]
+        if path == ("name",):
+            value: Any = name
+        else:
+            value = raw
+            keys = path
+            if path[0] == "meta" and target in (RuleTarget.models, RuleTarget.columns):
+                value, keys = get_raw_meta(raw), path[1:]
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    value = MISSING
+                    break
+                value = value[key]
+        memo[path] = value
+        return value
+
+    return resolve
+
+
+class RulesChecker(BaseChecker):
+    """Check models, columns, metrics and dimensions against the configured rules.
+
+    The rules read the raw YAML of each node, so they can address any key,
+    including those Lightdash ignores.
+    """
+
+    model_scoped = True
+
+    def __init__(self, rule_set: Optional[RuleSet] = None) -> None:
+        super().__init__()
+        self.rule_set = rule_set or RuleSet(RulesConfig())
+        self.raw_columns: Dict[str, Any] = {}
+        self.raw_model: Dict[str, Any] = {}
+
+    def registered_callbacks(self) -> Dict[str, Callable[[Any], None]]:
+        """Only visit the kinds of nodes some rule applies to."""
+        callbacks = super().registered_callbacks()
+        targets = set(self.rule_set.targets)
+        wanted = {"visit_model"}
+        if RuleTarget.columns in targets:
+            wanted.add("visit_column")
+        if RuleTarget.metrics in targets:
+            wanted.add("visit_metric")
+        if RuleTarget.dimensions in targets:
+            wanted.add("visit_dimension")
+        return {
+            method: callback
+            for method, callback in callbacks.items()
+            if method in wanted
+        }
+
+    def _report(self, target: RuleTarget, raw: Any, name: str, label: str) -> None:
+        for rule, failures in self.rule_set.violations(
+            target, _resolver(raw, name, target)
+        ):
+            self.errors.append(
+                f"{label} breaks rule '{rule.id}': {rule.message or '; '.join(failures)}"
+            )
+
+    def visit_model(self, node: ModelNode) -> None:
+        self.raw_model = node.raw if isinstance(node.raw, dict) else _dump(node.model)
+        raw_columns = self.raw_model.get("columns")
+        self.raw_columns = {
+            column["name"]: column
+            for column in raw_columns or []
+            if isinstance(column, dict) and isinstance(column.get("name"), str)
+        }
+        self._report(
+            RuleTarget.models, self.raw_model, node.name, f"Model '{node.name}'"
+        )
+
+    def _raw_column(self, node: ColumnNode) -> Dict[str, Any]:
+        raw = self.raw_columns.get(node.name)
+        return raw if raw is not None else _dump(node.column)
+
+    def visit_column(self, node: ColumnNode) -> None:
+        self._report(
+            RuleTarget.columns,
+            self._raw_column(node),
+            node.name,
+            f"Column '{node.name}' in model '{node.model.name}'",
+        )
+
+    def visit_metric(self, node: MetricNode) -> None:
+        owner = self._raw_column(node.column) if node.column else self.raw_model
+        raw = (get_raw_meta(owner).get("metrics") or {}).get(node.name)
+        self._report(
+            RuleTarget.metrics,
+            raw if isinstance(raw, dict) else _dump(node.metric),
+            node.name,
+            f"Metric '{node.name}' in model '{node.model.name}'",
+        )
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        meta = get_raw_meta(self._raw_column(node.column))
+        if node.additional:
+            raw = (meta.get("additional_dimensions") or {}).get(node.name)
+            label = "Additional dimension"
+        else:
+            raw = meta.get("dimension")
+            label = "Dimension"
+        if not isinstance(raw, dict):
+            raw = _dump(node.dimension)
+        self._report(
+            RuleTarget.dimensions,
+            raw,
+            node.name,
+            f"{label} '{node.name}' in model '{node.model.name}'",
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check Lightdash models, columns, metrics and dimensions against "
+        "the rules of the configuration file"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="Path to the configuration file (default: .lightdash-pre-commit.yaml)",
+    )
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_cache_arguments(parser, "the results of unchanged models")
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    try:
+        rules_config = load_config(args.config).get("rules") or []
+        rule_set = RuleSet.from_config({"rules": rules_config})
+    except ConfigError as e:
+        print(e)
+        return 2
+
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    checker = RulesChecker(rule_set)
+    limits = ResourceLimits.from_args(args)
+    report = ShardReport.from_args("check-rules", args)
+    recorder = RunRecorder.from_args(report.hook, args, report.all_file_paths)
+    # The results of a model depend on the rules
+    model_cache = ModelResultCache.from_args(
+        report.hook, args, json.dumps(rules_config, sort_keys=True, default=str)
+    )
+    exit_code = 0
+    for file_path in report:
+        errors, success = process_single_file(
+            file_path,
+            LightdashV25,
+            checker,
+            limits=limits,
+            recorder=recorder,
+            model_cache=model_cache,
+        )
+        report.add(file_path, errors)
+        if not success:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    report.write(exit_code)
+    if model_cache is not None:
+        model_cache.save()
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
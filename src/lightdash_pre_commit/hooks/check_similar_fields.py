@@ -0,0 +1,212 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import add_history_arguments
+from lightdash_pre_commit.hooks.limits import (
+    MIB,
+    ResourceLimits,
+    add_limit_arguments,
+)
+from lightdash_pre_commit.hooks.minhash import SimilarityIndex
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import add_shard_arguments
+from lightdash_pre_commit.hooks.traversal import DimensionNode, MetricNode
+from lightdash_pre_commit.hooks.utils import process_single_file, read_project_files
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_MAX_MEMORY_MB = 256
+ATTRIBUTES = ("label", "description")
+
+
+@dataclass(frozen=True)
+class FieldText:
+    """The label or description of a metric or dimension."""
+
+    path: str
+    kind: str
+    model: str
+    name: str
+    text: str
+
+    def describe(self, file_path: str) -> str:
+        location = f" ('{self.path}')" if self.path != file_path else ""
+        return (
+            f"{self.kind} '{self.name}' in model '{self.model}' "
+            f"({self.text!r}){location}"
+        )
+
+
+class FieldTextCollector(BaseChecker):
+    """Collect the labels and descriptions of the metrics and dimensions."""
+
+    def __init__(self, file_path: str) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.texts: Dict[str, List[FieldText]] = {
+            attribute: [] for attribute in ATTRIBUTES
+        }
+
+    def _collect(self, kind: str, model: str, name: str, field) -> None:
+        for attribute in ATTRIBUTES:
+            text = getattr(field, attribute, None) if field is not None else None
+            if text:
+                self.texts[attribute].append(
+                    FieldText(self.file_path, kind, model, name, text)
+                )
+
+    def visit_metric(self, node: MetricNode) -> None:
+        self._collect("metric", node.model.name, node.name, node.metric)
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        kind = "additional dimension" if node.additional else "dimension"
+        self._collect(kind, node.model.name, node.name, node.dimension)
+
+
+def format_similar(
+    file_path: str, attribute: str, field: FieldText, others: List[FieldText]
+) -> str:
+    """Describe the fields whose text is similar to the text of a field."""
+    locations = [other.describe(file_path) for other in others]
+    if len(locations) > 1:
+        locations = [", ".join(locations[:-1]), locations[-1]]
+    return (
+        f"The {attribute} of {field.describe(file_path)} is similar to that of "
+        + " and ".join(locations)
+    )
+
+
+def _threshold(value: str) -> float:
+    threshold = float(value)
+    if not 0 < threshold <= 1:
+        raise argparse.ArgumentTypeError("must be greater than 0 and at most 1")
+    return threshold
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Check for metrics and dimensions with near-identical labels "
+        "or descriptions"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Directory whose YAML files are compared with the files passed "
+        "(repeatable)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=_threshold,
+        default=DEFAULT_THRESHOLD,
+        help="Minimum similarity of the words of two texts, between 0 and 1 "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--max-memory-mb",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        help="Approximate memory in MiB the similarity index may take "
+        f"(default: {DEFAULT_MAX_MEMORY_MB})",
+    )
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    report, project_paths, recorder = read_project_files("check-similar-fields", args)
+    limits = ResourceLimits.from_args(args)
+
+    indexes: Dict[str, SimilarityIndex[FieldText]] = {
+        attribute: SimilarityIndex(args.threshold, args.max_memory_mb * MIB)
+        for attribute in ATTRIBUTES
+    }
+    # Texts of each attribute, in the order of the files and their fields
+    texts: Dict[str, List[FieldText]] = {attribute: [] for attribute in ATTRIBUTES}
+    file_errors: Dict[str, List[str]] = {}
+    for file_path in project_paths:
+        collector = FieldTextCollector(file_path)
+        errors, success = process_single_file(
+            file_path, LightdashV25, collector, limits=limits, recorder=recorder
+        )
+        if not success:
+            file_errors[file_path] = errors
+            continue
+        for attribute, collected in collector.texts.items():
+            for field in collected:
+                indexes[attribute].add(field, field.text)
+            texts[attribute].extend(collected)
+
+    with recorder.stage("compare"):
+        for attribute, index in indexes.items():
+            similar = index.similar()
+            reported: Set[FieldText] = set()
+            for field in texts[attribute]:
+                # Fields of the same file are reported once, with the first one
+                others = [
+                    other
+                    for other in similar.get(field, [])
+                    if other.path != field.path or other not in reported
+                ]
+                reported.add(field)
+                if others:
+                    file_errors.setdefault(field.path, []).append(
+                        format_similar(field.path, attribute, field, others)
+                    )
+
+    exit_code = 0
+    for attribute, index in indexes.items():
+        if index.truncated:
+            # The texts left uncompared may hide similar fields
+            exit_code = 1
+            print(
+                f"Stopped comparing the {attribute}s at the memory cap of "
+                f"{args.max_memory_mb} MiB: raise --max-memory-mb to compare them all"
+            )
+    for file_path in report:
+        errors = file_errors.get(file_path, [])
+        report.add(file_path, errors)
+        if errors:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,50 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Any, Dict, Optional
+
+import yaml  # type: ignore[import-untyped]
+
+DEFAULT_CONFIG_FILE = ".lightdash-pre-commit.yaml"
+
+
+class ConfigError(Exception):
+    """Raised when the configuration file cannot be loaded."""
+
+
+def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """Load the hook configuration file.
+
+    Args:
+        config_path: Path to the configuration file. If not given,
+            `.lightdash-pre-commit.yaml` in the current directory is used if it exists.
+
+    Returns:
+        The configuration, or an empty one if no configuration file is found
+    """
+    if config_path is None:
+        if not os.path.exists(DEFAULT_CONFIG_FILE):
+            return {}
+        config_path = DEFAULT_CONFIG_FILE
+    try:
+        with open(config_path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file)
+    except (OSError, yaml.YAMLError) as e:
+        raise ConfigError(f"Failed to load config '{config_path}': {e}") from e
+    if config is None:
+        return {}
+    if not isinstance(config, dict):
+        raise ConfigError(f"Config '{config_path}' must be a mapping")
+    return config
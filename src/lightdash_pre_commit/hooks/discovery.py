@@ -0,0 +1,318 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import itertools
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+DBT_PROJECT_FILE = "dbt_project.yml"
+# Model paths of a dbt project that does not configure them
+DEFAULT_MODEL_PATHS = ("models",)
+YAML_EXTENSIONS = (".yml", ".yaml")
+MARKDOWN_EXTENSIONS = (".md",)
+
+
+class DiscoveryError(Exception):
+    """Raised when the files of a dbt project cannot be discovered."""
+
+
+@dataclass(frozen=True)
+class DbtProject:
+    """A dbt project and the directories of its models and doc blocks."""
+
+    root: str
+    model_paths: Tuple[str, ...]
+    docs_paths: Tuple[str, ...] = ()
+
+
+def load_project(project_dir: str) -> DbtProject:
+    """Read the model and docs paths of a dbt project from its `dbt_project.yml`.
+
+    Raises:
+        DiscoveryError: If the project file cannot be read
+    """
+    project_file = os.path.join(project_dir, DBT_PROJECT_FILE)
+    try:
+        with open(project_file, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise DiscoveryError(f"Failed to read '{project_file}': {e}") from e
+    if not isinstance(config, dict):
+        raise DiscoveryError(f"Invalid dbt project file '{project_file}'")
+
+    # `source-paths` is the name of `model-paths` before dbt 1.0
+    model_paths = config.get("model-paths", config.get("source-paths"))
+    if model_paths is None:
+        model_paths = list(DEFAULT_MODEL_PATHS)
+    if not isinstance(model_paths, list) or not all(
+        isinstance(path, str) for path in model_paths
+    ):
+        raise DiscoveryError(
+            f"Invalid 'model-paths' in '{project_file}': expected a list of paths"
+        )
+
+    # dbt reads doc blocks from all the resource paths by default, of which
+    # only the model paths are checked here
+    docs_paths = config.get("docs-paths", model_paths)
+    if not isinstance(docs_paths, list) or not all(
+        isinstance(path, str) for path in docs_paths
+    ):
+        raise DiscoveryError(
+            f"Invalid 'docs-paths' in '{project_file}': expected a list of paths"
+        )
+    return DbtProject(
+        os.path.normpath(project_dir),
+        tuple(os.path.normpath(path) for path in model_paths),
+        tuple(os.path.normpath(path) for path in docs_paths),
+    )
+
+
+def parse_project_dir(value: str) -> DbtProject:
+    """Parse a `--project-dir` value into its dbt project."""
+    try:
+        return load_project(value)
+    except DiscoveryError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def add_discovery_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the `--project-dir` option to a hook."""
+    parser.add_argument(
+        "--project-dir",
+        type=parse_project_dir,
+        default=None,
+        help=f"Also check the YAML files under the model paths of the "
+        f"{DBT_PROJECT_FILE} in this directory, skipping those ignored by git",
+    )
+
+
+def _translate(pattern: str) -> str:
+    """Translate the glob of a gitignore pattern into a regular expression."""
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                index = end
+        elif char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A pattern of a `.gitignore` file, matched relative to its directory."""
+
+    regex: Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+class IgnoreRules:
+    """The patterns of a `.gitignore` file.
+
+    Patterns follow git: the last matching pattern wins, `!` re-includes a
+    path, a trailing `/` only matches directories, and a pattern containing a
+    `/` other than a trailing one is anchored to the directory of the file.
+    """
+
+    def __init__(self, base_dir: str, lines: Iterable[str]) -> None:
+        self.prefix = os.path.join(os.path.abspath(base_dir), "")
+        self.rules: List[IgnoreRule] = []
+        for line in lines:
+            line = line.rstrip("\n")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            elif line.startswith("\\#") or line.startswith("\\!"):
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            if "/" in line:
+                regex = "^" + _translate(line.lstrip("/")) + "$"
+            else:
+                regex = "^(?:.*/)?" + _translate(line) + "$"
+            self.rules.append(IgnoreRule(re.compile(regex), negated, directory_only))
+
+    @classmethod
+    def from_directory(cls, directory: str) -> Optional["IgnoreRules"]:
+        """Read the `.gitignore` file of a directory, if it has one."""
+        try:
+            with open(
+                os.path.join(directory, ".gitignore"), "r", encoding="utf-8"
+            ) as file:
+                rules = cls(directory, file)
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """Whether an absolute path is ignored, or None if no pattern matches it."""
+        if not path.startswith(self.prefix):
+            return None
+        relative = path[len(self.prefix) :].replace(os.sep, "/")
+        for rule in reversed(self.rules):
+            if rule.directory_only and not is_dir:
+                continue
+            if rule.regex.match(relative):
+                return not rule.negated
+        return None
+
+
+def is_ignored(path: str, is_dir: bool, rules: Iterable[IgnoreRules]) -> bool:
+    """Whether an absolute path is ignored by the rules, the deepest `.gitignore` last."""
+    ignored = False
+    for ignore_rules in rules:
+        matched = ignore_rules.match(path, is_dir)
+        if matched is not None:
+            ignored = matched
+    return ignored
+
+
+def _ancestor_rules(directory: str) -> List[IgnoreRules]:
+    """Read the `.gitignore` files from the root of the git repository down.
+
+    Outside of a git repository, there are none.
+    """
+    rules = []
+    current = os.path.abspath(directory)
+    while True:
+        ignore_rules = IgnoreRules.from_directory(current)
+        if ignore_rules is not None:
+            rules.append(ignore_rules)
+        if os.path.exists(os.path.join(current, ".git")):
+            return rules[::-1]
+        parent = os.path.dirname(current)
+        if parent == current:
+            return []
+        current = parent
+
+
+def walk_yaml_files(
+    directory: str,
+    rules: Optional[List[IgnoreRules]] = None,
+    extensions: Tuple[str, ...] = YAML_EXTENSIONS,
+) -> Iterator[str]:
+    """Yield the YAML files under a directory as they are found, in name order.
+
+    The entries of each directory are read with a single `os.scandir`, the
+    files yielded before descending into the subdirectories, and the
+    directories ignored by git are not entered. Symbolic links to directories
+    are not followed.
+
+    Args:
+        directory: Directory to walk
+        rules: The `.gitignore` rules above the directory, read from the root of
+            its git repository if not given
+        extensions: Extensions of the files to yield, e.g., MARKDOWN_EXTENSIONS
+            for doc blocks
+    """
+    if rules is None:
+        rules = _ancestor_rules(os.path.dirname(os.path.abspath(directory)))
+    stack = [(directory, rules)]
+    while stack:
+        current, current_rules = stack.pop()
+        ignore_rules = IgnoreRules.from_directory(current)
+        if ignore_rules is not None:
+            current_rules = current_rules + [ignore_rules]
+        try:
+            with os.scandir(current) as scan:
+                entries = sorted(scan, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        absolute = os.path.abspath(current)
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            path = os.path.join(absolute, entry.name)
+            if is_dir:
+                if entry.name != ".git" and not is_ignored(path, True, current_rules):
+                    subdirectories.append(entry.path)
+            elif entry.name.endswith(extensions) and not is_ignored(
+                path, False, current_rules
+            ):
+                yield entry.path
+        stack.extend((path, current_rules) for path in reversed(subdirectories))
+
+
+def discover_files(project: DbtProject) -> Iterator[str]:
+    """Yield the YAML files under the model paths of a dbt project as they are found.
+
+    Files under several overlapping model paths are only yielded once.
+    """
+    seen: Set[str] = set()
+    for model_path in project.model_paths:
+        directory = os.path.join(project.root, model_path)
+        if not os.path.isdir(directory):
+            continue
+        for file_path in walk_yaml_files(directory):
+            file_path = os.path.normpath(file_path)
+            if file_path not in seen:
+                seen.add(file_path)
+                yield file_path
+
+
+def iter_file_paths(args: argparse.Namespace) -> Iterator[str]:
+    """Yield the files passed to a hook, followed by those of `--project-dir`.
+
+    Paths are normalized, so that a file both passed and discovered under the
+    project, or passed twice, is only yielded once.
+    """
+    file_paths: Iterable[str] = args.filenames
+    if args.project_dir is not None:
+        file_paths = itertools.chain(file_paths, discover_files(args.project_dir))
+    seen: Set[str] = set()
+    for file_path in file_paths:
+        file_path = os.path.normpath(file_path)
+        if file_path not in seen:
+            seen.add(file_path)
+            yield file_path
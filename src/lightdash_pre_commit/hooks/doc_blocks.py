@@ -0,0 +1,190 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from lightdash_pre_commit.hooks.cache import file_signature
+
+# `{% docs name %}...{% enddocs %}`, with optional whitespace control
+DOC_BLOCK_PATTERN = re.compile(
+    r"\{%-?\s*docs\s+([A-Za-z_][A-Za-z0-9_]*)\s*-?%\}(.*?)\{%-?\s*enddocs\s*-?%\}",
+    re.DOTALL,
+)
+
+# `{{ doc('name') }}` or `{{ doc('package', 'name') }}`
+DOC_REFERENCE_PATTERN = re.compile(
+    r"""\{\{-?\s*doc\(\s*(?:(["'])[^"']*\1\s*,\s*)?(["'])([^"']+)\2\s*\)\s*-?\}\}"""
+)
+
+
+@dataclass(frozen=True)
+class DocBlock:
+    """A doc block of a Markdown file, spanning lines `start` to `end`."""
+
+    name: str
+    path: str
+    start: int
+    end: int
+    text: str
+
+    def location(self) -> str:
+        return f"'{self.path}' line {self.start}"
+
+
+def parse_doc_blocks(file_path: str, content: str) -> List[DocBlock]:
+    """Find the doc blocks of the content of a Markdown file."""
+    blocks: List[DocBlock] = []
+    line = 1
+    position = 0
+    for match in DOC_BLOCK_PATTERN.finditer(content):
+        # Lines are counted incrementally from the previous block
+        line += content.count("\n", position, match.start())
+        end = line + content.count("\n", match.start(), match.end())
+        blocks.append(
+            DocBlock(match.group(1), file_path, line, end, match.group(2).strip())
+        )
+        line, position = end, match.end()
+    return blocks
+
+
+class DocBlockIndex:
+    """Project-wide index of the doc blocks of the Markdown files.
+
+    Each file is only read again when its signature changes, so resolving the
+    `{{ doc(...) }}` references of a description is a lookup by name instead of
+    a scan of all the Markdown files of the project.
+    """
+
+    def __init__(self) -> None:
+        # path -> {"signature": [mtime_ns, size], "blocks": [[name, start, end, text]]}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # name -> {path: block}
+        self._blocks: Dict[str, Dict[str, DocBlock]] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocBlockIndex":
+        """Restore an index persisted with `to_dict`."""
+        index = cls()
+        for file_path, entry in (data.get("files") or {}).items():
+            index.update_file(
+                file_path,
+                entry["signature"],
+                [
+                    DocBlock(block[0], file_path, *block[1:])
+                    for block in entry["blocks"]
+                ],
+            )
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index into JSON-compatible data."""
+        return {"files": self._files}
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def indexed_files(self) -> List[str]:
+        return list(self._files)
+
+    def names(self) -> List[str]:
+        return list(self._blocks)
+
+    def is_fresh(self, file_path: str, signature: Optional[List[int]]) -> bool:
+        """Check if a file is indexed with the same signature."""
+        entry = self._files.get(file_path)
+        return entry is not None and entry["signature"] == signature
+
+    def update_file(
+        self, file_path: str, signature: Optional[List[int]], blocks: List[DocBlock]
+    ) -> None:
+        """Replace the doc blocks defined in a file."""
+        self.remove_file(file_path)
+        self._files[file_path] = {
+            "signature": signature,
+            "blocks": [
+                [block.name, block.start, block.end, block.text] for block in blocks
+            ],
+        }
+        for block in blocks:
+            self._blocks.setdefault(block.name, {})[file_path] = block
+
+    def remove_file(self, file_path: str) -> None:
+        """Forget a deleted file."""
+        entry = self._files.pop(file_path, None)
+        if entry is None:
+            return
+        for block in entry["blocks"]:
+            definitions = self._blocks.get(block[0], {})
+            definitions.pop(file_path, None)
+            if not definitions:
+                self._blocks.pop(block[0], None)
+
+    def get(self, name: str) -> List[DocBlock]:
+        """Get the definitions of a doc block, more than one if it is ambiguous."""
+        return list(self._blocks.get(name, {}).values())
+
+    def resolve(self, description: str) -> Tuple[str, List[DocBlock], List[str]]:
+        """Replace the doc references of a description with their text.
+
+        Returns:
+            The resolved description, the doc blocks it refers to and the names
+            of the missing doc blocks, whose references are left as written
+        """
+        if "doc(" not in description:
+            return description, [], []
+        blocks: List[DocBlock] = []
+        missing: List[str] = []
+
+        def _replace(match: "re.Match[str]") -> str:
+            definitions = self._blocks.get(match.group(3))
+            if not definitions:
+                missing.append(match.group(3))
+                return match.group(0)
+            block = next(iter(definitions.values()))
+            blocks.append(block)
+            return block.text
+
+        return DOC_REFERENCE_PATTERN.sub(_replace, description), blocks, missing
+
+
+def read_doc_blocks(file_path: str) -> List[DocBlock]:
+    """Read the doc blocks of a Markdown file.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, "r", encoding="utf-8", errors="replace") as file:
+        return parse_doc_blocks(file_path, file.read())
+
+
+def update_index(index: DocBlockIndex, file_paths: Sequence[str]) -> None:
+    """Re-index the Markdown files that changed since they were indexed.
+
+    Files that no longer exist or cannot be read are dropped from the index.
+    """
+    for file_path in file_paths:
+        signature = file_signature(file_path)
+        if signature is None:
+            index.remove_file(file_path)
+            continue
+        if index.is_fresh(file_path, signature):
+            continue
+        try:
+            blocks = read_doc_blocks(file_path)
+        except OSError:
+            index.remove_file(file_path)
+            continue
+        index.update_file(file_path, signature, blocks)
@@ -0,0 +1,75 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.time_intervals import generated_names
+from lightdash_pre_commit.hooks.traversal import DimensionNode, MetricNode, ModelNode
+
+
+class DuplicateNamesChecker(BaseChecker):
+    """Find duplicate names across metrics and dimensions within each model."""
+
+    model_scoped = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sources: Dict[str, List[str]] = {}  # Track names and their sources
+        # Names of the dimensions Lightdash generates for time intervals
+        self._generated: Dict[str, List[str]] = {}
+        # Columns without a `dimension` block, only checked against the
+        # generated names
+        self._plain_columns: Dict[str, str] = {}
+
+    def visit_model(self, node: ModelNode) -> None:
+        self._sources = {}
+        self._generated = {}
+        self._plain_columns = {}
+
+    def visit_metric(self, node: MetricNode) -> None:
+        if node.column is None:
+            source = "model-level metric"
+        else:
+            source = f"metric in column '{node.column.name}'"
+        self._sources.setdefault(node.name, []).append(source)
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        if node.additional:
+            source = f"additional dimension in column '{node.column.name}'"
+        elif node.dimension is not None:
+            source = f"column '{node.name}' dimension"
+        else:
+            # Columns without a `dimension` block are not checked
+            self._plain_columns.setdefault(node.name, f"column '{node.name}'")
+            return
+        self._sources.setdefault(node.name, []).append(source)
+        for interval, name in generated_names(node.name, node.dimension):
+            self._generated.setdefault(name, []).append(
+                f"time interval {interval} of {source}"
+            )
+
+    def leave_model(self, node: ModelNode) -> None:
+        for name, sources in self._generated.items():
+            if name in self._sources:
+                self._sources[name].extend(sources)
+            elif len(sources) > 1 or name in self._plain_columns:
+                self._sources[name] = sources
+            if name in self._plain_columns:
+                self._sources[name].insert(0, self._plain_columns[name])
+        for name, sources in self._sources.items():
+            if len(sources) > 1:
+                self.errors.append(
+                    f"Duplicate name '{name}' used {len(sources)} times: {', '.join(sources)} in model '{node.name}'"
+                )
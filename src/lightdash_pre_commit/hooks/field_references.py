@@ -0,0 +1,409 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from lightdash_pre_commit.hooks.join_graph import REFERENCE_PATTERN
+from lightdash_pre_commit.hooks.name_index import NameIndex, did_you_mean
+from lightdash_pre_commit.hooks.time_intervals import TIME_INTERVAL_SUFFIXES
+
+# Lightdash placeholder for the table of the model defining the field
+TABLE_REFERENCE = "TABLE"
+
+# Prefixes of the references to user attributes and parameters, not fields
+NON_FIELD_PREFIXES = ("lightdash.", "ld.")
+
+# A field of the project, as (model, field)
+FieldKey = Tuple[str, str]
+
+
+def extract_references(sql: Optional[str]) -> List[str]:
+    """Extract the fields a SQL expression refers to with `${...}`.
+
+    `${TABLE}` and the references to user attributes and parameters are
+    skipped. References are returned as written, either `field` or
+    `table.field`, in the order of their first occurrence.
+    """
+    if not sql or "${" not in sql:
+        return []
+    references: Dict[str, None] = {}
+    for reference in REFERENCE_PATTERN.findall(sql):
+        if reference == TABLE_REFERENCE or reference.startswith(NON_FIELD_PREFIXES):
+            continue
+        references[reference] = None
+    return list(references)
+
+
+def empty_model() -> Dict[str, Any]:
+    """Create the entry of a model in the index."""
+    return {
+        # alias -> joined model
+        "joins": {},
+        # field -> references of its SQL
+        "fields": {},
+        # Names of the dimensions, including the generated time intervals
+        "dimensions": [],
+        # Dimensions whose type comes from the warehouse, which may generate
+        # any time interval
+        "untyped": [],
+        # [metric or None for the model, field] of each default time dimension
+        "time_dimensions": [],
+    }
+
+
+class FieldReferenceIndex:
+    """Project-wide graph of the references between the fields of the models.
+
+    The references of a field are resolved against its model and the models
+    its explore joins, by alias. The index is maintained incrementally:
+    updating a file only invalidates the models it defines and the models
+    whose explores can reach them through joins, and only the part of the
+    graph reachable from those models is walked to find reference cycles.
+    """
+
+    def __init__(self) -> None:
+        # path -> {"signature": [mtime_ns, size], "models": {model: entry}}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # model -> {path: entry}
+        self._definitions: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # join target -> models joining it
+        self._dependents: Dict[str, Set[str]] = {}
+        # model -> resolved errors
+        self._diagnostics: Dict[str, List[str]] = {}
+        # Merged entries of the models defined in several files, built on demand
+        self._merged: Dict[str, Dict[str, Any]] = {}
+        # Models re-resolved by the last call of `resolve`
+        self.resolved: Set[str] = set()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldReferenceIndex":
+        """Restore an index persisted with `to_dict`."""
+        index = cls()
+        for file_path, entry in (data.get("files") or {}).items():
+            index._add_file(file_path, entry["signature"], entry["models"])
+        index._diagnostics = dict(data.get("diagnostics") or {})
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index into JSON-compatible data."""
+        return {"files": self._files, "diagnostics": self._diagnostics}
+
+    def indexed_files(self) -> List[str]:
+        return list(self._files)
+
+    def is_fresh(self, file_path: str, signature: Optional[List[int]]) -> bool:
+        """Check if a file is indexed with the same signature."""
+        entry = self._files.get(file_path)
+        return entry is not None and entry["signature"] == signature
+
+    def models_in_file(self, file_path: str) -> List[str]:
+        entry = self._files.get(file_path)
+        return list(entry["models"]) if entry else []
+
+    def update_file(
+        self,
+        file_path: str,
+        signature: Optional[List[int]],
+        models: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Replace the models defined in a file.
+
+        Args:
+            models: Entry of each model of the file, as created by `empty_model`
+        """
+        previous = self._files.get(file_path)
+        if previous is not None and previous["models"] == models:
+            # The file was touched without changing its models
+            previous["signature"] = signature
+            return
+        changed = set(models)
+        if previous is not None:
+            changed.update(previous["models"])
+            self._remove_file(file_path)
+        self._add_file(file_path, signature, models)
+        self._invalidate(changed)
+
+    def remove_file(self, file_path: str) -> None:
+        """Forget a deleted file."""
+        if file_path not in self._files:
+            return
+        changed = set(self._files[file_path]["models"])
+        self._remove_file(file_path)
+        self._invalidate(changed)
+
+    def resolve(self, models: Iterable[str]) -> Dict[str, List[str]]:
+        """Get the errors of the given models, re-resolving only invalidated ones."""
+        models = list(models)
+        stale = [name for name in models if name not in self._diagnostics]
+        self.resolved = set(stale)
+        if stale:
+            links: Dict[str, Tuple[Dict[str, List[FieldKey]], List[str]]] = {}
+            cycles = self._find_cycles(stale, links)
+            for name in stale:
+                self._diagnostics[name] = (
+                    links[name][1]
+                    + self._check_time_dimensions(name)
+                    + cycles.get(name, [])
+                )
+        return {name: self._diagnostics[name] for name in models}
+
+    def _add_file(
+        self,
+        file_path: str,
+        signature: Optional[List[int]],
+        models: Dict[str, Dict[str, Any]],
+    ) -> None:
+        self._files[file_path] = {"signature": signature, "models": models}
+        for name, entry in models.items():
+            self._definitions.setdefault(name, {})[file_path] = entry
+            self._merged.pop(name, None)
+            for target in entry["joins"].values():
+                self._dependents.setdefault(target, set()).add(name)
+
+    def _remove_file(self, file_path: str) -> None:
+        entry = self._files.pop(file_path)
+        for name, model in entry["models"].items():
+            definitions = self._definitions.get(name, {})
+            definitions.pop(file_path, None)
+            if not definitions:
+                self._definitions.pop(name, None)
+            self._merged.pop(name, None)
+            remaining = set(self._model(name)["joins"].values())
+            for target in model["joins"].values():
+                if target in remaining:
+                    continue
+                dependents = self._dependents.get(target)
+                if dependents is not None:
+                    dependents.discard(name)
+                    if not dependents:
+                        del self._dependents[target]
+
+    def _invalidate(self, names: Set[str]) -> None:
+        """Drop the resolved errors of every model whose explore can reach the changed models."""
+        queue = deque(names)
+        seen = set(names)
+        while queue:
+            name = queue.popleft()
+            self._diagnostics.pop(name, None)
+            for dependent in self._dependents.get(name, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+
+    def _model(self, name: str) -> Dict[str, Any]:
+        """Get the entry of a model, merged across all the files defining it."""
+        merged = self._merged.get(name)
+        if merged is not None:
+            return merged
+        definitions = self._definitions.get(name) or {}
+        if len(definitions) == 1:
+            merged = next(iter(definitions.values()))
+        else:
+            merged = empty_model()
+            for path in sorted(definitions):
+                entry = definitions[path]
+                merged["joins"].update(entry["joins"])
+                merged["fields"].update(entry["fields"])
+                for key in ("dimensions", "untyped", "time_dimensions"):
+                    merged[key].extend(entry[key])
+        self._merged[name] = merged
+        return merged
+
+    def _find_field(self, model: str, field: str) -> Optional[str]:
+        """Find the field of a model a name refers to.
+
+        The time intervals of an untyped dimension are not indexed, so they
+        are resolved to the dimension itself.
+
+        Returns:
+            Name of the field in the graph, or None when the model has no such field
+        """
+        entry = self._model(model)
+        if field in entry["fields"]:
+            return field
+        for suffix in TIME_INTERVAL_SUFFIXES.values():
+            if field.endswith(suffix) and field[: -len(suffix)] in entry["untyped"]:
+                return field[: -len(suffix)]
+        return None
+
+    def _link(self, name: str) -> Tuple[Dict[str, List[FieldKey]], List[str]]:
+        """Resolve the references of the fields of a model.
+
+        Returns:
+            Tuple of (existing fields each field refers to, errors of the
+            references to unknown tables and fields)
+        """
+        entry = self._model(name)
+        joins = entry["joins"]
+        edges: Dict[str, List[FieldKey]] = {}
+        errors: List[str] = []
+        for field, references in entry["fields"].items():
+            targets: List[FieldKey] = []
+            for reference in references:
+                table, _, target_field = reference.partition(".")
+                if not target_field:
+                    target: Optional[str] = name
+                    target_field = table
+                elif table == name:
+                    target = name
+                else:
+                    target = joins.get(table)
+                if target is None:
+                    errors.append(
+                        f"Field '{field}' of model '{name}' references table "
+                        f"'{table}', which is neither the model nor one of its "
+                        "joins" + did_you_mean(NameIndex([name, *joins]).suggest(table))
+                    )
+                    continue
+                found = self._find_field(target, target_field)
+                if found is not None:
+                    targets.append((target, found))
+                elif target in self._definitions:
+                    # Unknown join targets are reported by validate-joins
+                    errors.append(
+                        f"Field '{field}' of model '{name}' references unknown "
+                        f"field '${{{reference}}}'"
+                        + did_you_mean(
+                            NameIndex(self._model(target)["fields"]).suggest(
+                                target_field
+                            )
+                        )
+                    )
+            edges[field] = targets
+        return edges, errors
+
+    def _check_time_dimensions(self, name: str) -> List[str]:
+        """Check the default time dimensions of a model and its metrics are dimensions."""
+        errors: List[str] = []
+        entry = self._model(name)
+        dimensions = set(entry["dimensions"])
+        for metric, field in entry["time_dimensions"]:
+            if field in dimensions:
+                continue
+            owner = f"metric '{metric}' in model" if metric else "model"
+            errors.append(
+                f"Default time dimension '{field}' of {owner} '{name}' is not a "
+                "dimension of the model"
+                + did_you_mean(NameIndex(dimensions).suggest(field))
+            )
+        return errors
+
+    def _find_cycles(
+        self,
+        models: List[str],
+        links: Dict[str, Tuple[Dict[str, List[FieldKey]], List[str]]],
+    ) -> Dict[str, List[str]]:
+        """Find the reference cycles through the fields of the given models.
+
+        The fields of the models reachable from the given models are sorted
+        topologically with Kahn's algorithm; the fields left over are pruned
+        of those only reachable from a cycle, and a shortest cycle is reported
+        for each remaining field of the given models not already part of a
+        reported cycle.
+
+        Args:
+            models: Models to report the cycles of
+            links: Resolved references of each model, filled as models are reached
+
+        Returns:
+            Errors of each model with a cycle
+        """
+        # Walk the part of the graph reachable from the given models
+        edges: Dict[FieldKey, List[FieldKey]] = {}
+        queue = deque(models)
+        reached = set(models)
+        while queue:
+            name = queue.popleft()
+            if name not in links:
+                links[name] = self._link(name)
+            for field, targets in links[name][0].items():
+                edges[(name, field)] = targets
+                for target, _ in targets:
+                    if target not in reached:
+                        reached.add(target)
+                        queue.append(target)
+
+        # Remove the fields no other field refers to, then the fields referring
+        # to no other field, until only the fields on or between cycles remain
+        in_degree: Dict[FieldKey, int] = dict.fromkeys(edges, 0)
+        for targets in edges.values():
+            for target in targets:
+                in_degree[target] += 1
+        ready = deque(node for node, degree in in_degree.items() if degree == 0)
+        while ready:
+            node = ready.popleft()
+            del in_degree[node]
+            for target in edges[node]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+        remaining = set(in_degree)
+        if not remaining:
+            return {}
+        referrers: Dict[FieldKey, List[FieldKey]] = {node: [] for node in remaining}
+        out_degree: Dict[FieldKey, int] = {}
+        for node in remaining:
+            targets = [target for target in edges[node] if target in remaining]
+            out_degree[node] = len(targets)
+            for target in targets:
+                referrers[target].append(node)
+        ready = deque(node for node, degree in out_degree.items() if degree == 0)
+        while ready:
+            node = ready.popleft()
+            remaining.discard(node)
+            for referrer in referrers[node]:
+                out_degree[referrer] -= 1
+                if out_degree[referrer] == 0:
+                    ready.append(referrer)
+
+        cycles: Dict[str, List[str]] = {}
+        for name in models:
+            covered: Set[FieldKey] = set()
+            for field in self._model(name)["fields"]:
+                node = (name, field)
+                if node not in remaining or node in covered:
+                    continue
+                cycle = self._find_cycle(node, edges, remaining)
+                if cycle is None:
+                    continue
+                covered.update(cycle)
+                path = " -> ".join(f"{model}.{member}" for model, member in cycle)
+                cycles.setdefault(name, []).append(
+                    f"Field '{field}' of model '{name}' is part of a reference "
+                    f"cycle: {path}"
+                )
+        return cycles
+
+    @staticmethod
+    def _find_cycle(
+        start: FieldKey,
+        edges: Dict[FieldKey, List[FieldKey]],
+        remaining: Set[FieldKey],
+    ) -> Optional[List[FieldKey]]:
+        """Find the shortest reference path leading from a field back to itself."""
+        parents: Dict[FieldKey, FieldKey] = {}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for target in edges[current]:
+                if target == start:
+                    path = [current]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    return list(reversed(path)) + [start]
+                if target not in parents and target in remaining:
+                    parents[target] = current
+                    queue.append(target)
+        return None
@@ -0,0 +1,341 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+HISTORY_FORMAT_VERSION = 1
+
+# Environment variable enabling the run history for every hook
+HISTORY_ENV = "LIGHTDASH_PRE_COMMIT_HISTORY"
+
+# Number of the slowest files whose time is recorded per run
+MAX_FILES_PER_RECORD = 50
+
+# Ratio of the times of a file over which it is reported as slowing down
+SLOWDOWN_THRESHOLD = 1.2
+
+PACKAGE_NAME = "lightdash-pre-commit-hooks"
+
+
+class HistoryError(Exception):
+    """Raised when a run history cannot be read."""
+
+
+def package_version() -> str:
+    """Get the installed version of the hooks."""
+    try:
+        return metadata.version(PACKAGE_NAME)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def peak_rss() -> Optional[int]:
+    """Get the peak resident set size of the process in bytes, if available."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def add_history_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the `--history-file` option to a hook."""
+    parser.add_argument(
+        "--history-file",
+        default=os.environ.get(HISTORY_ENV) or None,
+        help="Append a record of the run to this local history file, "
+        f"summarized by `lightdash-pre-commit stats` (default: ${HISTORY_ENV}, "
+        "disabled if unset)",
+    )
+
+
+class RunRecorder:
+    """Record the file count, cache hits, stage times and peak RSS of a run.
+
+    Without a history file, the run is measured but nothing is written. The
+    files are counted when the record is built, so `file_paths` may grow as
+    the files are discovered.
+    """
+
+    def __init__(
+        self, hook: str, file_paths: Sequence[str], path: Optional[str] = None
+    ) -> None:
+        self.hook = hook
+        self.path = path
+        self.file_paths = file_paths
+        self.cache_hits = 0
+        self.stages: Dict[str, float] = {}
+        self.file_times: Dict[str, float] = {}
+        self.started = time.perf_counter()
+
+    @classmethod
+    def from_args(
+        cls, hook: str, args: argparse.Namespace, file_paths: Sequence[str]
+    ) -> "RunRecorder":
+        return cls(hook, file_paths, args.history_file)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Accumulate the time spent in a block into a stage of the run."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def add_file(self, file_path: str, elapsed: float) -> None:
+        """Record the time spent on a file."""
+        file_path = os.path.normpath(file_path)
+        self.file_times[file_path] = self.file_times.get(file_path, 0.0) + elapsed
+
+    def record(self, exit_code: int) -> Dict[str, Any]:
+        """Build the record of the run."""
+        slowest = sorted(self.file_times.items(), key=lambda item: -item[1])
+        return {
+            "format_version": HISTORY_FORMAT_VERSION,
+            "hook": self.hook,
+            "version": package_version(),
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "files": len(self.file_paths),
+            "cache_hits": self.cache_hits,
+            "exit_code": exit_code,
+            "duration": round(time.perf_counter() - self.started, 4),
+            "stages": {
+                name: round(elapsed, 4) for name, elapsed in self.stages.items()
+            },
+            "peak_rss": peak_rss(),
+            "slowest_files": {
+                file_path: round(elapsed, 4)
+                for file_path, elapsed in slowest[:MAX_FILES_PER_RECORD]
+            },
+        }
+
+    def write(self, exit_code: int) -> None:
+        """Append the record of the run to the history file, if any.
+
+        The history is a convenience, so failing to write it never fails the hook.
+        """
+        if not self.path:
+            return
+        line = json.dumps(self.record(exit_code), separators=(",", ":"))
+        try:
+            history_dir = os.path.dirname(self.path)
+            if history_dir:
+                os.makedirs(history_dir, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+        except OSError as e:
+            print(
+                f"Failed to write the run history '{self.path}': {e}", file=sys.stderr
+            )
+
+
+def read_history(path: str) -> List[Dict[str, Any]]:
+    """Read the records of a run history, skipping lines that are not records.
+
+    Raises:
+        HistoryError: If the history cannot be read
+    """
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # e.g., a line cut short by an interrupted run
+                    continue
+                if (
+                    isinstance(record, dict)
+                    and record.get("format_version") == HISTORY_FORMAT_VERSION
+                ):
+                    records.append(record)
+    except OSError as e:
+        raise HistoryError(f"Failed to read the run history '{path}': {e}") from e
+    return records
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Compute a percentile by linear interpolation between the closest ranks."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _seconds(value: float) -> str:
+    if value < 1:
+        return f"{value * 1000:.1f}ms"
+    return f"{value:.2f}s" if value < 10 else f"{value:.1f}s"
+
+
+def _runs(count: int) -> str:
+    return f"{count} run{'s' if count != 1 else ''}"
+
+
+def _change(before: float, after: float) -> str:
+    if before <= 0:
+        return ""
+    return f" ({(after - before) / before:+.0%})"
+
+
+def _per_file(record: Dict[str, Any]) -> float:
+    return record["duration"] / max(record["files"] - record["cache_hits"], 1)
+
+
+def slowing_files(
+    records: Sequence[Dict[str, Any]], top: int
+) -> List[Tuple[str, float, float, int]]:
+    """Find the files whose time grew the most over the runs they appear in.
+
+    The median time of a file in the first half of its runs is compared with
+    its median time in the last half, and files whose time grew by less than
+    SLOWDOWN_THRESHOLD are left out.
+
+    Returns:
+        (file, median before, median after, runs) of at most `top` files,
+        most slowed down first
+    """
+    times: Dict[str, List[float]] = {}
+    for record in records:
+        for file_path, elapsed in record.get("slowest_files", {}).items():
+            times.setdefault(file_path, []).append(elapsed)
+    slowing = []
+    for file_path, elapsed in times.items():
+        if len(elapsed) < 2:
+            continue
+        half = len(elapsed) // 2
+        before = percentile(elapsed[:half], 50)
+        after = percentile(elapsed[-half:], 50)
+        if before > 0 and after >= before * SLOWDOWN_THRESHOLD:
+            slowing.append((file_path, before, after, len(elapsed)))
+    slowing.sort(key=lambda item: (-item[2] / item[1], item[0]))
+    return slowing[:top]
+
+
+def summarize_hook(hook: str, records: Sequence[Dict[str, Any]], top: int) -> List[str]:
+    """Summarize the runs of a hook, oldest first."""
+    durations = [record["duration"] for record in records]
+    lines = [
+        f"{hook}: {_runs(len(records))} from {records[0]['time']} to {records[-1]['time']}"
+    ]
+    lines.append(
+        "  duration: "
+        + ", ".join(f"p{q} {_seconds(percentile(durations, q))}" for q in (50, 90, 99))
+        + f", max {_seconds(max(durations))}"
+    )
+
+    files = [record["files"] for record in records]
+    total_files = sum(files)
+    cache_hits = sum(record["cache_hits"] for record in records)
+    line = f"  files per run: p50 {percentile(files, 50):g}, max {max(files)}"
+    if cache_hits:
+        line += f", cache hits {cache_hits / max(total_files, 1):.0%}"
+    lines.append(line)
+
+    peaks = [record["peak_rss"] for record in records if record.get("peak_rss")]
+    if peaks:
+        lines.append(
+            f"  peak RSS: p50 {percentile(peaks, 50) / 1024 / 1024:.1f} MiB, "
+            f"max {max(peaks) / 1024 / 1024:.1f} MiB"
+        )
+
+    stages: Dict[str, float] = {}
+    for record in records:
+        for name, elapsed in record.get("stages", {}).items():
+            stages[name] = stages.get(name, 0.0) + elapsed
+    total = sum(stages.values())
+    if total:
+        lines.append(
+            "  stages: "
+            + ", ".join(
+                f"{name} {_seconds(elapsed)} ({elapsed / total:.0%})"
+                for name, elapsed in stages.items()
+            )
+        )
+
+    if len(records) >= 2:
+        half = len(records) // 2
+        before = percentile([_per_file(record) for record in records[:half]], 50)
+        after = percentile([_per_file(record) for record in records[-half:]], 50)
+        lines.append(
+            f"  trend: p50 {_seconds(before)} per file in the first {_runs(half)}, "
+            f"{_seconds(after)} in the last {_runs(half)}{_change(before, after)}"
+        )
+
+    versions: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        versions.setdefault(record.get("version", "unknown"), []).append(record)
+    if len(versions) > 1:
+        lines.append("  by version:")
+        previous = None
+        for version, version_records in versions.items():
+            median = percentile([_per_file(record) for record in version_records], 50)
+            change = _change(previous, median) if previous is not None else ""
+            lines.append(
+                f"    {version}: {_runs(len(version_records))}, "
+                f"p50 {_seconds(median)} per file{change}"
+            )
+            previous = median
+
+    slowing = slowing_files(records, top)
+    if slowing:
+        lines.append("  files slowing down the most:")
+        for file_path, before, after, runs in slowing:
+            lines.append(
+                f"    {file_path}: {_seconds(before)} -> {_seconds(after)} "
+                f"({after / before:.1f}x over {_runs(runs)})"
+            )
+    return lines
+
+
+def summarize_history(
+    records: Sequence[Dict[str, Any]],
+    hook: Optional[str] = None,
+    last: Optional[int] = None,
+    top: int = 5,
+) -> str:
+    """Summarize the trends of a run history hook by hook.
+
+    Args:
+        records: Records of the history, oldest first
+        hook: Only summarize the runs of this hook
+        last: Only summarize the last runs of each hook
+        top: Number of files slowing down listed per hook
+    """
+    by_hook: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        if hook is None or record.get("hook") == hook:
+            by_hook.setdefault(record["hook"], []).append(record)
+    if not by_hook:
+        return "No runs recorded."
+
+    sections = []
+    for name in sorted(by_hook):
+        hook_records = by_hook[name][-last:] if last else by_hook[name]
+        sections.append("\n".join(summarize_hook(name, hook_records, top)))
+    return "\n\n".join(sections)
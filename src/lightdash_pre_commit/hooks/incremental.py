@@ -0,0 +1,108 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from lightdash_pre_commit.hooks.cache import (
+    CACHE_FORMAT_VERSION,
+    load_cache,
+    save_cache,
+)
+from lightdash_pre_commit.hooks.history import package_version
+
+CACHE_KIND = "model_results"
+
+# Number of models whose results are kept, the least recently used are dropped
+MAX_CACHED_MODELS = 100_000
+
+
+def model_fingerprint(raw_model: Dict[str, Any]) -> str:
+    """Fingerprint the raw YAML subtree of a model.
+
+    Keys are kept in their order, since it is the order the checkers report
+    the fields of a model in.
+    """
+    serialized = json.dumps(
+        raw_model, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ModelResultCache:
+    """Errors of the models checked in previous runs, by model fingerprint.
+
+    The results are only valid for the hook, the configuration and the version
+    of the package they were computed with, so they are dropped when any of
+    them changes. Without a cache file, results are only reused within a run.
+    """
+
+    def __init__(self, path: Optional[str] = None, context: str = "") -> None:
+        self.path = path
+        self.context = hashlib.blake2b(
+            f"{CACHE_FORMAT_VERSION}\0{package_version()}\0{context}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        self.hits = 0
+        self.misses = 0
+        self.results: Dict[str, List[str]] = {}
+        data = load_cache(path, CACHE_KIND) if path else {}
+        if data.get("context") == self.context:
+            self.results = dict(data.get("models") or {})
+
+    @classmethod
+    def from_args(
+        cls, hook: str, args: argparse.Namespace, context: str = ""
+    ) -> Optional["ModelResultCache"]:
+        """Create the cache of a hook, if `--cache-dir` is given."""
+        if not args.cache_dir:
+            return None
+        return cls(
+            os.path.join(args.cache_dir, f"{CACHE_KIND}-{hook}.json"),
+            f"{hook}\0{context}",
+        )
+
+    def get(self, fingerprint: str) -> Optional[List[str]]:
+        """Get the errors of a model, marking them as recently used."""
+        errors = self.results.pop(fingerprint, None)
+        if errors is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.results[fingerprint] = errors
+        return errors
+
+    def put(self, fingerprint: str, errors: List[str]) -> None:
+        self.results.pop(fingerprint, None)
+        self.results[fingerprint] = list(errors)
+
+    def save(self) -> None:
+        """Persist the most recently used results, if the cache has a file."""
+        if not self.path:
+            return
+        fingerprints = list(self.results)[-MAX_CACHED_MODELS:]
+        save_cache(
+            self.path,
+            CACHE_KIND,
+            {
+                "context": self.context,
+                "models": {
+                    fingerprint: self.results[fingerprint]
+                    for fingerprint in fingerprints
+                },
+            },
+        )
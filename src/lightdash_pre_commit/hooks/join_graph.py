@@ -0,0 +1,576 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from lightdash_pre_commit.hooks.name_index import NameIndex, did_you_mean
+
+# Matches Lightdash references such as `${orders.customer_id}`
+REFERENCE_PATTERN = re.compile(r"\$\{\s*([^}]*?)\s*\}")
+
+
+@dataclass(frozen=True)
+class ExploreStats:
+    """Size and complexity of an explore."""
+
+    # Dimensions and metrics of the base model and the joined models,
+    # including the dimensions generated for time intervals
+    fields: int
+    # Longest chain of joins, each joined on a table joined before it
+    join_depth: int
+    always_joins: int
+    # Dimensions generated for the time intervals of time dimensions
+    time_fields: int
+
+    def to_list(self) -> List[int]:
+        return [self.fields, self.join_depth, self.always_joins, self.time_fields]
+
+    @classmethod
+    def from_list(cls, values: List[int]) -> "ExploreStats":
+        fields, join_depth, always_joins, time_fields = values
+        return cls(fields, join_depth, always_joins, time_fields)
+
+
+@dataclass(frozen=True)
+class JoinEdge:
+    """A join of an explore."""
+
+    target: str
+    alias: str
+    always: bool
+    sql_on: str
+    # Fields of the target included in the explore, or None for all of them
+    fields: Optional[Tuple[str, ...]] = None
+
+    def to_list(self) -> List[Any]:
+        fields = list(self.fields) if self.fields is not None else None
+        return [self.target, self.alias, self.always, self.sql_on, fields]
+
+    @classmethod
+    def from_list(cls, values: List[Any]) -> "JoinEdge":
+        target, alias, always, sql_on, fields = values
+        return cls(
+            target=target,
+            alias=alias,
+            always=always,
+            sql_on=sql_on,
+            fields=tuple(fields) if fields is not None else None,
+        )
+
+
+class JoinGraphIndex:
+    """Project-wide index of model names and the join graph of their explores.
+
+    Every model is the base of an explore made of its joins. The index is
+    maintained incrementally: updating a file only invalidates the explores of
+    the models it defines and the explores that can reach them through joins,
+    so only those are re-resolved. The field IDs and the stats of an explore
+    only depend on the fields of its base model and of the models it joins
+    directly, so a change of fields only re-expands the explores including the
+    changed models.
+    """
+
+    def __init__(self) -> None:
+        # path -> {"signature": [mtime_ns, size], "models": {model: [edge, ...]},
+        #          "fields": {model: [field, ...]},
+        #          "time_fields": {model: {dimension: [field, ...]}}}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # model -> {path: joins}
+        self._definitions: Dict[str, Dict[str, List[JoinEdge]]] = {}
+        # model -> {path: names of its dimensions and metrics}
+        self._fields: Dict[str, Dict[str, List[str]]] = {}
+        # model -> {path: {dimension: names of its generated time intervals}}
+        self._time_fields: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+        # join target -> models joining it
+        self._dependents: Dict[str, Set[str]] = {}
+        # explore -> resolved errors
+        self._diagnostics: Dict[str, List[str]] = {}
+        # explore -> field ID collisions
+        self._collisions: Dict[str, List[str]] = {}
+        # explore -> stats
+        self._stats: Dict[str, ExploreStats] = {}
+        # Explores re-resolved by the last call of `resolve`
+        self.resolved: Set[str] = set()
+        # Explores whose field IDs were re-expanded by the last call of `resolve`
+        self.expanded: Set[str] = set()
+        # Explores whose stats were recomputed by the last call of `stats`
+        self.measured: Set[str] = set()
+        # Index of the model names for suggestions, built on demand
+        self._name_index: Optional[NameIndex] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JoinGraphIndex":
+        """Restore an index persisted with `to_dict`."""
+        index = cls()
+        for file_path, entry in (data.get("files") or {}).items():
+            models = {
+                name: [JoinEdge.from_list(edge) for edge in edges]
+                for name, edges in entry["models"].items()
+            }
+            index._add_file(
+                file_path,
+                entry["signature"],
+                models,
+                entry["fields"],
+                entry["time_fields"],
+            )
+        index._diagnostics = dict(data.get("diagnostics") or {})
+        index._collisions = dict(data.get("collisions") or {})
+        index._stats = {
+            name: ExploreStats.from_list(values)
+            for name, values in (data.get("stats") or {}).items()
+        }
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index into JSON-compatible data."""
+        return {
+            "files": self._files,
+            "diagnostics": self._diagnostics,
+            "collisions": self._collisions,
+            "stats": {name: stats.to_list() for name, stats in self._stats.items()},
+        }
+
+    def indexed_files(self) -> List[str]:
+        return list(self._files)
+
+    def is_fresh(self, file_path: str, signature: Optional[List[int]]) -> bool:
+        """Check if a file is indexed with the same signature."""
+        entry = self._files.get(file_path)
+        return entry is not None and entry["signature"] == signature
+
+    def models_in_file(self, file_path: str) -> List[str]:
+        entry = self._files.get(file_path)
+        return list(entry["models"]) if entry else []
+
+    def has_model(self, name: str) -> bool:
+        return name in self._definitions
+
+    def model_names(self) -> List[str]:
+        return list(self._definitions)
+
+    def joins_of(self, name: str) -> List[JoinEdge]:
+        """Get the joins of an explore across all the files defining its model."""
+        definitions = self._definitions.get(name) or {}
+        return [edge for path in sorted(definitions) for edge in definitions[path]]
+
+    def fields_of(self, name: str) -> List[str]:
+        """Get the dimensions and metrics of a model across all the files defining it."""
+        fields = self._fields.get(name) or {}
+        return [field for path in sorted(fields) for field in fields[path]]
+
+    def time_fields_of(self, name: str) -> Dict[str, List[str]]:
+        """Get the generated time intervals of each time dimension of a model."""
+        time_fields = self._time_fields.get(name) or {}
+        merged: Dict[str, List[str]] = {}
+        for path in sorted(time_fields):
+            for dimension, names in time_fields[path].items():
+                merged.setdefault(dimension, []).extend(names)
+        return merged
+
+    def update_file(
+        self,
+        file_path: str,
+        signature: Optional[List[int]],
+        models: Dict[str, List[JoinEdge]],
+        fields: Optional[Dict[str, List[str]]] = None,
+        time_fields: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    ) -> None:
+        """Replace the models defined in a file.
+
+        Args:
+            models: Joins of each model of the file
+            fields: Names of the dimensions and metrics of each model of the file
+            time_fields: Names of the generated time intervals of each time
+                dimension of each model of the file
+        """
+        serialized = {
+            name: [edge.to_list() for edge in edges] for name, edges in models.items()
+        }
+        fields = {name: list(names) for name, names in (fields or {}).items()}
+        time_fields = {
+            name: {dimension: list(names) for dimension, names in dimensions.items()}
+            for name, dimensions in (time_fields or {}).items()
+        }
+        previous = self._files.get(file_path)
+        if previous is None:
+            self._add_file(file_path, signature, models, fields, time_fields)
+            self._invalidate(set(models))
+            self._invalidate_fields(set(models))
+            return
+        if (
+            previous["models"] == serialized
+            and previous["fields"] == fields
+            and previous["time_fields"] == time_fields
+        ):
+            # The file was touched without changing its models
+            previous["signature"] = signature
+            return
+
+        changed = set(models) | set(previous["models"])
+        fields_changed = {
+            name
+            for name in changed | set(fields) | set(previous["fields"])
+            if fields.get(name) != previous["fields"].get(name)
+        } | {
+            name
+            for name in set(time_fields) | set(previous["time_fields"])
+            if time_fields.get(name) != previous["time_fields"].get(name)
+        }
+        joins_changed = previous["models"] != serialized
+        self._remove_file(file_path)
+        self._add_file(file_path, signature, models, fields, time_fields)
+        if joins_changed:
+            self._invalidate(changed)
+            self._invalidate_fields(changed)
+        else:
+            self._invalidate_fields(fields_changed)
+
+    def remove_file(self, file_path: str) -> None:
+        """Forget a deleted file."""
+        if file_path not in self._files:
+            return
+        changed = set(self._files[file_path]["models"])
+        self._remove_file(file_path)
+        self._invalidate(changed)
+        self._invalidate_fields(changed)
+
+    def resolve(self, explores: Iterable[str]) -> Dict[str, List[str]]:
+        """Get the errors of the given explores, re-resolving only invalidated ones."""
+        self.resolved = set()
+        self.expanded = set()
+        results: Dict[str, List[str]] = {}
+        cyclic: Optional[Set[str]] = None
+        for name in explores:
+            if name not in self._diagnostics:
+                if cyclic is None:
+                    cyclic = self._find_cyclic_models()
+                self._diagnostics[name] = self._resolve_explore(name, cyclic)
+                self.resolved.add(name)
+            if name not in self._collisions:
+                self._collisions[name] = self._expand_explore(name)
+                self.expanded.add(name)
+            results[name] = self._diagnostics[name] + self._collisions[name]
+        return results
+
+    def stats(self, explores: Iterable[str]) -> Dict[str, ExploreStats]:
+        """Get the stats of the given explores, recomputing only invalidated ones."""
+        self.measured = set()
+        results: Dict[str, ExploreStats] = {}
+        for name in explores:
+            if name not in self._stats:
+                self._stats[name] = self._measure_explore(name)
+                self.measured.add(name)
+            results[name] = self._stats[name]
+        return results
+
+    def _add_file(
+        self,
+        file_path: str,
+        signature: Optional[List[int]],
+        models: Dict[str, List[JoinEdge]],
+        fields: Dict[str, List[str]],
+        time_fields: Dict[str, Dict[str, List[str]]],
+    ) -> None:
+        self._files[file_path] = {
+            "signature": signature,
+            "models": {
+                name: [edge.to_list() for edge in edges]
+                for name, edges in models.items()
+            },
+            "fields": fields,
+            "time_fields": time_fields,
+        }
+        for name, names in fields.items():
+            self._fields.setdefault(name, {})[file_path] = list(names)
+        for name, dimensions in time_fields.items():
+            self._time_fields.setdefault(name, {})[file_path] = dimensions
+        for name, edges in models.items():
+            if name not in self._definitions:
+                self._name_index = None
+            self._definitions.setdefault(name, {})[file_path] = list(edges)
+            for edge in edges:
+                self._dependents.setdefault(edge.target, set()).add(name)
+
+    def _remove_file(self, file_path: str) -> None:
+        entry = self._files.pop(file_path)
+        for name in entry["fields"]:
+            fields = self._fields.get(name, {})
+            fields.pop(file_path, None)
+            if not fields:
+                self._fields.pop(name, None)
+        for name in entry["time_fields"]:
+            time_fields = self._time_fields.get(name, {})
+            time_fields.pop(file_path, None)
+            if not time_fields:
+                self._time_fields.pop(name, None)
+        for name in entry["models"]:
+            definitions = self._definitions.get(name, {})
+            edges = definitions.pop(file_path, [])
+            if not definitions:
+                self._definitions.pop(name, None)
+                self._name_index = None
+            remaining_targets = {edge.target for edge in self.joins_of(name)}
+            for edge in edges:
+                if edge.target in remaining_targets:
+                    continue
+                dependents = self._dependents.get(edge.target)
+                if dependents is not None:
+                    dependents.discard(name)
+                    if not dependents:
+                        del self._dependents[edge.target]
+
+    def _invalidate(self, names: Set[str]) -> None:
+        """Drop the resolved errors of every explore that can reach the changed models."""
+        queue = deque(names)
+        seen = set(names)
+        while queue:
+            name = queue.popleft()
+            self._diagnostics.pop(name, None)
+            for dependent in self._dependents.get(name, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+
+    def _invalidate_fields(self, names: Set[str]) -> None:
+        """Drop the field ID collisions and stats of the explores including the changed models."""
+        for name in names:
+            self._collisions.pop(name, None)
+            self._stats.pop(name, None)
+            for dependent in self._dependents.get(name, ()):
+                self._collisions.pop(dependent, None)
+                self._stats.pop(dependent, None)
+
+    def _tables_of(self, name: str) -> List[Tuple[str, List[str], List[str]]]:
+        """Get the tables of an explore with the fields it includes from each.
+
+        Returns:
+            Tuples of (table, fields, generated time intervals), the base
+            model first and then its joins
+        """
+        tables = []
+        for table, target, included in [(name, name, None)] + [
+            (edge.alias, edge.target, edge.fields) for edge in self.joins_of(name)
+        ]:
+            fields = self.fields_of(target)
+            time_fields = self.time_fields_of(target)
+            if included is not None:
+                # The time intervals of an included dimension are included
+                included_set = set(included)
+                fields = [field for field in fields if field in included_set]
+                time_fields = {
+                    dimension: names
+                    for dimension, names in time_fields.items()
+                    if dimension in included_set
+                }
+            tables.append(
+                (
+                    table,
+                    fields,
+                    [field for names in time_fields.values() for field in names],
+                )
+            )
+        return tables
+
+    def _measure_explore(self, name: str) -> ExploreStats:
+        joins = self.joins_of(name)
+        tables = self._tables_of(name)
+
+        # The depth of a join is one more than the deepest table its sql_on
+        # refers to, the base model being at depth 0
+        edges = {edge.alias: edge for edge in joins}
+        depths: Dict[str, int] = {name: 0}
+
+        def depth(alias: str, visiting: Set[str]) -> int:
+            if alias in depths:
+                return depths[alias]
+            visiting.add(alias)
+            deepest = 0
+            for reference in REFERENCE_PATTERN.findall(edges[alias].sql_on):
+                table = reference.partition(".")[0]
+                if table in edges and table not in visiting:
+                    deepest = max(deepest, depth(table, visiting))
+            visiting.discard(alias)
+            depths[alias] = deepest + 1
+            return depths[alias]
+
+        return ExploreStats(
+            fields=sum(len(fields) + len(generated) for _, fields, generated in tables),
+            join_depth=max((depth(alias, set()) for alias in edges), default=0),
+            always_joins=sum(1 for edge in joins if edge.always),
+            time_fields=sum(len(generated) for _, _, generated in tables),
+        )
+
+    def _expand_explore(self, name: str) -> List[str]:
+        """Find the fields of an explore deriving the same Lightdash field ID.
+
+        Lightdash derives the ID of a field from the table and the field names,
+        `<table>_<field>`, where the table of a joined model is its alias.
+        """
+        tables = [
+            (table, fields + generated)
+            for table, fields, generated in self._tables_of(name)
+        ]
+
+        owners: Dict[str, Tuple[str, str]] = {}
+        errors: List[str] = []
+        reported: Set[str] = set()
+        for table, fields in tables:
+            for field in fields:
+                field_id = f"{table}_{field}".replace(".", "__")
+                owner = owners.setdefault(field_id, (table, field))
+                # Duplicates within a table are reported by the duplicate hooks
+                if owner[0] == table or field_id in reported:
+                    continue
+                reported.add(field_id)
+                errors.append(
+                    f"Field ID '{field_id}' of explore '{name}' is derived from both "
+                    f"'{owner[0]}.{owner[1]}' and '{table}.{field}'"
+                )
+        return errors
+
+    def _resolve_explore(self, name: str, cyclic: Set[str]) -> List[str]:
+        errors: List[str] = []
+        joins = self.joins_of(name)
+
+        for alias, count in Counter(edge.alias for edge in joins).items():
+            if count > 1:
+                errors.append(
+                    f"Duplicate join alias '{alias}' used {count} times in explore '{name}'"
+                )
+            if alias == name:
+                errors.append(
+                    f"Join alias '{alias}' conflicts with the base model of explore '{name}'"
+                )
+
+        tables = {name} | {edge.alias for edge in joins}
+        for edge in joins:
+            if not self.has_model(edge.target):
+                errors.append(
+                    f"Join target '{edge.target}' of explore '{name}' does not exist"
+                    + did_you_mean(self._model_name_index().suggest(edge.target))
+                )
+            references = REFERENCE_PATTERN.findall(edge.sql_on)
+            if not references:
+                errors.append(
+                    f"Join '{edge.alias}' of explore '{name}' does not use the "
+                    f"${{table.field}} reference syntax in sql_on: '{edge.sql_on}'"
+                )
+            for reference in references:
+                table, _, field = reference.partition(".")
+                if field and table not in tables:
+                    errors.append(
+                        f"Join '{edge.alias}' of explore '{name}' references unknown "
+                        f"table '{table}' in sql_on"
+                        + did_you_mean(NameIndex(tables).suggest(table))
+                    )
+
+        cycle = self._find_cycle(name) if name in cyclic else None
+        if cycle:
+            errors.append(
+                f"Explore '{name}' is part of a join cycle: {' -> '.join(cycle)}"
+            )
+        return errors
+
+    def _model_name_index(self) -> NameIndex:
+        if self._name_index is None:
+            self._name_index = NameIndex(self._definitions)
+        return self._name_index
+
+    def _find_cyclic_models(self) -> Set[str]:
+        """Find the models belonging to a join cycle in linear time.
+
+        Uses an iterative version of Tarjan's strongly connected components
+        algorithm, ignoring self-joins.
+        """
+        counter = 0
+        indices: Dict[str, int] = {}
+        lowlinks: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        cyclic: Set[str] = set()
+
+        for root in self._definitions:
+            if root in indices:
+                continue
+            work = [(root, iter(self._targets_of(root)))]
+            indices[root] = lowlinks[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, targets = work[-1]
+                pushed = False
+                for target in targets:
+                    if target not in indices:
+                        indices[target] = lowlinks[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self._targets_of(target))))
+                        pushed = True
+                        break
+                    if target in on_stack:
+                        lowlinks[node] = min(lowlinks[node], indices[target])
+                if pushed:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                if lowlinks[node] == indices[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        cyclic.update(component)
+        return cyclic
+
+    def _targets_of(self, name: str) -> List[str]:
+        """Get the existing models joined by an explore, excluding self-joins."""
+        return [
+            edge.target
+            for edge in self.joins_of(name)
+            if edge.target != name and self.has_model(edge.target)
+        ]
+
+    def _find_cycle(self, name: str) -> Optional[List[str]]:
+        """Find the shortest join path leading from a model back to itself.
+
+        Self-joins are not considered cycles, as they are legitimate with an alias.
+        """
+        parents: Dict[str, str] = {}
+        queue = deque([name])
+        while queue:
+            current = queue.popleft()
+            for edge in self.joins_of(current):
+                target = edge.target
+                if target == current:
+                    continue
+                if target == name:
+                    path = [current]
+                    while path[-1] != name:
+                        path.append(parents[path[-1]])
+                    return list(reversed(path)) + [name]
+                if target not in parents and self.has_model(target):
+                    parents[target] = current
+                    queue.append(target)
+        return None
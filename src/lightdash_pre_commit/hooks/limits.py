@@ -0,0 +1,399 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import signal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+MIB = 1024 * 1024
+
+# Tag of the `<<` merge key, which may repeat to merge several mappings
+MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class ResourceLimitError(Exception):
+    """Raised when a file exceeds one of the resource limits."""
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits protecting the hooks against pathological files.
+
+    A limit of None disables it.
+    """
+
+    # Size of the file in bytes
+    max_file_size: Optional[int] = 20 * MIB
+    # Number of nodes the document holds once its aliases are expanded
+    max_nodes: Optional[int] = 5_000_000
+    # Number of nodes added by expanding aliases
+    max_alias_expansion: Optional[int] = 100_000
+    # Nesting depth of the document once its aliases are expanded
+    max_depth: Optional[int] = 200
+    # Wall time in seconds to load, validate and check a file
+    timeout: Optional[float] = 60.0
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "ResourceLimits":
+        return cls(
+            max_file_size=_positive_or_none(args.max_file_size),
+            max_nodes=_positive_or_none(args.max_nodes),
+            max_alias_expansion=(
+                args.max_alias_expansion if args.max_alias_expansion >= 0 else None
+            ),
+            max_depth=_positive_or_none(args.max_depth),
+            timeout=_positive_or_none(args.timeout),
+        )
+
+
+def _positive_or_none(value):
+    return value if value > 0 else None
+
+
+def add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the resource limits to a hook."""
+    defaults = ResourceLimits()
+    group = parser.add_argument_group(
+        "resource limits", "Files exceeding a limit are reported and skipped"
+    )
+    group.add_argument(
+        "--max-file-size",
+        type=int,
+        default=defaults.max_file_size,
+        help="Maximum size of a file in bytes (0 to disable)",
+    )
+    group.add_argument(
+        "--max-nodes",
+        type=int,
+        default=defaults.max_nodes,
+        help="Maximum number of YAML nodes once aliases are expanded (0 to disable)",
+    )
+    group.add_argument(
+        "--max-alias-expansion",
+        type=int,
+        default=defaults.max_alias_expansion,
+        help="Maximum number of YAML nodes added by expanding aliases (-1 to disable)",
+    )
+    group.add_argument(
+        "--max-depth",
+        type=int,
+        default=defaults.max_depth,
+        help="Maximum nesting depth of a document (0 to disable)",
+    )
+    group.add_argument(
+        "--timeout",
+        type=float,
+        default=defaults.timeout,
+        help="Maximum wall time in seconds spent on a file (0 to disable)",
+    )
+
+
+def _children(node: yaml.Node) -> List[yaml.Node]:
+    if isinstance(node, yaml.SequenceNode):
+        return node.value
+    if isinstance(node, yaml.MappingNode):
+        return [item for pair in node.value for item in pair]
+    return []
+
+
+def measure_node(node: yaml.Node) -> Tuple[int, int, int]:
+    """Measure a composed YAML node graph without expanding it.
+
+    Aliases compose into shared nodes, so the size of the expanded document is
+    computed bottom-up once per distinct node.
+
+    Returns:
+        The number of distinct nodes, the number of nodes and the depth of the
+        document once its aliases are expanded
+
+    Raises:
+        ResourceLimitError: If an alias refers to one of its own ancestors
+    """
+    sizes: Dict[int, int] = {}
+    depths: Dict[int, int] = {}
+    in_progress = set()
+    stack: List[Tuple[yaml.Node, bool]] = [(node, False)]
+    while stack:
+        current, leaving = stack.pop()
+        key = id(current)
+        children = _children(current)
+        if leaving:
+            in_progress.discard(key)
+            sizes[key] = 1 + sum(sizes[id(child)] for child in children)
+            depths[key] = 1 + max((depths[id(child)] for child in children), default=0)
+            continue
+        if key in sizes:
+            continue
+        if key in in_progress:
+            raise ResourceLimitError(
+                f"recursive alias of the node at line {current.start_mark.line + 1}"
+            )
+        in_progress.add(key)
+        stack.append((current, True))
+        for child in children:
+            child_key = id(child)
+            if child_key in in_progress:
+                raise ResourceLimitError(
+                    f"recursive alias of the node at line {child.start_mark.line + 1}"
+                )
+            if child_key not in sizes:
+                stack.append((child, False))
+    return len(sizes), sizes[id(node)], depths[id(node)]
+
+
+def shared_nodes(node: yaml.Node) -> Set[int]:
+    """Find the ids of the collection nodes an alias refers to.
+
+    They are the nodes with several parents, whose objects are constructed
+    once and then referred to from each of them.
+    """
+    references: Dict[int, int] = {}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for child in _children(current):
+            if not isinstance(child, yaml.CollectionNode):
+                continue
+            key = id(child)
+            references[key] = references.get(key, 0) + 1
+            if references[key] == 1:
+                stack.append(child)
+    return {key for key, count in references.items() if count > 1}
+
+
+def check_node(node: yaml.Node, limits: ResourceLimits) -> Tuple[int, int, int]:
+    """Check a composed YAML node graph against the limits.
+
+    Returns:
+        The measure of the node graph (see measure_node)
+    """
+    distinct, expanded, depth = measure_node(node)
+    if limits.max_nodes is not None and expanded > limits.max_nodes:
+        raise ResourceLimitError(
+            f"document has {expanded} nodes once aliases are expanded, "
+            f"more than the limit of {limits.max_nodes} (--max-nodes)"
+        )
+    alias_expansion = expanded - distinct
+    if (
+        limits.max_alias_expansion is not None
+        and alias_expansion > limits.max_alias_expansion
+    ):
+        raise ResourceLimitError(
+            f"aliases expand into {alias_expansion} nodes, more than the limit of "
+            f"{limits.max_alias_expansion} (--max-alias-expansion)"
+        )
+    if limits.max_depth is not None and depth > limits.max_depth:
+        raise ResourceLimitError(
+            f"document is nested {depth} levels deep, more than the limit of "
+            f"{limits.max_depth} (--max-depth)"
+        )
+    return distinct, expanded, depth
+
+
+@dataclass(frozen=True)
+class DuplicateKey:
+    """A key repeated in a mapping, whose earlier values are silently dropped."""
+
+    key: str
+    # 1-based lines of the repeated key and of its first occurrence
+    line: int
+    first_line: int
+
+
+def find_duplicate_keys(node: yaml.Node) -> List[DuplicateKey]:
+    """Find the keys repeated within a mapping of a composed YAML node graph.
+
+    Loaders keep the last value of a repeated key, so the check runs on the
+    nodes, before construction. It works on the nodes composed by any loader,
+    including the libyaml-based ones. Nodes an alias refers to are only
+    checked once.
+    """
+    duplicates: List[DuplicateKey] = []
+    seen: Set[int] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, yaml.MappingNode):
+            first_keys: Dict[Tuple[str, str], yaml.Node] = {}
+            for key, value in current.value:
+                if isinstance(key, yaml.ScalarNode) and key.tag != MERGE_TAG:
+                    first = first_keys.setdefault((key.tag, key.value), key)
+                    if first is not key:
+                        duplicates.append(
+                            DuplicateKey(
+                                key.value,
+                                key.start_mark.line + 1,
+                                first.start_mark.line + 1,
+                            )
+                        )
+                if isinstance(value, yaml.CollectionNode) and id(value) not in seen:
+                    seen.add(id(value))
+                    stack.append(value)
+        elif isinstance(current, yaml.SequenceNode):
+            for item in current.value:
+                if isinstance(item, yaml.CollectionNode) and id(item) not in seen:
+                    seen.add(id(item))
+                    stack.append(item)
+    duplicates.sort(key=lambda duplicate: duplicate.line)
+    return duplicates
+
+
+@dataclass
+class YamlDocument:
+    """The data of a YAML file and the objects shared by its aliases."""
+
+    data: Any
+    # Objects constructed from a node an alias refers to, by id
+    shared: Dict[int, Any] = field(default_factory=dict)
+    # Keys repeated within a mapping, if they were looked for
+    duplicate_keys: List[DuplicateKey] = field(default_factory=list)
+
+
+class _LineMark:
+    """Position of a node, down to its line only.
+
+    Nodes keep their start and end marks for as long as the node graph lives,
+    and full marks make up about half of it, so the nodes of a line share one.
+    """
+
+    __slots__ = ("name", "line")
+    # Compared by MarkedYAMLError to tell the context from the problem
+    column = None
+
+    def __init__(self, name: str, line: int) -> None:
+        self.name = name
+        self.line = line
+
+    def __str__(self) -> str:
+        return f'  in "{self.name}", line {self.line + 1}'
+
+
+class _SharingLoader(yaml.SafeLoader):
+    """SafeLoader recording the objects constructed from the given nodes."""
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.shared_node_ids: Set[int] = set()
+        self.shared_objects: Dict[int, Any] = {}
+        self.line_marks: Dict[int, _LineMark] = {}
+
+    def get_event(self):
+        # The composer copies the marks of the events it consumes into the nodes
+        event = super().get_event()
+        event.start_mark = self._line_mark(event.start_mark.line)
+        event.end_mark = self._line_mark(event.end_mark.line)
+        return event
+
+    def _line_mark(self, line: int) -> _LineMark:
+        mark = self.line_marks.get(line)
+        if mark is None:
+            mark = self.line_marks[line] = _LineMark(self.name, line)
+        return mark
+
+    def construct_object(self, node, deep=False):
+        data = super().construct_object(node, deep=deep)
+        if id(node) in self.shared_node_ids:
+            self.shared_objects[id(data)] = data
+        return data
+
+
+def load_yaml(file_path: str, limits: Optional[ResourceLimits] = None) -> Any:
+    """Load a YAML file, checking it against the resource limits first.
+
+    The document is composed into a node graph, where aliases are shared nodes,
+    and measured before it is constructed, so that an alias bomb is rejected
+    without ever being expanded.
+
+    Raises:
+        ResourceLimitError: If the file exceeds one of the limits
+    """
+    return load_yaml_document(file_path, limits).data
+
+
+def load_yaml_document(
+    file_path: str,
+    limits: Optional[ResourceLimits] = None,
+    duplicate_keys: bool = False,
+) -> YamlDocument:
+    """Load a YAML file like load_yaml, keeping track of the objects aliases share.
+
+    Args:
+        duplicate_keys: Whether to look for the keys repeated within a mapping
+
+    Raises:
+        ResourceLimitError: If the file exceeds one of the limits
+    """
+    limits = limits or ResourceLimits()
+    if limits.max_file_size is not None:
+        size = os.path.getsize(file_path)
+        if size > limits.max_file_size:
+            raise ResourceLimitError(
+                f"file is {size} bytes, more than the limit of "
+                f"{limits.max_file_size} bytes (--max-file-size)"
+            )
+    with open(file_path, "r", encoding="utf-8") as file:
+        loader = _SharingLoader(file)
+        try:
+            node = loader.get_single_node()
+            if node is None:
+                return YamlDocument(None)
+            distinct, expanded, _ = check_node(node, limits)
+            if expanded > distinct:
+                loader.shared_node_ids = shared_nodes(node)
+            duplicates = find_duplicate_keys(node) if duplicate_keys else []
+            data = loader.construct_document(node)
+            return YamlDocument(data, loader.shared_objects, duplicates)
+        except RecursionError:
+            # The composer is recursive, so deeper documents never reach check_node
+            raise ResourceLimitError(
+                "document is nested too deeply to be parsed (--max-depth)"
+            ) from None
+        finally:
+            loader.dispose()
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise ResourceLimitError if the block runs for longer than `seconds`.
+
+    The limit relies on SIGALRM, so it only applies in the main thread of
+    platforms supporting it.
+    """
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _timeout(signum, frame):
+        raise ResourceLimitError(
+            f"processing took more than the limit of {seconds:g} seconds (--timeout)"
+        )
+
+    previous_handler = signal.signal(signal.SIGALRM, _timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        if previous_handler is not None:
+            signal.signal(signal.SIGALRM, previous_handler)
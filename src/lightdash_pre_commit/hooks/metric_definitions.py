@@ -0,0 +1,221 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# Tokens of a SQL expression. String literals and quoted identifiers keep
+# their casing, comments and whitespace are dropped.
+SQL_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<reference>\$\{[^}]*\})
+    |(?P<comment>--[^\n]*|/\*.*?\*/)
+    |(?P<literal>'(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`)
+    |(?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+    |(?P<space>\s+)
+    |(?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Lightdash placeholder for the table of the model defining the metric
+TABLE_REFERENCE = "TABLE"
+
+
+def _reference(model: str, reference: str) -> str:
+    """Qualify a `${...}` reference with the model it is relative to."""
+    table, _, field = reference.partition(".")
+    if not field:
+        table, field = model, table
+    return f"${{{table.strip().lower()}.{field.strip().lower()}}}"
+
+
+def normalize_sql(sql: str, model: str) -> str:
+    """Normalize the SQL of a metric so that equivalent spellings compare equal.
+
+    Whitespace and comments are dropped, keywords and identifiers are
+    lowercased, and `${TABLE}.column`, `${field}` and `${model.field}` are
+    all qualified as `${model.field}`.
+
+    Args:
+        sql: SQL of the metric
+        model: Name of the model defining the metric
+    """
+    tokens: List[Tuple[str, str]] = []
+    for match in SQL_TOKEN_PATTERN.finditer(sql):
+        kind = match.lastgroup or "other"
+        if kind in ("space", "comment"):
+            continue
+        value = match.group()
+        if kind == "word":
+            value = value.lower()
+        tokens.append((kind, value))
+
+    normalized: List[str] = []
+    position = 0
+    while position < len(tokens):
+        kind, value = tokens[position]
+        position += 1
+        if kind != "reference":
+            normalized.append(value)
+            continue
+        reference = value[2:-1].strip()
+        if reference == TABLE_REFERENCE:
+            # `${TABLE}.column` is the column of the model's table
+            if (
+                position + 1 < len(tokens)
+                and tokens[position][1] == "."
+                and tokens[position + 1][0] == "word"
+            ):
+                normalized.append(_reference(model, tokens[position + 1][1]))
+                position += 2
+            else:
+                normalized.append(f"${{{model.lower()}}}")
+            continue
+        normalized.append(_reference(model, reference))
+    return " ".join(normalized)
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """A metric located in a model, with the fingerprint of its definition."""
+
+    fingerprint: str
+    model: str
+    name: str
+    # None for model-level metrics
+    column: Optional[str]
+
+    def to_list(self) -> List[Any]:
+        return [self.fingerprint, self.model, self.name, self.column]
+
+    @classmethod
+    def from_list(cls, values: List[Any]) -> "MetricDefinition":
+        fingerprint, model, name, column = values
+        return cls(fingerprint=fingerprint, model=model, name=name, column=column)
+
+
+def metric_fingerprint(
+    metric_type: str,
+    sql: str,
+    model: str,
+    filters: Any = None,
+    percentile: Optional[float] = None,
+) -> str:
+    """Fingerprint what a metric computes: its type, normalized SQL and filters.
+
+    The order of the filters does not matter, as they are all applied.
+    """
+    canonical_filters = sorted(
+        json.dumps(item, sort_keys=True, default=str) for item in filters or []
+    )
+    key = json.dumps(
+        [metric_type, percentile, normalize_sql(sql, model), canonical_filters]
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# A metric definition and the file defining it
+Location = Tuple[str, MetricDefinition]
+
+
+class MetricDefinitionIndex:
+    """Index of the metric definitions of a project by fingerprint.
+
+    Metrics sharing a fingerprint are grouped through a hash index, so finding
+    every cluster of duplicates is linear in the number of metrics. The index
+    is maintained per file, so that only the files that changed are parsed
+    again between runs.
+    """
+
+    def __init__(self) -> None:
+        # path -> {"signature": [mtime_ns, size], "metrics": [definition, ...]}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # fingerprint -> {path: definitions}
+        self._clusters: Dict[str, Dict[str, List[MetricDefinition]]] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricDefinitionIndex":
+        """Restore an index persisted with `to_dict`."""
+        index = cls()
+        for file_path, entry in (data.get("files") or {}).items():
+            index.update_file(
+                file_path,
+                entry["signature"],
+                [MetricDefinition.from_list(values) for values in entry["metrics"]],
+            )
+        return index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index into JSON-compatible data."""
+        return {"files": self._files}
+
+    def indexed_files(self) -> List[str]:
+        return list(self._files)
+
+    def is_fresh(self, file_path: str, signature: Optional[List[int]]) -> bool:
+        """Check if a file is indexed with the same signature."""
+        entry = self._files.get(file_path)
+        return entry is not None and entry["signature"] == signature
+
+    def update_file(
+        self,
+        file_path: str,
+        signature: Optional[List[int]],
+        definitions: List[MetricDefinition],
+    ) -> None:
+        """Replace the metrics defined in a file."""
+        self.remove_file(file_path)
+        self._files[file_path] = {
+            "signature": signature,
+            "metrics": [definition.to_list() for definition in definitions],
+        }
+        for definition in definitions:
+            cluster = self._clusters.setdefault(definition.fingerprint, {})
+            cluster.setdefault(file_path, []).append(definition)
+
+    def remove_file(self, file_path: str) -> None:
+        """Forget a file, e.g., a deleted one."""
+        entry = self._files.pop(file_path, None)
+        if entry is None:
+            return
+        for fingerprint in {values[0] for values in entry["metrics"]}:
+            cluster = self._clusters[fingerprint]
+            del cluster[file_path]
+            if not cluster:
+                del self._clusters[fingerprint]
+
+    def duplicates_in_file(self, file_path: str) -> List[List[Location]]:
+        """Get the clusters of metrics sharing a definition with a metric of a file.
+
+        Returns:
+            Clusters in the order of their first metric in the file, each
+            listing its metrics in the file first, then by path
+        """
+        entry = self._files.get(file_path)
+        if entry is None:
+            return []
+        clusters = []
+        for fingerprint in dict.fromkeys(values[0] for values in entry["metrics"]):
+            cluster = self._clusters[fingerprint]
+            if sum(len(definitions) for definitions in cluster.values()) < 2:
+                continue
+            paths = [file_path] + sorted(path for path in cluster if path != file_path)
+            clusters.append(
+                [(path, definition) for path in paths for definition in cluster[path]]
+            )
+        return clusters
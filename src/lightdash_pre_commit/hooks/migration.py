@@ -0,0 +1,389 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.limits import (
+    ResourceLimitError,
+    ResourceLimits,
+    check_node,
+)
+from lightdash_pre_commit.hooks.traversal import (
+    ColumnNode,
+    ModelNode,
+    get_meta,
+    run_checkers,
+)
+from lightdash_pre_commit.hooks.utils import validate_document
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+# Properties of models and columns that dbt 1.10 moves under `config`
+MOVED_KEYS = ("meta", "tags")
+
+# Loader of the migrated text. Its nesting is that of the original document,
+# which already passed the resource limits, so the libyaml loader is safe here
+VERIFY_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Indentation of the `config` mapping when it cannot be inferred from the file
+DEFAULT_INDENT = 2
+
+# Lines [start, end) of a file replaced with new lines
+Edit = Tuple[int, int, List[str]]
+
+
+class MigrationError(Exception):
+    """Raised when a model or column cannot be migrated by patching its lines."""
+
+
+@dataclass
+class MigrationResult:
+    """The outcome of migrating a file."""
+
+    file_path: str
+    # Models and columns whose properties were moved under `config`
+    migrated: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class InventoryCollector(BaseChecker):
+    """Collect the Lightdash meta and tags of each model and column.
+
+    The meta of a model holds its joins and model-level metrics, and the meta
+    of a column its dimension, additional dimensions and metrics, so two
+    documents with the same inventory define the same fields.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inventory: Dict[Tuple[str, Optional[str]], Any] = {}
+
+    def start_document(self, data) -> None:
+        super().start_document(data)
+        self.inventory = {}
+
+    def _record(self, model: str, column: Optional[str], node: Any) -> None:
+        meta = get_meta(node)
+        tags = getattr(node, "tags", None)
+        if tags is None:
+            tags = getattr(getattr(node, "config", None), "tags", None)
+        self.inventory[(model, column)] = (
+            meta.model_dump(mode="json", exclude_none=True) if meta else None,
+            tags.model_dump(mode="json") if tags is not None else None,
+        )
+
+    def visit_model(self, node: ModelNode) -> None:
+        self._record(node.name, None, node.model)
+
+    def visit_column(self, node: ColumnNode) -> None:
+        self._record(node.model.name, node.name, node.column)
+
+
+def _indentation(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _entry_end(lines: List[str], start: int, column: int, value: yaml.Node) -> int:
+    """Find the end of the lines of a block mapping entry whose key starts a line.
+
+    The entry spans the following lines indented deeper than its key, and the
+    items of a block sequence value written at the indentation of the key.
+    Blank lines after its last line are left out.
+    """
+    compact = isinstance(value, yaml.SequenceNode) and not value.flow_style
+    end = start + 1
+    for number in range(start + 1, len(lines)):
+        stripped = lines[number].strip()
+        if not stripped:
+            continue
+        indentation = _indentation(lines[number])
+        if indentation > column or (
+            compact and indentation == column and stripped.startswith("-")
+        ):
+            end = number + 1
+            continue
+        break
+    return end
+
+
+def _entries(node: yaml.MappingNode) -> Dict[str, Tuple[yaml.Node, yaml.Node]]:
+    return {
+        key.value: (key, value)
+        for key, value in node.value
+        if isinstance(key, yaml.ScalarNode)
+    }
+
+
+def _shift(lines: List[str], columns: int, newline: str) -> List[str]:
+    """Indent lines by a number of columns, leaving blank lines blank."""
+    shifted = []
+    for line in lines:
+        if not line.endswith(("\n", "\r")):
+            line += newline
+        shifted.append(" " * columns + line if line.strip() else line)
+    return shifted
+
+
+def _block_entry(
+    lines: List[str], key: yaml.Node, value: yaml.Node, what: str
+) -> Tuple[int, int]:
+    """Find the lines [start, end) of an entry of a block mapping."""
+    start = key.start_mark.line
+    column = key.start_mark.column
+    if lines[start][:column].strip():
+        raise MigrationError(
+            f"Cannot move '{key.value}' of {what} at line {start + 1}: "
+            "it does not start its line"
+        )
+    return start, _entry_end(lines, start, column, value)
+
+
+def plan_node(lines: List[str], node: yaml.Node, what: str) -> List[Edit]:
+    """Plan the edits moving the `meta` and `tags` of a model or column under `config`.
+
+    The lines of the moved entries are kept as written, comments included, and
+    only indented to their new depth.
+
+    Raises:
+        MigrationError: If the node is not a block mapping the edits can patch
+    """
+    if not isinstance(node, yaml.MappingNode):
+        return []
+    entries = _entries(node)
+    moved = [entries[key] for key in MOVED_KEYS if key in entries]
+    if not moved:
+        return []
+    if node.flow_style:
+        raise MigrationError(
+            f"Cannot migrate {what} at line {node.start_mark.line + 1}: "
+            "flow mappings are not supported"
+        )
+    newline = "\r\n" if lines[node.start_mark.line].endswith("\r\n") else "\n"
+    spans = sorted(_block_entry(lines, key, value, what) for key, value in moved)
+    moved_lines = [line for start, end in spans for line in lines[start:end]]
+    column = moved[0][0].start_mark.column
+    edits: List[Edit] = [(start, end, []) for start, end in spans]
+
+    if "config" not in entries:
+        # The moved entries are indented like the mappings they hold
+        indent = DEFAULT_INDENT
+        for key, value in moved:
+            if isinstance(value, yaml.MappingNode) and not value.flow_style:
+                indent = value.start_mark.column - key.start_mark.column
+                break
+        start, end, _ = edits[0]
+        edits[0] = (
+            start,
+            end,
+            [" " * column + "config:" + newline] + _shift(moved_lines, indent, newline),
+        )
+        return edits
+
+    config_key, config = entries["config"]
+    if (
+        not isinstance(config, yaml.MappingNode)
+        or config.flow_style
+        or not config.value
+    ):
+        raise MigrationError(
+            f"Cannot migrate {what} at line {config_key.start_mark.line + 1}: "
+            "its 'config' is not a block mapping"
+        )
+    conflicts = [
+        key for key in MOVED_KEYS if key in entries and key in _entries(config)
+    ]
+    if conflicts:
+        raise MigrationError(
+            f"Cannot migrate {what} at line {config_key.start_mark.line + 1}: "
+            f"'{conflicts[0]}' is set both on it and under its 'config'"
+        )
+    _, config_end = _block_entry(lines, config_key, config, what)
+    indent = config.value[0][0].start_mark.column - column
+    edits.append((config_end, config_end, _shift(moved_lines, indent, newline)))
+    return edits
+
+
+def plan_document(lines: List[str], root: yaml.Node) -> Tuple[List[Edit], int]:
+    """Plan the edits migrating the models and columns of a document.
+
+    Returns:
+        The edits and the number of models and columns they migrate
+    """
+    edits: List[Edit] = []
+    migrated = 0
+    planned: Set[int] = set()
+    if not isinstance(root, yaml.MappingNode):
+        return edits, migrated
+    models = _entries(root).get("models", (None, None))[1]
+    if not isinstance(models, yaml.SequenceNode):
+        return edits, migrated
+    for model in models.value:
+        if not isinstance(model, yaml.MappingNode):
+            continue
+        entries = _entries(model)
+        name = entries.get("name", (None, None))[1]
+        what = f"model '{name.value if isinstance(name, yaml.ScalarNode) else '?'}'"
+        nodes = [(model, what)]
+        columns = entries.get("columns", (None, None))[1]
+        if isinstance(columns, yaml.SequenceNode):
+            for column in columns.value:
+                column_name = (
+                    _entries(column).get("name", (None, None))[1]
+                    if isinstance(column, yaml.MappingNode)
+                    else None
+                )
+                if isinstance(column_name, yaml.ScalarNode):
+                    nodes.append((column, f"column '{column_name.value}' of {what}"))
+        for node, node_what in nodes:
+            if id(node) in planned:
+                # An alias repeats the lines of its anchor, migrated once
+                continue
+            planned.add(id(node))
+            node_edits = plan_node(lines, node, node_what)
+            if node_edits:
+                edits.extend(node_edits)
+                migrated += 1
+    return edits, migrated
+
+
+def apply_edits(lines: List[str], edits: List[Edit]) -> List[str]:
+    """Apply non-overlapping edits to the lines of a file."""
+    result = list(lines)
+    # From the bottom, so that the line numbers of the remaining edits hold, and
+    # removals before insertions at the same line
+    for start, end, new_lines in sorted(edits, key=lambda edit: edit[:2], reverse=True):
+        result[start:end] = new_lines
+    return result
+
+
+def _inventory(file_path: str, data: Any) -> Tuple[Optional[Dict], Optional[str]]:
+    """Validate a document and collect its inventory."""
+    document, error = validate_document(file_path, data, LightdashV25)
+    if document is None:
+        return None, error
+    collector = InventoryCollector()
+    run_checkers(document, [collector])
+    return collector.inventory, None
+
+
+def migrate_text(
+    file_path: str, text: str, limits: Optional[ResourceLimits] = None
+) -> Tuple[str, MigrationResult]:
+    """Migrate the models and columns of the text of a schema file to dbt 1.10.
+
+    The result is validated with LightdashV25 and must define the same meta
+    and tags as the original for each model and column.
+
+    Returns:
+        The migrated text, unchanged if the file has errors, and the result
+    """
+    result = MigrationResult(file_path)
+    # The document is composed once, both to locate the lines of its models and
+    # columns and to be measured before it is constructed
+    loader = yaml.SafeLoader(text)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return text, result
+        check_node(root, limits or ResourceLimits())
+        lines = text.splitlines(keepends=True)
+        edits, migrated = plan_document(lines, root)
+        if not edits:
+            return text, result
+        original, error = _inventory(file_path, loader.construct_document(root))
+    except (yaml.YAMLError, ResourceLimitError) as e:
+        result.errors.append(f"Failed to parse '{file_path}': {e}")
+        return text, result
+    except RecursionError:
+        result.errors.append(
+            f"Failed to parse '{file_path}': document is nested too deeply"
+        )
+        return text, result
+    except MigrationError as e:
+        result.errors.append(str(e))
+        return text, result
+    finally:
+        loader.dispose()
+    if error is not None:
+        result.errors.append(error)
+        return text, result
+
+    migrated_text = "".join(apply_edits(lines, edits))
+    try:
+        inventory, error = _inventory(
+            file_path, yaml.load(migrated_text, Loader=VERIFY_LOADER)
+        )
+    except yaml.YAMLError as e:
+        # The marks refer to the migrated text, which is not written
+        mark = getattr(e, "problem_mark", None)
+        error = f"{getattr(e, 'problem', None) or e}" + (
+            f" at line {mark.line + 1} of the migrated file" if mark else ""
+        )
+    if error is not None:
+        result.errors.append(f"The migration of '{file_path}' is invalid: {error}")
+        return text, result
+    if inventory != original:
+        changed = next(
+            key
+            for key in dict.fromkeys([*original, *inventory])
+            if original.get(key) != inventory.get(key)
+        )
+        what = f"column '{changed[1]}' of model" if changed[1] else "model"
+        result.errors.append(
+            f"The migration of '{file_path}' changes the meta or tags of "
+            f"{what} '{changed[0]}'"
+        )
+        return text, result
+    result.migrated = migrated
+    return migrated_text, result
+
+
+def migrate_file(
+    file_path: str, limits: Optional[ResourceLimits] = None, write: bool = True
+) -> MigrationResult:
+    """Migrate a schema file in place.
+
+    The file is replaced atomically, keeping its permissions, and only if it
+    was migrated without errors.
+
+    Args:
+        write: Whether to write the migrated file, or only report what would change
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            text = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return MigrationResult(file_path, errors=[f"Failed to read '{file_path}': {e}"])
+    migrated_text, result = migrate_text(file_path, text, limits)
+    if not write or migrated_text == text:
+        return result
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+            file.write(migrated_text)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return result
@@ -0,0 +1,272 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import random
+import re
+from array import array
+from typing import (
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+# Number of values of a MinHash signature
+NUM_PERMUTATIONS = 128
+
+# Rough number of bytes taken by the structures of an index, charged to its
+# memory cap: an entry of a bucket of a band, a similar text of a text, and an
+# array of band keys or token values, besides its 8 bytes per value
+BYTES_PER_BUCKET_ENTRY = 240
+BYTES_PER_NEIGHBOR = 80
+BYTES_PER_ARRAY = 160
+
+# Modulus of the universal hash functions simulating the permutations
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Coefficients of the hash functions, fixed so that signatures are stable
+_random = random.Random(0)
+PERMUTATIONS = [
+    (_random.randrange(1, MERSENNE_PRIME), _random.randrange(MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+K = TypeVar("K", bound=Hashable)
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    """Get the lowercased words of a text, regardless of their order."""
+    return frozenset(word.lower() for word in WORD_PATTERN.findall(text))
+
+
+def jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    """Get the Jaccard similarity of two sets."""
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def token_signature(
+    token: str, num_permutations: int = NUM_PERMUTATIONS
+) -> Tuple[int, ...]:
+    """Compute the value of a token under each permutation."""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return tuple(
+        (a * value + b) % MERSENNE_PRIME for a, b in PERMUTATIONS[:num_permutations]
+    )
+
+
+def signature(
+    token_signatures: Iterable[Sequence[int]],
+) -> List[int]:
+    """Compute the MinHash signature of a set from the signatures of its tokens.
+
+    The signature of a set is the minimum of its tokens under each
+    permutation, so the signature of each distinct token only has to be
+    computed once across all the texts.
+    """
+    return list(map(min, zip(*token_signatures, strict=True)))
+
+
+def lsh_parameters(
+    threshold: float, num_permutations: int = NUM_PERMUTATIONS
+) -> Tuple[int, int]:
+    """Choose the number of bands and rows per band of the LSH index.
+
+    Two signatures become candidates if all the rows of any band are equal,
+    which is likely above a similarity of about (1 / bands) ** (1 / rows).
+    The bands are chosen for that point to fall below the threshold, as the
+    candidates are verified, so that few similar pairs are missed.
+
+    Returns:
+        Tuple of (bands, rows per band)
+    """
+    target = threshold * 0.8
+    best = (num_permutations, 1)
+    for rows in range(1, num_permutations + 1):
+        bands = num_permutations // rows
+        if (1 / bands) ** (1 / rows) > target:
+            break
+        best = (bands, rows)
+    return best
+
+
+class SimilarityIndex(Generic[K]):
+    """Find similar texts with MinHash and locality-sensitive hashing.
+
+    Texts are compared by the Jaccard similarity of their words. Each distinct
+    set of words gets a MinHash signature, split into bands; only the texts
+    sharing a band are compared, so the cost is near-linear in the number of
+    texts rather than quadratic.
+
+    The signatures of the tokens, the band keys of the texts, the buckets and
+    the similar texts found are all charged to the memory cap. The bands are
+    bucketed in as many passes as fit under the cap, and the comparison stops,
+    setting `truncated`, once the similar texts found no longer fit.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        max_memory: int,
+        num_permutations: int = NUM_PERMUTATIONS,
+    ) -> None:
+        """
+        Args:
+            threshold: Minimum Jaccard similarity of two similar texts
+            max_memory: Approximate number of bytes the index may take
+            num_permutations: Number of values of the signatures, at most
+                NUM_PERMUTATIONS
+        """
+        self.threshold = threshold
+        self.max_memory = max_memory
+        self.num_permutations = num_permutations
+        self.bands, self.rows = lsh_parameters(threshold, num_permutations)
+        # Identical sets of words share their signature
+        self._groups: Dict[FrozenSet[str], List[K]] = {}
+        self._band_keys: List[array] = []
+        self._token_signatures: Dict[str, array] = {}
+        # Number of passes over the bands of the last call of `similar`, and
+        # whether it stopped at the memory cap
+        self.passes = 0
+        self.truncated = False
+
+    def add(self, key: K, text: str) -> None:
+        """Index a text under a key."""
+        tokens = shingles(text)
+        if not tokens:
+            return
+        group = self._groups.get(tokens)
+        if group is not None:
+            group.append(key)
+            return
+        self._groups[tokens] = [key]
+        token_signatures = self._token_signatures
+        for token in tokens:
+            if token not in token_signatures:
+                token_signatures[token] = array(
+                    "q", token_signature(token, self.num_permutations)
+                )
+        values = signature(token_signatures[token] for token in tokens)
+        rows = self.rows
+        # Only the hashes of the bands are kept, rather than the signatures
+        self._band_keys.append(
+            array(
+                "q",
+                (
+                    hash(tuple(values[band * rows : (band + 1) * rows]))
+                    for band in range(self.bands)
+                ),
+            )
+        )
+
+    def memory(self) -> int:
+        """Approximate number of bytes taken by the signatures of the index."""
+        return len(self._token_signatures) * (
+            BYTES_PER_ARRAY + 8 * self.num_permutations
+        ) + len(self._band_keys) * (BYTES_PER_ARRAY + 8 * self.bands)
+
+    def _candidates(
+        self, buckets: Iterable[List[int]], sizes: List[int]
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield the pairs of texts sharing a bucket that may be similar.
+
+        A pair is yielded for each band it shares, so that the pairs yielded
+        need not be remembered.
+        """
+        for members in buckets:
+            if len(members) < 2:
+                continue
+            # The similarity of two sets is at most the ratio of their sizes,
+            # so each set is only compared with the sets not too much larger
+            members.sort(key=sizes.__getitem__)
+            for position, left in enumerate(members):
+                max_size = sizes[left] / self.threshold
+                for right in members[position + 1 :]:
+                    if sizes[right] > max_size:
+                        break
+                    yield left, right
+
+    def similar(self) -> Dict[K, List[K]]:
+        """Get the keys of the texts similar to the text of each key.
+
+        Returns:
+            Keys of the similar texts of each key having any, grouped by text
+            in the order the texts were first added. If the memory cap is
+            reached, `truncated` is set and only the texts found so far are
+            returned.
+        """
+        token_sets = list(self._groups)
+        sizes = [len(tokens) for tokens in token_sets]
+        neighbors: Dict[int, Set[int]] = {}
+        # Memory of the signatures and the similar texts found so far, and of
+        # the buckets of a band
+        used = self.memory()
+        band_memory = len(token_sets) * BYTES_PER_BUCKET_ENTRY
+        self.passes = 0
+        self.truncated = False
+        first_band = 0
+        while first_band < self.bands:
+            bands_per_pass = (self.max_memory - used) // max(1, band_memory)
+            if bands_per_pass < 1:
+                self.truncated = True
+                break
+            self.passes += 1
+            buckets: Dict[Tuple[int, int], List[int]] = {}
+            bands = range(first_band, min(first_band + bands_per_pass, self.bands))
+            for item, band_keys in enumerate(self._band_keys):
+                for band in bands:
+                    buckets.setdefault((band, band_keys[band]), []).append(item)
+            for left, right in self._candidates(buckets.values(), sizes):
+                # Pairs sharing several bands are only compared again if they
+                # are not similar, which is cheaper than remembering them all
+                if right in neighbors.get(left, ()):
+                    continue
+                if jaccard(token_sets[left], token_sets[right]) >= self.threshold:
+                    neighbors.setdefault(left, set()).add(right)
+                    neighbors.setdefault(right, set()).add(left)
+                    used += 2 * BYTES_PER_NEIGHBOR
+                    if used + len(bands) * band_memory > self.max_memory:
+                        self.truncated = True
+                        break
+            del buckets
+            if self.truncated:
+                break
+            first_band = bands.stop
+
+        similar: Dict[K, List[K]] = {}
+        for item, tokens in enumerate(token_sets):
+            keys = self._groups[tokens]
+            others = [
+                key
+                for other in sorted(neighbors.get(item, ()))
+                for key in self._groups[token_sets[other]]
+            ]
+            for position, key in enumerate(keys):
+                # Keys of the same text are similar to each other
+                same = keys[:position] + keys[position + 1 :]
+                if same or others:
+                    similar[key] = same + others
+        return similar
@@ -0,0 +1,164 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.traversal import run_checkers
+
+# Number of models of a document under which it is validated in the process
+# of the hook, as starting the workers and sending them the models costs more
+PARALLEL_MIN_MODELS = 200
+
+# Number of chunks per worker, so that a chunk of slower models does not keep
+# the other workers waiting
+CHUNKS_PER_JOB = 2
+
+# Errors of each model of a chunk, or None if the chunk has validation errors,
+# and the time spent in each checker
+ChunkResult = Tuple[Optional[List[List[str]]], Dict[str, float]]
+
+
+def add_parallel_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the `--jobs` option to a hook."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes validating and checking the models of a file "
+        f"with at least {PARALLEL_MIN_MODELS} models (0 for one per CPU, "
+        "default: 1)",
+    )
+
+
+def check_model_chunk(
+    validator_class: Type[BaseModel],
+    checkers: List[BaseChecker],
+    rest: Dict[str, Any],
+    models: List[Any],
+    raw_models: Optional[List[Any]] = None,
+) -> ChunkResult:
+    """Validate a chunk of models with the rest of their document, and check them.
+
+    The models are checked one by one, so that the errors of each model are
+    known. All the checkers must be model-scoped.
+
+    Args:
+        models: Models to validate, e.g., projected
+        raw_models: Raw YAML of the models given to the checkers (default: models)
+    """
+    partial = dict(rest)
+    partial["models"] = models
+    try:
+        data = validator_class.model_validate(partial)
+    except ValidationError:
+        return None, {}
+
+    errors = []
+    timings: Dict[str, float] = {}
+    for position, raw_model in enumerate(raw_models or models):
+        model_data = data.model_copy(update={"models": [data.models[position]]})
+        raw = raw_model if isinstance(raw_model, dict) else {}
+        result = run_checkers(model_data, checkers, {"models": [raw]})
+        for name, elapsed in result.timings.items():
+            timings[name] = timings.get(name, 0.0) + elapsed
+        errors.append(result.errors)
+    return errors, timings
+
+
+class ModelPool:
+    """Validate and check the models of large documents across processes.
+
+    The models of a document are split into contiguous chunks, each validated
+    with the rest of the document and checked in a worker, and the errors of
+    the chunks are merged back in the order of the models. Validation and
+    checking hold the GIL, so the workers are processes rather than threads.
+    The workers are started on the first large document and reused for the
+    following ones.
+    """
+
+    def __init__(self, jobs: int, min_models: int = PARALLEL_MIN_MODELS) -> None:
+        self.jobs = jobs if jobs > 0 else os.cpu_count() or 1
+        self.min_models = min_models
+        self.executor: Optional[Executor] = None
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> Optional["ModelPool"]:
+        """Create the pool of a hook, unless it runs with a single job."""
+        pool = cls(args.jobs)
+        return pool if pool.jobs > 1 else None
+
+    def check(
+        self,
+        validator_class: Type[BaseModel],
+        checkers: List[BaseChecker],
+        rest: Dict[str, Any],
+        models: List[Any],
+        raw_models: Optional[List[Any]] = None,
+    ) -> ChunkResult:
+        """Validate and check models, in chunks across the workers if there are enough.
+
+        Returns:
+            Tuple of (errors of each model in order, or None if any chunk has
+            validation errors, time spent in each checker)
+        """
+        if len(models) < self.min_models:
+            return check_model_chunk(
+                validator_class, checkers, rest, models, raw_models
+            )
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.jobs)
+        size = math.ceil(len(models) / (self.jobs * CHUNKS_PER_JOB))
+        futures = [
+            self.executor.submit(
+                check_model_chunk,
+                validator_class,
+                checkers,
+                rest,
+                models[start : start + size],
+                raw_models[start : start + size] if raw_models else None,
+            )
+            for start in range(0, len(models), size)
+        ]
+        errors: Optional[List[List[str]]] = []
+        timings: Dict[str, float] = {}
+        try:
+            for future in futures:
+                chunk_errors, chunk_timings = future.result()
+                if chunk_errors is None or errors is None:
+                    errors = None
+                    continue
+                errors.extend(chunk_errors)
+                for name, elapsed in chunk_timings.items():
+                    timings[name] = timings.get(name, 0.0) + elapsed
+        except BaseException:
+            # e.g., the timeout of the file: its pending chunks are dropped so
+            # that the chunks of the next file do not queue behind them
+            for future in futures:
+                future.cancel()
+            raise
+        return errors, timings
+
+    def close(self) -> None:
+        """Stop the workers, if they were started."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,212 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import copy
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from lightdash_pre_commit.hooks.config import DEFAULT_CONFIG_FILE
+from lightdash_pre_commit.hooks.discovery import DBT_PROJECT_FILE, iter_file_paths
+
+# Label of the files that are not part of any dbt project
+NO_PROJECT = "(no dbt project)"
+
+HookRun = Callable[[argparse.Namespace], int]
+
+
+def add_project_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options checking the dbt projects of a monorepo in isolation."""
+    group = parser.add_argument_group(
+        "monorepo",
+        "The files of each dbt project are checked separately, with their own "
+        "index, cache and configuration",
+    )
+    group.add_argument(
+        "--per-project",
+        action="store_true",
+        help=f"Group the files by the nearest directory with a {DBT_PROJECT_FILE} "
+        "and check each project in isolation",
+    )
+    group.add_argument(
+        "--project-jobs",
+        type=int,
+        default=0,
+        help="Number of projects checked concurrently with --per-project "
+        "(0 for one per CPU, default: 0)",
+    )
+
+
+def find_project_root(
+    file_path: str, roots: Optional[Dict[str, Optional[str]]] = None
+) -> Optional[str]:
+    """Find the nearest directory above a file with a `dbt_project.yml`.
+
+    Args:
+        file_path: Path of the file
+        roots: Memo of the project root of each directory already looked up
+    """
+    roots = {} if roots is None else roots
+    directory = os.path.dirname(os.path.abspath(file_path))
+    visited = []
+    root: Optional[str] = None
+    while directory not in roots:
+        visited.append(directory)
+        if os.path.isfile(os.path.join(directory, DBT_PROJECT_FILE)):
+            root = directory
+            break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    else:
+        root = roots[directory]
+    for directory in visited:
+        roots[directory] = root
+    return root
+
+
+def group_by_project(file_paths: Iterable[str]) -> Dict[Optional[str], List[str]]:
+    """Group files by their dbt project, in the order the projects are first seen.
+
+    Files that are not part of any dbt project are grouped under None.
+    """
+    roots: Dict[str, Optional[str]] = {}
+    groups: Dict[Optional[str], List[str]] = {}
+    for file_path in file_paths:
+        groups.setdefault(find_project_root(file_path, roots), []).append(file_path)
+    return groups
+
+
+def project_label(root: Optional[str]) -> str:
+    if root is None:
+        return NO_PROJECT
+    label = os.path.relpath(root)
+    return root if label.startswith("..") else label
+
+
+def project_args(
+    args: argparse.Namespace, root: Optional[str], file_paths: List[str]
+) -> argparse.Namespace:
+    """The arguments of a hook run over the files of a single project.
+
+    The project gets its own cache directory and, unless a configuration file
+    is given, the configuration file at its root if it has one.
+    """
+    project = copy.copy(args)
+    project.filenames = file_paths
+    project.project_dir = None
+    project.per_project = False
+    if getattr(args, "jobs", None) is not None:
+        # The projects already run in worker processes
+        project.jobs = 1
+    if getattr(args, "cache_dir", None) and root is not None:
+        key = hashlib.blake2b(root.encode("utf-8"), digest_size=8).hexdigest()
+        project.cache_dir = os.path.join(
+            args.cache_dir, "projects", f"{os.path.basename(root)}-{key}"
+        )
+    if getattr(args, "config", None) is None and root is not None:
+        config_path = os.path.join(root, DEFAULT_CONFIG_FILE)
+        if os.path.exists(config_path):
+            project.config = config_path
+    return project
+
+
+@dataclass
+class ProjectResult:
+    """The outcome of a hook run over the files of a project."""
+
+    label: str
+    files: int
+    exit_code: int
+    output: str
+    elapsed: float
+
+
+def run_project(run: HookRun, args: argparse.Namespace) -> Tuple[int, str, float]:
+    """Run a hook over a project, capturing its output."""
+    start = time.perf_counter()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        exit_code = run(args)
+    return exit_code, output.getvalue(), time.perf_counter() - start
+
+
+def run_per_project(
+    parser: argparse.ArgumentParser, run: HookRun, args: argparse.Namespace
+) -> int:
+    """Run a hook over each dbt project of its files in isolation.
+
+    The projects run concurrently in worker processes, and their output is
+    printed project by project, in the order the projects are first seen,
+    followed by a summary of each project.
+
+    Returns:
+        The highest exit code of the projects
+    """
+    if getattr(args, "shard", None) is not None:
+        parser.error("--per-project cannot be combined with --shard")
+    groups = group_by_project(iter_file_paths(args))
+    if not groups:
+        return run(args)
+    jobs = args.project_jobs if args.project_jobs > 0 else os.cpu_count() or 1
+    jobs = min(jobs, len(groups))
+    runs = [
+        (project_label(root), project_args(args, root, file_paths))
+        for root, file_paths in groups.items()
+    ]
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(run_project, run, project) for _, project in runs
+            ]
+            outcomes = [future.result() for future in futures]
+    else:
+        outcomes = [run_project(run, project) for _, project in runs]
+
+    results = [
+        ProjectResult(label, len(project.filenames), exit_code, output, elapsed)
+        for (label, project), (exit_code, output, elapsed) in zip(
+            runs, outcomes, strict=True
+        )
+    ]
+    for result in results:
+        if result.output:
+            print(f"== {result.label} ==")
+            print(result.output, end="")
+    print(summarize_projects(results))
+    return max((result.exit_code for result in results), default=0)
+
+
+def summarize_projects(results: List[ProjectResult]) -> str:
+    """Summarize the outcome of each project and of the whole run."""
+    lines = ["Projects:"]
+    for result in results:
+        status = "passed" if result.exit_code == 0 else f"failed ({result.exit_code})"
+        lines.append(
+            f"  {result.label}: {result.files} file{'s' if result.files != 1 else ''}, "
+            f"{status} in {result.elapsed:.2f}s"
+        )
+    failed = sum(1 for result in results if result.exit_code != 0)
+    lines.append(
+        f"{len(results)} project{'s' if len(results) != 1 else ''}, {failed} failed"
+    )
+    return "\n".join(lines)
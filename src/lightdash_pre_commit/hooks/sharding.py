@@ -0,0 +1,268 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import heapq
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from lightdash_pre_commit.hooks.discovery import iter_file_paths
+
+SHARD_FORMAT_VERSION = 1
+
+
+class ShardError(Exception):
+    """Raised when partial results cannot be merged."""
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `count` shards, numbered from 1."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a `--shard` value such as `2/4`."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{value}': expected 'i/n', e.g. '1/4'"
+        ) from None
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{value}': expected 1 <= i <= n"
+        )
+    return Shard(index, count)
+
+
+def partition_by_size(file_paths: Sequence[str], count: int) -> List[List[str]]:
+    """Partition files into shards of balanced total size.
+
+    The largest files are assigned first, each to the lightest shard. Ties are
+    broken by path and shard number, so every runner computes the same
+    partition from the same files whatever the order they were passed in. Each
+    shard keeps the files in their input order.
+
+    Args:
+        file_paths: Paths of the files to partition
+        count: Number of shards
+
+    Returns:
+        The files of each shard
+    """
+    unique_paths = list(dict.fromkeys(file_paths))
+    sizes: Dict[str, int] = {}
+    for file_path in unique_paths:
+        try:
+            sizes[file_path] = os.path.getsize(file_path)
+        except OSError:
+            # Missing files are reported by the shard they are assigned to
+            sizes[file_path] = 0
+
+    loads: List[Tuple[int, int]] = [(0, shard) for shard in range(count)]
+    assignments: Dict[str, int] = {}
+    for file_path in sorted(unique_paths, key=lambda path: (-sizes[path], path)):
+        load, shard = heapq.heappop(loads)
+        assignments[file_path] = shard
+        heapq.heappush(loads, (load + sizes[file_path], shard))
+
+    shards: List[List[str]] = [[] for _ in range(count)]
+    for file_path in unique_paths:
+        shards[assignments[file_path]].append(file_path)
+    return shards
+
+
+def add_shard_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the `--shard` and `--shard-output` options to a hook."""
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        help="Only check the i-th of n shards of the files, balanced by file size (e.g., 1/4)",
+    )
+    parser.add_argument(
+        "--shard-output",
+        default=None,
+        help="Path of the partial result file written with --shard "
+        "(default: lightdash-pre-commit-<hook>-<i>-of-<n>.json)",
+    )
+
+
+class ShardReport:
+    """Select the files of a shard and record their results for `merge`.
+
+    Without a shard, all the files are checked and nothing is written. The
+    files are then read from `file_paths` as the report is iterated, so that
+    files discovered in a project are checked as soon as they are found, and
+    `file_paths` lists the files iterated so far. A shard is balanced over all
+    the files, so they are all read first.
+    """
+
+    def __init__(
+        self,
+        hook: str,
+        file_paths: Iterable[str],
+        shard: Optional[Shard] = None,
+        output: Optional[str] = None,
+    ) -> None:
+        self.hook = hook
+        self.shard = shard
+        paths = (os.path.normpath(path) for path in file_paths)
+        self.pending: Optional[Iterator[str]] = None
+        if shard is None:
+            self.all_file_paths: List[str] = []
+            self.file_paths = self.all_file_paths
+            self.pending = paths
+            self.output = None
+        else:
+            self.all_file_paths = list(paths)
+            self.file_paths = partition_by_size(self.all_file_paths, shard.count)[
+                shard.index - 1
+            ]
+            self.output = (
+                output
+                or f"lightdash-pre-commit-{hook}-{shard.index}-of-{shard.count}.json"
+            )
+        self.results: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_args(cls, hook: str, args: argparse.Namespace) -> "ShardReport":
+        return cls(hook, iter_file_paths(args), args.shard, args.shard_output)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the files of the shard."""
+        yield from self.file_paths
+        if self.pending is not None:
+            for file_path in self.pending:
+                self.file_paths.append(file_path)
+                yield file_path
+            self.pending = None
+
+    def read_all_file_paths(self) -> List[str]:
+        """Read all the files, e.g., to index the whole project before checking any."""
+        for _ in self:
+            pass
+        return self.all_file_paths
+
+    def add(self, file_path: str, errors: Sequence[str]) -> None:
+        """Record the errors of a file."""
+        if errors:
+            self.results.setdefault(os.path.normpath(file_path), []).extend(errors)
+
+    def write(self, exit_code: int) -> None:
+        """Write the partial result file of the shard, if any."""
+        if self.shard is None or self.output is None:
+            return
+        output_dir = os.path.dirname(self.output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        partial = {
+            "format_version": SHARD_FORMAT_VERSION,
+            "hook": self.hook,
+            "shard": {"index": self.shard.index, "count": self.shard.count},
+            "files": self.all_file_paths,
+            "results": [
+                {"file": file_path, "errors": errors}
+                for file_path, errors in self.results.items()
+            ],
+            "exit_code": exit_code,
+        }
+        with open(self.output, "w", encoding="utf-8") as file:
+            json.dump(partial, file, indent=2)
+
+
+def _load_partial(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            partial = json.load(file)
+    except (OSError, ValueError) as e:
+        raise ShardError(f"Failed to read partial results '{path}': {e}") from e
+    if (
+        not isinstance(partial, dict)
+        or partial.get("format_version") != SHARD_FORMAT_VERSION
+    ):
+        raise ShardError(f"Unsupported partial results '{path}'")
+    return partial
+
+
+def merge_partials(paths: Sequence[str]) -> Tuple[List[Tuple[str, List[str]]], int]:
+    """Combine the partial result files of the shards of one or more hooks.
+
+    Files are reported in the order they were passed to the hooks, and
+    identical errors reported for a file by several shards are only kept once.
+
+    Args:
+        paths: Paths of the partial result files
+
+    Returns:
+        The errors of each file, and the exit code of the whole run
+
+    Raises:
+        ShardError: If a file cannot be read, or the shards of a hook are
+            inconsistent or incomplete
+    """
+    shards_by_hook: Dict[str, Dict[int, dict]] = {}
+    counts: Dict[str, int] = {}
+    for path in paths:
+        partial = _load_partial(path)
+        hook = partial["hook"]
+        shard = Shard(partial["shard"]["index"], partial["shard"]["count"])
+        if counts.setdefault(hook, shard.count) != shard.count:
+            raise ShardError(
+                f"Partial results '{path}' of '{hook}' were split into {shard.count} "
+                f"shards, not {counts[hook]}"
+            )
+        if shard.index in shards_by_hook.setdefault(hook, {}):
+            raise ShardError(f"Shard {shard} of '{hook}' is given more than once")
+        shards_by_hook[hook][shard.index] = partial
+
+    file_order: Dict[str, int] = {}
+    exit_code = 0
+    errors_by_file: Dict[str, Dict[str, None]] = {}
+    for hook, shards in shards_by_hook.items():
+        missing = [
+            str(Shard(index, counts[hook]))
+            for index in range(1, counts[hook] + 1)
+            if index not in shards
+        ]
+        if missing:
+            raise ShardError(f"Missing shards of '{hook}': {', '.join(missing)}")
+        for index in sorted(shards):
+            partial = shards[index]
+            for file_path in partial["files"]:
+                file_order.setdefault(file_path, len(file_order))
+            for result in partial["results"]:
+                errors = errors_by_file.setdefault(result["file"], {})
+                errors.update(dict.fromkeys(result["errors"]))
+            exit_code = max(exit_code, int(partial.get("exit_code", 0)))
+
+    results = [
+        (file_path, list(errors))
+        for file_path, errors in sorted(
+            errors_by_file.items(),
+            key=lambda item: (file_order.get(item[0], len(file_order)), item[0]),
+        )
+        if errors
+    ]
+    if results:
+        exit_code = max(exit_code, 1)
+    return results, exit_code
@@ -0,0 +1,66 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, Tuple
+
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import TimeInterval
+
+# Suffix of the dimension Lightdash generates for each time interval, e.g.,
+# `created_at_month_num` for MONTH_NUM of `created_at`
+TIME_INTERVAL_SUFFIXES: Dict[str, str] = {
+    interval.value: f"_{interval.value.lower()}" for interval in TimeInterval
+}
+
+# Time intervals Lightdash generates by default for each dimension type
+DEFAULT_TIME_INTERVALS: Dict[str, Tuple[str, ...]] = {
+    "timestamp": ("RAW", "DAY", "WEEK", "MONTH", "QUARTER", "YEAR"),
+    "date": ("DAY", "WEEK", "MONTH", "QUARTER", "YEAR"),
+}
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def time_intervals(dimension: Any) -> Tuple[str, ...]:
+    """Get the time intervals Lightdash generates dimensions for.
+
+    Explicit intervals are generated whatever the type of the dimension, as
+    the type of a column may come from the warehouse. The default intervals
+    only apply to the dimensions typed as `timestamp` or `date`.
+
+    Args:
+        dimension: `Dimension` or `AdditionalDimensions` of either parser
+    """
+    if dimension is None:
+        return ()
+    intervals = getattr(dimension, "time_intervals", None)
+    if isinstance(intervals, list):
+        return tuple(_value(interval) for interval in intervals)
+    if _value(intervals) == "OFF":
+        return ()
+    return DEFAULT_TIME_INTERVALS.get(_value(getattr(dimension, "type", None)), ())
+
+
+def generated_names(name: str, dimension: Any) -> List[Tuple[str, str]]:
+    """Get the names of the dimensions Lightdash generates for a time dimension.
+
+    Returns:
+        Tuples of (time interval, generated name)
+    """
+    return [
+        (interval, name + TIME_INTERVAL_SUFFIXES[interval])
+        for interval in time_intervals(dimension)
+        if interval in TIME_INTERVAL_SUFFIXES
+    ]
@@ -0,0 +1,254 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from lightdash_pre_commit.hooks.base import BaseChecker
+
+VISITOR_METHODS = (
+    "visit_model",
+    "leave_model",
+    "visit_column",
+    "visit_metric",
+    "visit_dimension",
+)
+
+
+@dataclass(frozen=True)
+class ModelNode:
+    """A model of a schema document."""
+
+    model: Any
+    name: str
+    meta: Optional[Any]
+    index: int
+    # The raw mapping the model was validated from, when available. It gives
+    # access to keys the generated parsers drop, such as join aliases.
+    raw: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class ColumnNode:
+    """A named column of a model."""
+
+    model: ModelNode
+    column: Any
+    name: str
+    meta: Optional[Any]
+
+
+@dataclass(frozen=True)
+class MetricNode:
+    """A metric defined at the model level or in a column."""
+
+    model: ModelNode
+    name: str
+    metric: Any
+    # None for model-level metrics
+    column: Optional[ColumnNode]
+
+
+@dataclass(frozen=True)
+class DimensionNode:
+    """A dimension derived from a column or one of its additional dimensions."""
+
+    model: ModelNode
+    name: str
+    # None when the column has no explicit `dimension` block
+    dimension: Optional[Any]
+    column: ColumnNode
+    additional: bool
+
+
+@dataclass
+class TraversalResult:
+    """Errors and timings of the checkers run over a document."""
+
+    errors: List[str] = field(default_factory=list)
+    errors_by_checker: Dict[str, List[str]] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def get_meta(node: Any) -> Optional[Any]:
+    """Get the Lightdash meta of a model or column in either dbt layout.
+
+    dbt 1.9 or earlier puts `meta` directly on the model or column, while
+    dbt 1.10 or later nests it under `config`.
+    """
+    meta = getattr(node, "meta", None)
+    if meta:
+        return meta
+    config = getattr(node, "config", None)
+    if config:
+        return getattr(config, "meta", None) or None
+    return None
+
+
+def get_raw_meta(raw: Any) -> Dict[str, Any]:
+    """Get the raw Lightdash meta mapping of a model or column in either dbt layout."""
+    if not isinstance(raw, dict):
+        return {}
+    meta = raw.get("meta")
+    if not meta:
+        config = raw.get("config")
+        meta = config.get("meta") if isinstance(config, dict) else None
+    return meta if isinstance(meta, dict) else {}
+
+
+class _Dispatcher:
+    """Calls the callbacks registered for a node kind and accumulates their timings."""
+
+    def __init__(self, checkers: Sequence["BaseChecker"]) -> None:
+        self.timings: Dict[str, float] = {
+            type(checker).__name__: 0.0 for checker in checkers
+        }
+        self.callbacks: Dict[str, List[Tuple[str, Callable[[Any], None]]]] = {
+            method: [] for method in VISITOR_METHODS
+        }
+        for checker in checkers:
+            for method, callback in checker.registered_callbacks().items():
+                self.callbacks[method].append((type(checker).__name__, callback))
+
+    def dispatch(self, method: str, node: Any) -> None:
+        timings = self.timings
+        for name, callback in self.callbacks[method]:
+            start = time.perf_counter()
+            callback(node)
+            timings[name] += time.perf_counter() - start
+
+    def has(self, method: str) -> bool:
+        return bool(self.callbacks[method])
+
+
+def walk_document(
+    data: Any, dispatcher: _Dispatcher, raw_data: Optional[Dict[str, Any]] = None
+) -> None:
+    """Traverse the models of a document once, dispatching every node."""
+    if not data.models:
+        return
+    raw_models = (raw_data or {}).get("models") or []
+
+    want_columns = dispatcher.has("visit_column")
+    want_metrics = dispatcher.has("visit_metric")
+    want_dimensions = dispatcher.has("visit_dimension")
+    want_fields = want_columns or want_metrics or want_dimensions
+
+    for index, model in enumerate(data.models):
+        model_node = ModelNode(
+            model=model,
+            name=model.name or "unknown_model",
+            meta=get_meta(model),
+            index=index,
+            raw=raw_models[index] if index < len(raw_models) else None,
+        )
+        dispatcher.dispatch("visit_model", model_node)
+
+        if want_metrics and model_node.meta and model_node.meta.metrics:
+            for metric_name, metric in model_node.meta.metrics.items():
+                dispatcher.dispatch(
+                    "visit_metric",
+                    MetricNode(
+                        model=model_node, name=metric_name, metric=metric, column=None
+                    ),
+                )
+
+        if want_fields and getattr(model, "columns", None):
+            for column in model.columns:
+                if not getattr(column, "name", None):
+                    continue
+                _walk_column(model_node, column, dispatcher)
+
+        dispatcher.dispatch("leave_model", model_node)
+
+
+def _walk_column(model_node: ModelNode, column: Any, dispatcher: _Dispatcher) -> None:
+    column_meta = get_meta(column)
+    column_node = ColumnNode(
+        model=model_node, column=column, name=column.name, meta=column_meta
+    )
+    dispatcher.dispatch("visit_column", column_node)
+
+    # The column name itself becomes a dimension
+    dispatcher.dispatch(
+        "visit_dimension",
+        DimensionNode(
+            model=model_node,
+            name=column.name,
+            dimension=column_meta.dimension if column_meta else None,
+            column=column_node,
+            additional=False,
+        ),
+    )
+    if not column_meta:
+        return
+
+    if column_meta.additional_dimensions:
+        for dimension_name, dimension in column_meta.additional_dimensions.items():
+            dispatcher.dispatch(
+                "visit_dimension",
+                DimensionNode(
+                    model=model_node,
+                    name=dimension_name,
+                    dimension=dimension,
+                    column=column_node,
+                    additional=True,
+                ),
+            )
+
+    if column_meta.metrics:
+        for metric_name, metric in column_meta.metrics.items():
+            dispatcher.dispatch(
+                "visit_metric",
+                MetricNode(
+                    model=model_node,
+                    name=metric_name,
+                    metric=metric,
+                    column=column_node,
+                ),
+            )
+
+
+def run_checkers(
+    data: Any,
+    checkers: Sequence["BaseChecker"],
+    raw_data: Optional[Dict[str, Any]] = None,
+) -> TraversalResult:
+    """Run all the checkers over a document in a single traversal.
+
+    Args:
+        data: Parsed document (e.g., LightdashV20, LightdashV25)
+        checkers: Checker instances to drive
+        raw_data: Raw YAML data the document was validated from
+
+    Returns:
+        The errors of all the checkers in order, and the time spent in each checker
+    """
+    dispatcher = _Dispatcher(checkers)
+    for checker in checkers:
+        checker.start_document(data)
+
+    walk_document(data, dispatcher, raw_data)
+
+    result = TraversalResult(timings=dispatcher.timings)
+    for checker in checkers:
+        name = type(checker).__name__
+        start = time.perf_counter()
+        errors = checker.finish_document(data)
+        result.timings[name] += time.perf_counter() - start
+        result.errors_by_checker[name] = errors
+        result.errors.extend(errors)
+    return result
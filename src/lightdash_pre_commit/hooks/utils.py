@@ -12,60 +12,351 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional, Tuple, Type
+import argparse
+import os
+import time
+from contextlib import nullcontext
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import yaml  # type: ignore[import-untyped]
 from pydantic import BaseModel, ValidationError
 
 from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import file_signature
+from lightdash_pre_commit.hooks.discovery import walk_yaml_files
+from lightdash_pre_commit.hooks.history import RunRecorder
+from lightdash_pre_commit.hooks.incremental import ModelResultCache, model_fingerprint
+from lightdash_pre_commit.hooks.limits import (
+    ResourceLimitError,
+    ResourceLimits,
+    load_yaml_document,
+    time_limit,
+)
+from lightdash_pre_commit.hooks.parallel import ModelPool, check_model_chunk
+from lightdash_pre_commit.hooks.sharding import ShardReport
+from lightdash_pre_commit.hooks.traversal import run_checkers
+from lightdash_pre_commit.hooks.validation import render_validation_error
+from lightdash_pre_commit.parsers.anchors import substitute_shared
+from lightdash_pre_commit.parsers.projection import project_document
+
+CheckerSpec = Union[Type[BaseChecker], BaseChecker]
+
+
+def validate_document(
+    file_path: str,
+    raw_data: dict,
+    validator_class: Type[BaseModel],
+    projection: bool = True,
+    shared: Optional[Dict[int, Any]] = None,
+) -> Tuple[Optional[BaseModel], Optional[str]]:
+    """Parse YAML data with a Pydantic model.
+
+    Args:
+        shared: Objects shared by the aliases of the document, by id, which
+            are validated once rather than at each occurrence
+
+    Returns:
+        Tuple of (parsed document, rendered validation error), one of them None
+    """
+    document = project_document(raw_data) if projection else raw_data
+    if shared:
+        document = substitute_shared(validator_class, document, shared)
+    try:
+        return validator_class.model_validate(document), None
+    except ValidationError as ve:
+        return None, render_validation_error(file_path, ve, validator_class)
 
 
 def check_validation_errors(
-    file_path: str, raw_data: dict, validator_class: Type[BaseModel]
+    file_path: str,
+    raw_data: dict,
+    validator_class: Type[BaseModel],
+    projection: bool = True,
 ) -> Optional[str]:
     """Check for validation errors when parsing YAML data with Pydantic model."""
-    try:
-        validator_class.model_validate(raw_data)
+    return validate_document(file_path, raw_data, validator_class, projection)[1]
+
+
+def as_checkers(
+    checker_class: Union[CheckerSpec, Sequence[CheckerSpec]],
+) -> List[BaseChecker]:
+    """Normalize checker classes and instances into a list of checker instances."""
+    specs = (
+        checker_class
+        if isinstance(checker_class, (list, tuple))
+        else [checker_class]  # type: ignore[list-item]
+    )
+    return [spec() if isinstance(spec, type) else spec for spec in specs]
+
+
+def check_models(
+    raw_data: Any,
+    validator_class: Type[BaseModel],
+    checkers: List[BaseChecker],
+    model_cache: Optional[ModelResultCache] = None,
+    pool: Optional[ModelPool] = None,
+    projection: bool = True,
+    shared: Optional[Dict[int, Any]] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Optional[List[str]]:
+    """Validate and check the models of a document one by one.
+
+    With a cache, each model whose raw subtree has a cached fingerprint reuses
+    its stored errors. The other models are validated together with the rest
+    of the document, in chunks across the workers of the pool if any, and
+    checked one by one so that their errors can be stored.
+
+    Returns:
+        The errors of all the models in order, or None if the document has to
+        be processed as a whole, e.g., to report its validation errors with
+        the locations of the whole document
+    """
+    document = project_document(raw_data) if projection else raw_data
+    models = document.get("models") if isinstance(document, dict) else None
+    if not isinstance(models, list) or not all(
+        isinstance(model, dict) for model in models
+    ):
         return None
-    except ValidationError as ve:
-        return f"Validation error in '{file_path}': {ve}"
+    # The checkers read the raw models as written, as in the whole document
+    raw_models = raw_data["models"]
+
+    fingerprints: List[str] = []
+    results: List[Optional[List[str]]] = [None] * len(models)
+    if model_cache is not None:
+        fingerprints = [model_fingerprint(model) for model in raw_models]
+        results = [model_cache.get(fingerprint) for fingerprint in fingerprints]
+    changed = [index for index, errors in enumerate(results) if errors is None]
+
+    # The rest of the document is validated on every run, as it is small
+    partial = {key: value for key, value in document.items() if key != "models"}
+    partial["models"] = [models[index] for index in changed]
+    if shared:
+        partial = substitute_shared(validator_class, partial, shared)
+    rest = {key: value for key, value in partial.items() if key != "models"}
+    changed_raw = [raw_models[index] for index in changed]
+    if pool is not None:
+        changed_errors, checker_timings = pool.check(
+            validator_class, checkers, rest, partial["models"], changed_raw
+        )
+    else:
+        changed_errors, checker_timings = check_model_chunk(
+            validator_class, checkers, rest, partial["models"], changed_raw
+        )
+    if changed_errors is None:
+        return None
+
+    if timings is not None:
+        for name, elapsed in checker_timings.items():
+            timings[name] = timings.get(name, 0.0) + elapsed
+    for index, errors in zip(changed, changed_errors, strict=True):
+        if model_cache is not None:
+            model_cache.put(fingerprints[index], errors)
+        results[index] = errors
+    return [error for errors in results for error in errors or []]
+
+
+def _stage(recorder: Optional[RunRecorder], name: str) -> ContextManager[None]:
+    return recorder.stage(name) if recorder is not None else nullcontext()
 
 
 def process_single_file(
     file_path: str,
     validator_class: Type[BaseModel],
-    checker_class: Type[BaseChecker],
+    checker_class: Union[CheckerSpec, Sequence[CheckerSpec]],
+    timings: Optional[Dict[str, float]] = None,
+    limits: Optional[ResourceLimits] = None,
+    projection: bool = True,
+    recorder: Optional[RunRecorder] = None,
+    model_cache: Optional[ModelResultCache] = None,
+    pool: Optional[ModelPool] = None,
+    duplicate_keys: bool = False,
 ) -> Tuple[List[str], bool]:
     """Process a single file and return errors and success status.
 
     Args:
         file_path: Path to the file to process
         validator_class: Pydantic model class for validation (e.g., LightdashV20, LightdashV25)
-        checker_class: Checker class for duplicate detection (e.g., FindDuplicateDimensionsAndMetricsV1)
+        checker_class: Checker class or instance for duplicate detection
+            (e.g., FindDuplicateDimensionsAndMetricsV1), or a sequence of them
+            to run in a single traversal
+        timings: Optional mapping accumulating the time spent in each checker
+        limits: Resource limits of the file (default: ResourceLimits())
+        projection: Whether to leave the subtrees Lightdash does not read, such
+            as dbt tests and sources, unvalidated
+        recorder: Optional recorder of the run, accumulating the time spent
+            loading, validating and checking, and the time spent on the file,
+            and counting the files whose models all hit the model cache
+        model_cache: Optional cache of the errors of unchanged models, used if
+            all the checkers are model-scoped
+        pool: Optional pool of workers validating and checking the models of
+            large documents, used if all the checkers are model-scoped
+        duplicate_keys: Whether to report the keys repeated within a mapping,
+            whose earlier values the checkers never see
 
     Returns:
         Tuple of (errors, success_status)
     """
+    limits = limits or ResourceLimits()
+    start = time.perf_counter()
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            raw_data = yaml.safe_load(file)
+        with time_limit(limits.timeout):
+            with _stage(recorder, "load"):
+                document = load_yaml_document(file_path, limits, duplicate_keys)
+            raw_data = document.data
+            key_errors = [
+                f"Duplicate key '{duplicate.key}' at line {duplicate.line} of "
+                f"'{file_path}', first defined at line {duplicate.first_line}"
+                for duplicate in document.duplicate_keys
+            ]
 
             # Skip empty or None data
             if not raw_data:
-                return [], True
+                return key_errors, not key_errors
+
+            checkers = as_checkers(checker_class)
+            if (model_cache is not None or pool is not None) and all(
+                checker.model_scoped for checker in checkers
+            ):
+                hits, misses = (
+                    (model_cache.hits, model_cache.misses) if model_cache else (0, 0)
+                )
+                with _stage(recorder, "model check"):
+                    errors = check_models(
+                        raw_data,
+                        validator_class,
+                        checkers,
+                        model_cache,
+                        pool,
+                        projection,
+                        document.shared,
+                        timings,
+                    )
+                if (
+                    errors is not None
+                    and recorder is not None
+                    and model_cache is not None
+                    and model_cache.hits > hits
+                    and model_cache.misses == misses
+                ):
+                    # Every model of the file reused its cached errors
+                    recorder.cache_hits += 1
+                if errors is not None:
+                    errors = key_errors + errors
+                    return errors, len(errors) == 0
 
             # Parse the YAML data using the Pydantic model
-            validation_error = check_validation_errors(
-                file_path, raw_data, validator_class
-            )
+            with _stage(recorder, "validate"):
+                lightdash_data, validation_error = validate_document(
+                    file_path, raw_data, validator_class, projection, document.shared
+                )
             if validation_error:
-                return [validation_error], False
+                return key_errors + [validation_error], False
 
-            lightdash_data = validator_class.model_validate(raw_data)
-            # Use type: ignore to bypass type checker for this specific case
-            duplicate_errors = checker_class.check(data=lightdash_data)  # type: ignore[arg-type]
+            with _stage(recorder, "check"):
+                result = run_checkers(lightdash_data, checkers, raw_data)
+            if timings is not None:
+                for name, elapsed in result.timings.items():
+                    timings[name] = timings.get(name, 0.0) + elapsed
 
-            return duplicate_errors, len(duplicate_errors) == 0
+            errors = key_errors + result.errors
+            return errors, len(errors) == 0
 
-    except (FileNotFoundError, yaml.YAMLError, OSError) as e:
+    except (FileNotFoundError, yaml.YAMLError, OSError, ResourceLimitError) as e:
         return [f"Failed to process '{file_path}': {e}"], False
+    finally:
+        if recorder is not None:
+            recorder.add_file(file_path, time.perf_counter() - start)
+
+
+def update_file_index(
+    index: Any,
+    file_paths: Sequence[str],
+    validator_class: Type[BaseModel],
+    collector_class: Callable[[], BaseChecker],
+    store: Callable[[str, List[int], Any], None],
+    limits: Optional[ResourceLimits] = None,
+    recorder: Optional[RunRecorder] = None,
+) -> Dict[str, List[str]]:
+    """Re-index the files that changed since they were indexed.
+
+    A file that fails to load or validate is dropped from the index rather than
+    recorded with its signature, so that it is parsed and reported again by the
+    next run instead of being skipped as fresh.
+
+    Args:
+        index: Index of the files, with `is_fresh` and `remove_file` methods
+        file_paths: Paths of the files to re-index
+        validator_class: Pydantic model class for validation
+        collector_class: Factory of the checker collecting the data of a file
+        store: Callback storing the collector of a parsed file into the index,
+            given the path and signature of the file
+        limits: Resource limits of the files (default: ResourceLimits())
+        recorder: Optional recorder of the run, counting the fresh files as
+            cache hits
+
+    Returns:
+        Errors of the files that could not be parsed
+    """
+    file_errors: Dict[str, List[str]] = {}
+    for file_path in file_paths:
+        signature = file_signature(file_path)
+        if signature is None:
+            index.remove_file(file_path)
+            file_errors[file_path] = [
+                f"Failed to process '{file_path}': file not found"
+            ]
+            continue
+        if index.is_fresh(file_path, signature):
+            if recorder is not None:
+                recorder.cache_hits += 1
+            continue
+        collector = collector_class()
+        errors, success = process_single_file(
+            file_path, validator_class, collector, limits=limits, recorder=recorder
+        )
+        if success:
+            store(file_path, signature, collector)
+        else:
+            index.remove_file(file_path)
+            file_errors[file_path] = errors
+    return file_errors
+
+
+def read_project_files(
+    hook: str, args: argparse.Namespace, indexed_files: Sequence[str] = ()
+) -> Tuple[ShardReport, List[str], RunRecorder]:
+    """Read the files a project-wide hook indexes, and those it reports.
+
+    All the files of the hook are indexed, but only the files of its shard are
+    reported. The files under the `--search-path` directories are indexed too,
+    skipping those ignored by git, and so are the previously indexed files, so
+    that deleted files are dropped.
+
+    Args:
+        hook: Name of the hook
+        args: Arguments of the hook
+        indexed_files: Files of the persisted index of the hook, if any
+
+    Returns:
+        Tuple of (report of the shard, files to index, recorder of the run)
+    """
+    report = ShardReport.from_args(hook, args)
+    project_paths = list(report.read_all_file_paths())
+    for search_path in args.search_path:
+        project_paths.extend(
+            os.path.normpath(path) for path in walk_yaml_files(search_path)
+        )
+    project_paths.extend(indexed_files)
+    project_paths = list(dict.fromkeys(project_paths))
+    return report, project_paths, RunRecorder.from_args(hook, args, project_paths)
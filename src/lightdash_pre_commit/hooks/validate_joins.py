@@ -0,0 +1,193 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Dict, List, Optional, Sequence
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.cache import add_cache_arguments, load_cache, save_cache
+from lightdash_pre_commit.hooks.discovery import add_discovery_arguments
+from lightdash_pre_commit.hooks.history import RunRecorder, add_history_arguments
+from lightdash_pre_commit.hooks.join_graph import JoinEdge, JoinGraphIndex
+from lightdash_pre_commit.hooks.limits import ResourceLimits, add_limit_arguments
+from lightdash_pre_commit.hooks.projects import add_project_arguments, run_per_project
+from lightdash_pre_commit.hooks.sharding import add_shard_arguments
+from lightdash_pre_commit.hooks.time_intervals import generated_names
+from lightdash_pre_commit.hooks.traversal import (
+    DimensionNode,
+    MetricNode,
+    ModelNode,
+    get_raw_meta,
+)
+from lightdash_pre_commit.hooks.utils import read_project_files, update_file_index
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+CACHE_KIND = "join_graph"
+
+
+class JoinCollector(BaseChecker):
+    """Collect the joins and fields of each model for the join graph index."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.models: Dict[str, List[JoinEdge]] = {}
+        self.fields: Dict[str, List[str]] = {}
+        self.time_fields: Dict[str, Dict[str, List[str]]] = {}
+
+    def start_document(self, data) -> None:
+        super().start_document(data)
+        self.models = {}
+        self.fields = {}
+        self.time_fields = {}
+
+    def visit_model(self, node: ModelNode) -> None:
+        joins = node.meta.joins if node.meta and node.meta.joins else []
+        # The generated parsers drop `alias`, so read it from the raw mapping
+        raw_joins = get_raw_meta(node.raw).get("joins")
+        if not isinstance(raw_joins, list) or len(raw_joins) != len(joins):
+            raw_joins = [{}] * len(joins)
+        edges = self.models.setdefault(node.name, [])
+        self.fields.setdefault(node.name, [])
+        for join, raw_join in zip(joins, raw_joins, strict=True):
+            if not isinstance(raw_join, dict):
+                raw_join = {}
+            alias = raw_join.get("alias")
+            fields = raw_join.get("fields")
+            edges.append(
+                JoinEdge(
+                    target=join.join,
+                    alias=str(alias or join.join),
+                    always=bool(join.always),
+                    sql_on=join.sql_on,
+                    fields=(
+                        tuple(str(field) for field in fields)
+                        if isinstance(fields, list)
+                        else None
+                    ),
+                )
+            )
+
+    def visit_metric(self, node: MetricNode) -> None:
+        self.fields[node.model.name].append(node.name)
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        self.fields[node.model.name].append(node.name)
+        names = [name for _, name in generated_names(node.name, node.dimension)]
+        if names:
+            self.time_fields.setdefault(node.model.name, {})[node.name] = names
+
+
+def update_index(
+    index: JoinGraphIndex,
+    file_paths: Sequence[str],
+    limits: Optional[ResourceLimits] = None,
+    recorder: Optional[RunRecorder] = None,
+) -> Dict[str, List[str]]:
+    """Re-index the files that changed since they were indexed.
+
+    Files that could not be parsed are dropped from the index, so that their
+    errors are reported again by the next run.
+
+    Returns:
+        Errors of the files that could not be parsed
+    """
+
+    def _store(file_path: str, signature: List[int], collector: JoinCollector) -> None:
+        index.update_file(
+            file_path,
+            signature,
+            collector.models,
+            collector.fields,
+            collector.time_fields,
+        )
+
+    return update_file_index(
+        index,
+        file_paths,
+        LightdashV25,
+        JoinCollector,
+        _store,
+        limits=limits,
+        recorder=recorder,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the hook."""
+    parser = argparse.ArgumentParser(
+        description="Validate the joins of Lightdash explores in dbt schema files"
+    )
+    parser.add_argument("filenames", nargs="*", help="Filenames to check")
+    parser.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Directory whose YAML files are indexed to resolve join targets (repeatable)",
+    )
+    add_cache_arguments(parser, "the join graph")
+    add_discovery_arguments(parser)
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_history_arguments(parser)
+    add_project_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.per_project:
+        return run_per_project(parser, run, args)
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the hook over the files of its arguments."""
+    if not args.filenames and args.project_dir is None:
+        print("No files provided.")
+        return 0
+
+    cache_path = (
+        os.path.join(args.cache_dir, f"{CACHE_KIND}.json") if args.cache_dir else None
+    )
+    index = JoinGraphIndex.from_dict(
+        load_cache(cache_path, CACHE_KIND) if cache_path else {}
+    )
+
+    report, project_paths, recorder = read_project_files(
+        "validate-joins", args, index.indexed_files()
+    )
+    file_errors = update_index(
+        index, project_paths, ResourceLimits.from_args(args), recorder
+    )
+
+    exit_code = 0
+    for file_path in report:
+        errors = list(file_errors.get(file_path, []))
+        explores = index.resolve(index.models_in_file(file_path))
+        for explore_errors in explores.values():
+            errors.extend(explore_errors)
+        report.add(file_path, errors)
+        if errors:
+            exit_code = 1
+            print(f"Errors found in '{file_path}':")
+            for error in errors:
+                print(f"  {error}")
+
+    if cache_path:
+        with recorder.stage("save cache"):
+            save_cache(cache_path, CACHE_KIND, index.to_dict())
+    report.write(exit_code)
+    recorder.write(exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,279 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, RootModel, ValidationError
+
+# Maximum number of locations reported per file
+MAX_ERRORS = 20
+# Maximum length of the rendered input of an error
+MAX_INPUT_LENGTH = 40
+
+_UNION_TYPES: Tuple[Any, ...] = (Union,)
+try:
+    from types import UnionType
+
+    _UNION_TYPES += (UnionType,)
+except ImportError:  # pragma: no cover
+    pass
+
+
+@dataclass
+class _LineError:
+    """An error of a validation, with the positions of the union tags in its location."""
+
+    order: int
+    loc: Tuple[Any, ...]
+    tags: List[int]
+    error: Dict[str, Any]
+
+    @property
+    def depth(self) -> int:
+        return len(self.loc) - len(self.tags)
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strip Optional, Annotated and RootModel wrappers, which add nothing to locations."""
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+        elif origin in _UNION_TYPES:
+            members = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(members) != 1:
+                return annotation
+            annotation = members[0]
+        elif inspect.isclass(annotation) and issubclass(annotation, RootModel):
+            annotation = annotation.model_fields["root"].annotation
+        else:
+            return annotation
+
+
+def union_tag_positions(
+    parser_class: Type[BaseModel], loc: Tuple[Any, ...]
+) -> Tuple[int, ...]:
+    """Find the elements of an error location that are union tags.
+
+    pydantic inserts the name of the branch in the location of the errors of
+    each branch of a union, e.g. `('models', 0, 'Models1', 'name')`. They can't
+    be told apart from field names without the annotations, so the location is
+    walked along the annotations of the parser. List indexes never matter, so
+    the walks are cached by the shape of the location.
+    """
+    shape = tuple(None if isinstance(element, int) else element for element in loc)
+    return _union_tag_positions(parser_class, shape)
+
+
+@lru_cache(maxsize=4096)
+def _union_tag_positions(
+    parser_class: Type[BaseModel], loc: Tuple[Any, ...]
+) -> Tuple[int, ...]:
+    positions: List[int] = []
+    annotation: Any = parser_class
+    index = 0
+    while index < len(loc):
+        annotation = _unwrap(annotation)
+        origin = get_origin(annotation)
+        if origin in _UNION_TYPES:
+            positions.append(index)
+            members = [
+                member
+                for member in get_args(annotation)
+                if inspect.isclass(member)
+                and issubclass(member, BaseModel)
+                and member.__name__ == loc[index]
+            ]
+            if not members:
+                break
+            annotation = members[0]
+            index += 1
+        elif inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            field = annotation.model_fields.get(loc[index])
+            if field is None:
+                break
+            annotation = field.annotation
+            index += 1
+        elif origin in (list, tuple, set, frozenset):
+            annotation = get_args(annotation)[0] if get_args(annotation) else Any
+            index += 1
+        elif origin is dict:
+            annotation = get_args(annotation)[1] if get_args(annotation) else Any
+            index += 1
+        else:
+            break
+    return tuple(positions)
+
+
+def _reduce(line_errors: List[_LineError]) -> List[_LineError]:
+    """Keep the errors of the most plausible branch of every failing union.
+
+    A branch whose input has the wrong type is the least plausible, then the
+    branch whose errors go the deepest into the input, then the branch with the
+    fewest errors, and then the first branch.
+    """
+    reduced: List[_LineError] = []
+    unions: Dict[Tuple[Any, ...], Dict[Any, List[_LineError]]] = {}
+    for line_error in line_errors:
+        if not line_error.tags:
+            reduced.append(line_error)
+            continue
+        position = line_error.tags[0]
+        branches = unions.setdefault(line_error.loc[:position], {})
+        branches.setdefault(line_error.loc[position], []).append(line_error)
+
+    for prefix, branches in unions.items():
+        position = len(prefix)
+        candidates = []
+        for branch_order, branch_errors in enumerate(branches.values()):
+            # Drop the tag of the branch and reduce its own unions first
+            branch_errors = _reduce(
+                [
+                    _LineError(
+                        order=line_error.order,
+                        loc=line_error.loc[:position] + line_error.loc[position + 1 :],
+                        tags=[tag - 1 for tag in line_error.tags[1:]],
+                        error=line_error.error,
+                    )
+                    for line_error in branch_errors
+                ]
+            )
+            # e.g., `list_type` or `model_type` at the root of the branch
+            mismatch = any(
+                len(line_error.loc) == position
+                and line_error.error["type"].endswith("_type")
+                for line_error in branch_errors
+            )
+            candidates.append(
+                (
+                    mismatch,
+                    -max(line_error.depth for line_error in branch_errors),
+                    len(branch_errors),
+                    branch_order,
+                    branch_errors,
+                )
+            )
+        reduced.extend(min(candidates, key=lambda candidate: candidate[:4])[4])
+    return sorted(reduced, key=lambda line_error: line_error.order)
+
+
+def render_location(loc: Tuple[Any, ...]) -> str:
+    """Render an error location like `models[0].columns[2].name`."""
+    rendered = ""
+    for element in loc:
+        if isinstance(element, int):
+            rendered += f"[{element}]"
+        elif element == "[key]":
+            rendered += " (key)"
+        else:
+            rendered += f".{element}" if rendered else str(element)
+    return rendered or "(document)"
+
+
+def _render_input(value: Any) -> str:
+    if not isinstance(value, (str, int, float, bool)) and value is not None:
+        return ""
+    rendered = repr(value)
+    if len(rendered) > MAX_INPUT_LENGTH:
+        rendered = rendered[: MAX_INPUT_LENGTH - 3] + "..."
+    return f" (input: {rendered})"
+
+
+def reduce_validation_error(
+    error: ValidationError,
+    parser_class: Type[BaseModel],
+    max_locations: Optional[int] = None,
+) -> Tuple[List[Tuple[str, List[str]]], int, bool]:
+    """Reduce a validation error to the messages of the most plausible branches.
+
+    The errors are reduced one outermost union at a time, and the reduction
+    stops once `max_locations` locations are found, so that a file with
+    thousands of broken columns costs no more than a few of them.
+
+    Returns:
+        The messages grouped by location in the order of the errors, the number
+        of locations left out, and whether that number is exact rather than a
+        lower bound
+    """
+    outermost: Dict[Tuple[Any, ...], List[Tuple[int, Tuple[int, ...]]]] = {}
+    line_errors = error.errors(include_url=False, include_context=False)
+    for order, line_error in enumerate(line_errors):
+        loc = line_error["loc"]
+        tags = union_tag_positions(parser_class, loc)
+        outermost.setdefault(loc[: tags[0]] if tags else loc, []).append((order, tags))
+
+    grouped: Dict[str, Dict[str, None]] = {}
+    unreduced = 0
+    for index, members in enumerate(outermost.values()):
+        if max_locations is not None and len(grouped) >= max_locations:
+            # Each union left out holds at least one invalid location
+            unreduced = len(outermost) - index
+            break
+        reduced = _reduce(
+            [
+                _LineError(
+                    order=order,
+                    loc=line_errors[order]["loc"],
+                    tags=list(tags),
+                    error=line_errors[order],
+                )
+                for order, tags in members
+            ]
+        )
+        for line_error in reduced:
+            message = line_error.error["msg"]
+            if line_error.error["type"] != "missing":
+                message += _render_input(line_error.error.get("input"))
+            grouped.setdefault(render_location(line_error.loc), {})[message] = None
+
+    locations = [(location, list(messages)) for location, messages in grouped.items()]
+    shown = locations if max_locations is None else locations[:max_locations]
+    return shown, len(locations) - len(shown) + unreduced, unreduced == 0
+
+
+def render_validation_error(
+    file_path: str,
+    error: ValidationError,
+    parser_class: Type[BaseModel],
+    max_errors: Optional[int] = MAX_ERRORS,
+) -> str:
+    """Render a validation error of a file as a bounded, readable report.
+
+    Failing unions are reduced to their most plausible branch, the messages
+    are grouped by location, and at most `max_errors` locations are rendered.
+    """
+    shown, omitted, exact = reduce_validation_error(error, parser_class, max_errors)
+    lines = [f"Validation error in '{file_path}':"]
+    for location, messages in shown:
+        lines.append(f"    {location}: {'; '.join(messages)}")
+    if omitted:
+        lines.append(
+            f"    ... and {'' if exact else 'at least '}{omitted} more invalid "
+            f"location{'s' if omitted != 1 else ''}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,218 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Validation of the subtrees shared by YAML aliases once per subtree.
+
+An alias loads as the very object its anchor loads as, e.g. one `&std_metrics`
+mapping referred to from dozens of columns, but pydantic validates it again at
+every occurrence. Before a document is validated, each shared mapping found
+where a single model is expected is validated once on its own, and the model
+instance replaces it at every occurrence. pydantic takes instances as they
+are, so the document is then validated in time proportional to its distinct
+content, while it still holds one object per occurrence for the checkers.
+
+A shared mapping that fails validation is left in place, so that its errors
+are reported at every occurrence as without aliases. The raw document is not
+modified.
+"""
+
+import inspect
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, RootModel, ValidationError
+
+ParserModel = TypeVar("ParserModel", bound=BaseModel)
+
+_SEQUENCES = (list, tuple, set, frozenset)
+
+_UNION_TYPES: Tuple[Any, ...] = (Union,)
+try:
+    from types import UnionType
+
+    _UNION_TYPES += (UnionType,)
+except ImportError:  # pragma: no cover
+    pass
+
+
+def _members(annotation: Any) -> Tuple[Any, ...]:
+    """Flatten an annotation into the types a value may be validated as."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _members(get_args(annotation)[0])
+    if origin in _UNION_TYPES:
+        return tuple(
+            member
+            for arg in get_args(annotation)
+            if arg is not type(None)
+            for member in _members(arg)
+        )
+    if inspect.isclass(annotation) and issubclass(annotation, RootModel):
+        return _members(annotation.model_fields["root"].annotation)
+    return (annotation,)
+
+
+@dataclass(frozen=True)
+class _Shape:
+    """What the annotations of a location expect of the values found there."""
+
+    # The model a mapping is validated as, if it is the only possible type
+    model: Optional[Type[BaseModel]] = None
+    # Annotations of the values of a mapping, by key
+    fields: Dict[Any, Tuple[Any, ...]] = field(default_factory=dict)
+    # Annotations of the values of a mapping whose key is not in `fields`
+    values: Tuple[Any, ...] = ()
+    # Annotations of the items of a sequence
+    items: Tuple[Any, ...] = ()
+    # Whether a value may be kept as is, e.g. as `Any` or as an extra field
+    opaque: bool = False
+
+
+def _unique(annotations: List[Any]) -> Tuple[Any, ...]:
+    return tuple(dict.fromkeys(annotations))
+
+
+@lru_cache(maxsize=None)
+def _shape(annotations: Tuple[Any, ...]) -> _Shape:
+    models = []
+    fields: Dict[Any, List[Any]] = {}
+    values: List[Any] = []
+    items: List[Any] = []
+    opaque = False
+    for annotation in annotations:
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+        if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            models.append(annotation)
+            for name, model_field in annotation.model_fields.items():
+                fields.setdefault(name, []).extend(_members(model_field.annotation))
+            if annotation.model_config.get("extra") == "allow":
+                values.append(Any)
+        elif origin is dict and args:
+            values.extend(_members(args[1]))
+        elif origin in _SEQUENCES and args:
+            items.extend(_members(args[0]))
+        elif annotation in (Any, object, dict, *_SEQUENCES) or origin in (
+            dict,
+            *_SEQUENCES,
+        ):
+            # Unparameterized containers keep their values as they are
+            opaque = True
+    # A key missing from a model still matches the values of a dict annotation
+    for annotations_of_key in fields.values():
+        annotations_of_key.extend(values)
+    return _Shape(
+        model=models[0] if len(annotations) == 1 and models else None,
+        fields={key: _unique(value) for key, value in fields.items()},
+        values=_unique(values),
+        items=_unique(items),
+        opaque=opaque,
+    )
+
+
+class _Substitution:
+    """Replace the shared mappings of a document by their validated models."""
+
+    def __init__(self, shared: Dict[int, Any]):
+        self.shared = shared
+        self.results: Dict[Tuple[int, Tuple[Any, ...]], Any] = {}
+
+    def visit(self, value: Any, annotations: Tuple[Any, ...]) -> Any:
+        shape = _shape(annotations)
+        if shape.opaque:
+            return value
+        if id(value) not in self.shared:
+            return self._visit(value, shape)
+        key = (id(value), annotations)
+        if key not in self.results:
+            self.results[key] = self._visit(value, shape)
+        return self.results[key]
+
+    def _visit(self, value: Any, shape: _Shape) -> Any:
+        if isinstance(value, dict):
+            if shape.model is not None and id(value) in self.shared:
+                try:
+                    return shape.model.model_validate(value)
+                except ValidationError:
+                    # Validated again at every occurrence to report its errors
+                    pass
+            if not shape.fields and not shape.values:
+                return value
+            substituted = None
+            for key, item in value.items():
+                if not isinstance(item, (dict, list)):
+                    continue
+                annotations = shape.fields.get(key, shape.values)
+                if not annotations:
+                    continue
+                new_item = self.visit(item, annotations)
+                if new_item is not item:
+                    substituted = dict(value) if substituted is None else substituted
+                    substituted[key] = new_item
+            return value if substituted is None else substituted
+        if isinstance(value, list) and shape.items:
+            new_items = [
+                (
+                    self.visit(item, shape.items)
+                    if isinstance(item, (dict, list))
+                    else item
+                )
+                for item in value
+            ]
+            if any(new is not old for new, old in zip(new_items, value, strict=True)):
+                return new_items
+        return value
+
+
+def substitute_shared(
+    parser_class: Type[BaseModel], raw_data: Any, shared: Dict[int, Any]
+) -> Any:
+    """Replace the valid shared mappings of a document by their models.
+
+    Args:
+        parser_class: Generated parser (e.g., LightdashV20, LightdashV25)
+        raw_data: Raw YAML data of a dbt schema file
+        shared: Objects shared by the aliases of the document, by id
+
+    Returns:
+        The document with the containers leading to a replaced mapping copied
+    """
+    if not shared:
+        return raw_data
+    return _Substitution(shared).visit(raw_data, (parser_class,))
+
+
+def validate_shared(
+    parser_class: Type[ParserModel], raw_data: Any, shared: Dict[int, Any]
+) -> ParserModel:
+    """Validate a raw schema document, validating each shared mapping once.
+
+    Raises:
+        ValidationError: If the document is invalid
+    """
+    return parser_class.model_validate(
+        substitute_shared(parser_class, raw_data, shared)
+    )
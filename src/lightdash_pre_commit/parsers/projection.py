@@ -0,0 +1,103 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Projection of dbt schema documents onto the parts Lightdash reads.
+
+The generated parsers validate every resource type and every dbt test of a
+schema file, although no Lightdash rule reads them. Projecting a document
+before validating it drops those subtrees, so they are left unvalidated, while
+the subtrees that are kept are validated by the same models at the same
+locations, with the same errors.
+"""
+
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+# Top-level resource types Lightdash does not read
+NON_LIGHTDASH_RESOURCES = frozenset(
+    {
+        "seeds",
+        "snapshots",
+        "tests",
+        "unit_tests",
+        "sources",
+        "analyses",
+        "exposures",
+        "macros",
+    }
+)
+
+# Fields of models and columns Lightdash does not read
+NON_LIGHTDASH_FIELDS = frozenset({"tests", "data_tests"})
+
+ParserModel = TypeVar("ParserModel", bound=BaseModel)
+
+
+def _without(mapping: Dict[str, Any], keys: frozenset) -> Dict[str, Any]:
+    if keys.isdisjoint(mapping):
+        return mapping
+    return {key: value for key, value in mapping.items() if key not in keys}
+
+
+def _project_model(model: Any) -> Any:
+    if not isinstance(model, dict):
+        return model
+    projected = _without(model, NON_LIGHTDASH_FIELDS)
+    columns = projected.get("columns")
+    if isinstance(columns, list):
+        projected = dict(projected) if projected is model else projected
+        projected["columns"] = [
+            (
+                _without(column, NON_LIGHTDASH_FIELDS)
+                if isinstance(column, dict)
+                else column
+            )
+            for column in columns
+        ]
+    return projected
+
+
+def project_document(raw_data: Any) -> Any:
+    """Drop the subtrees of a raw schema document that Lightdash does not read.
+
+    Anything that is not a mapping where one is expected is kept as is, so that
+    its validation error is still reported. The raw document is not modified.
+
+    Args:
+        raw_data: Raw YAML data of a dbt schema file
+
+    Returns:
+        The projected document
+    """
+    if not isinstance(raw_data, dict):
+        return raw_data
+    projected = _without(raw_data, NON_LIGHTDASH_RESOURCES)
+    models = projected.get("models")
+    if isinstance(models, list):
+        projected = dict(projected) if projected is raw_data else projected
+        projected["models"] = [_project_model(model) for model in models]
+    return projected
+
+
+def validate_projection(parser_class: Type[ParserModel], raw_data: Any) -> ParserModel:
+    """Validate the projection of a raw schema document with a generated parser.
+
+    Args:
+        parser_class: Generated parser (e.g., LightdashV20, LightdashV25)
+        raw_data: Raw YAML data of a dbt schema file
+
+    Raises:
+        ValidationError: If the parts of the document Lightdash reads are invalid
+    """
+    return parser_class.model_validate(project_document(raw_data))
@@ -0,0 +1,88 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+
+from pydantic import ValidationError
+
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import main
+from lightdash_pre_commit.hooks.limits import load_yaml_document
+from lightdash_pre_commit.parsers.anchors import substitute_shared, validate_shared
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import Config, LightdashV25
+
+
+class TestAnchors(unittest.TestCase):
+    """Test validating the subtrees shared by YAML aliases once."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "anchors"
+        )
+        self.anchored_metrics = os.path.join(self.fixtures_dir, "anchored_metrics.yml")
+
+    def test_shared_mappings_are_validated_once(self):
+        """Test each alias refers to one model instance and the result is unchanged."""
+        document = load_yaml_document(self.anchored_metrics)
+        # Only the anchored column config has several parents
+        self.assertEqual(len(document.shared), 1)
+        substituted = substitute_shared(LightdashV25, document.data, document.shared)
+        configs = [
+            column["config"]
+            for model in substituted["models"]
+            for column in model["columns"]
+        ]
+        self.assertIsInstance(configs[0], Config)
+        self.assertTrue(all(config is configs[0] for config in configs))
+        # The raw document is left as loaded
+        self.assertIsInstance(document.data["models"][0]["columns"][0]["config"], dict)
+        self.assertEqual(
+            validate_shared(LightdashV25, document.data, document.shared).model_dump(),
+            LightdashV25.model_validate(document.data).model_dump(),
+        )
+
+    def test_invalid_shared_mapping_is_reported_at_every_occurrence(self):
+        """Test the errors of a shared mapping are the errors without aliases."""
+        document = load_yaml_document(
+            os.path.join(self.fixtures_dir, "invalid_shared_metric.yml")
+        )
+        with self.assertRaises(ValidationError) as memoized:
+            validate_shared(LightdashV25, document.data, document.shared)
+        with self.assertRaises(ValidationError) as plain:
+            LightdashV25.model_validate(document.data)
+        self.assertEqual(memoized.exception.errors(), plain.exception.errors())
+        self.assertEqual(
+            [error["loc"] for error in memoized.exception.errors()],
+            [("metrics", 0, "time_grains"), ("metrics", 1, "time_grains")],
+        )
+
+    def test_duplicates_count_every_occurrence(self):
+        """Test a name aliased into several columns is a duplicate in each of them."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main([self.anchored_metrics])
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            "Duplicate name 'total' used 3 times: metric in column 'amount', "
+            "metric in column 'tax', metric in column 'discount' in model 'orders'",
+            output.getvalue(),
+        )
+        self.assertNotIn("refunds", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
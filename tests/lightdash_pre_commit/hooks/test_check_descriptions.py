@@ -0,0 +1,138 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+from unittest import mock
+
+from lightdash_pre_commit.hooks.check_descriptions import main
+from lightdash_pre_commit.hooks.doc_blocks import (
+    DocBlock,
+    DocBlockIndex,
+    parse_doc_blocks,
+    update_index,
+)
+
+
+class TestCheckDescriptions(unittest.TestCase):
+    """Test the check_descriptions hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_descriptions"
+        )
+        self.orders = os.path.join(self.fixtures_dir, "models", "orders.yml")
+        self.docs = os.path.normpath(
+            os.path.join(os.path.abspath(self.fixtures_dir), "models", "orders.md")
+        )
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_descriptions_resolved_from_doc_blocks(self):
+        """Test doc blocks of the dbt project are resolved before being checked."""
+        exit_code, output = self._run([self.orders])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Metric 'total_revenue' in model 'orders' has a description "
+                "shorter than 10 characters (doc block 'total_revenue' in "
+                f"'{self.docs}' line 11)",
+                "  Metric 'order_count' in model 'orders' refers to the missing doc "
+                "block 'order_cuont' (did you mean 'order_count'?)",
+                "  Metric 'average_amount' in model 'orders' has no description",
+                "  Dimension 'amount' in model 'orders' has a description containing "
+                f"the placeholder 'TODO' (doc block 'amount' in '{self.docs}' line 15)",
+            ],
+        )
+
+    def test_required_descriptions(self):
+        """Test which models, metrics and dimensions must have a description."""
+        exit_code, output = self._run(
+            [
+                self.orders,
+                "--require-model-desc",
+                "--no-require-metric-desc",
+                "--require-dimension-desc",
+                "--min-length=0",
+                "--forbidden-terms=",
+            ]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Metric 'order_count' in model 'orders' refers to the missing doc "
+                "block 'order_cuont' (did you mean 'order_count'?)",
+                # internal_note is hidden
+                "  Additional dimension 'is_shipped' in model 'orders' has no "
+                "description",
+            ],
+        )
+
+    def test_doc_block_index(self):
+        """Test doc blocks are parsed with their span and indexed incrementally."""
+        self.assertEqual(
+            parse_doc_blocks(
+                "docs.md",
+                "# Docs\n{% docs a %}\nFirst\n{% enddocs %}\n"
+                "{%- docs b -%}Second{%- enddocs -%}\n",
+            ),
+            [
+                DocBlock("a", "docs.md", 2, 4, "First"),
+                DocBlock("b", "docs.md", 5, 5, "Second"),
+            ],
+        )
+
+        index = DocBlockIndex()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "docs.md")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("{% docs orders %}\nOrders of the shop\n{% enddocs %}\n")
+            update_index(index, [path])
+            self.assertEqual(
+                index.resolve("{{ doc('shop', 'orders') }}, one per row"),
+                ("Orders of the shop, one per row", index.get("orders"), []),
+            )
+
+            # Unchanged files are not read again
+            with mock.patch(
+                "lightdash_pre_commit.hooks.doc_blocks.read_doc_blocks"
+            ) as read_doc_blocks:
+                update_index(index, [path])
+            read_doc_blocks.assert_not_called()
+
+            restored = DocBlockIndex.from_dict(index.to_dict())
+            self.assertEqual(restored.get("orders"), index.get("orders"))
+
+            os.remove(path)
+            update_index(restored, [path])
+            self.assertEqual(
+                restored.resolve('{{ doc("orders") }}'),
+                ('{{ doc("orders") }}', [], ["orders"]),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
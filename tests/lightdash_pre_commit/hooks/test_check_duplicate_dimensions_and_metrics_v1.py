@@ -135,6 +135,27 @@ class TestCheckDuplicateDimensionsAndMetricsV1(unittest.TestCase):
         self.assertIn("user_metric", error_text)
         self.assertIn("user_id", error_text)
 
+    def test_duplicate_generated_time_interval(self):
+        """Test names Lightdash generates for time intervals are checked."""
+        lightdash_data = self._get_lightdash_data("duplicate_time_interval.yml")
+        errors = FindDuplicateDimensionsAndMetricsV1.check(data=lightdash_data)
+
+        # Default intervals of a timestamp, explicit intervals, and columns
+        # without a dimension block; intervals turned off generate nothing
+        self.assertEqual(
+            errors,
+            [
+                "Duplicate name 'created_at_month' used 2 times: model-level metric, "
+                "time interval MONTH of column 'created_at' dimension in model 'orders'",
+                "Duplicate name 'shipped_at_month_num' used 2 times: "
+                "additional dimension in column 'shipped_at', "
+                "time interval MONTH_NUM of column 'shipped_at' dimension "
+                "in model 'orders'",
+                "Duplicate name 'created_at_day' used 2 times: column 'created_at_day', "
+                "time interval DAY of column 'created_at' dimension in model 'orders'",
+            ],
+        )
+
     def test_no_meta_columns(self):
         """Test with columns that have no meta section."""
         lightdash_data = self._get_lightdash_data("no_meta_columns.yml")
@@ -20,6 +20,7 @@ import yaml  # type: ignore[import-untyped]
 from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
     FindDuplicateDimensionsAndMetricsV2,
 )
+from lightdash_pre_commit.hooks.utils import process_single_file
 from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
 
 
@@ -135,6 +136,47 @@ class TestCheckDuplicateDimensionsAndMetricsV2(unittest.TestCase):
         self.assertIn("user_metric", error_text)
         self.assertIn("user_id", error_text)
 
+    def test_duplicate_generated_time_interval(self):
+        """Test names Lightdash generates for time intervals are checked."""
+        lightdash_data = self._get_lightdash_data("duplicate_time_interval.yml")
+        errors = FindDuplicateDimensionsAndMetricsV2.check(data=lightdash_data)
+
+        # Default intervals of a timestamp, explicit intervals, and columns
+        # without a dimension block; intervals turned off generate nothing
+        self.assertEqual(
+            errors,
+            [
+                "Duplicate name 'created_at_month' used 2 times: model-level metric, "
+                "time interval MONTH of column 'created_at' dimension in model 'orders'",
+                "Duplicate name 'shipped_at_month_num' used 2 times: "
+                "additional dimension in column 'shipped_at', "
+                "time interval MONTH_NUM of column 'shipped_at' dimension "
+                "in model 'orders'",
+                "Duplicate name 'created_at_day' used 2 times: column 'created_at_day', "
+                "time interval DAY of column 'created_at' dimension in model 'orders'",
+            ],
+        )
+
+    def test_duplicate_yaml_keys(self):
+        """Test keys repeated in a mapping are reported, though loading keeps the last."""
+        path = os.path.join(self.fixtures_dir, "duplicate_yaml_keys.yml")
+        errors, success = process_single_file(
+            path,
+            LightdashV25,
+            FindDuplicateDimensionsAndMetricsV2,
+            duplicate_keys=True,
+        )
+        self.assertFalse(success)
+        self.assertEqual(
+            errors,
+            [
+                f"Duplicate key 'total_revenue' at line 13 of '{path}', "
+                "first defined at line 7",
+                f"Duplicate key 'description' at line 19 of '{path}', "
+                "first defined at line 18",
+            ],
+        )
+
     def test_no_meta_columns(self):
         """Test with columns that have no meta section."""
         lightdash_data = self._get_lightdash_data("no_meta_columns.yml")
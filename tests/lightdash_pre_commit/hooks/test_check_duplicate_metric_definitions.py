@@ -0,0 +1,129 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from lightdash_pre_commit.hooks.check_duplicate_metric_definitions import main
+from lightdash_pre_commit.hooks.metric_definitions import (
+    MetricDefinition,
+    MetricDefinitionIndex,
+    normalize_sql,
+)
+
+
+class TestCheckDuplicateMetricDefinitions(unittest.TestCase):
+    """Test the check_duplicate_metric_definitions hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_duplicate_metric_definitions"
+        )
+        self.orders = os.path.join(self.fixtures_dir, "orders.yml")
+        self.customers = os.path.join(self.fixtures_dir, "customers.yml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_normalize_sql(self):
+        """Test whitespace, casing, comments and table references are normalized."""
+        self.assertEqual(
+            normalize_sql("SUM( ${TABLE}.Amount ) -- total", "orders"),
+            normalize_sql("sum(${amount})", "orders"),
+        )
+        self.assertEqual(
+            normalize_sql("${TABLE}.amount", "orders"),
+            normalize_sql("${ orders.amount }", "customers"),
+        )
+        # String literals keep their casing
+        self.assertNotEqual(
+            normalize_sql("${TABLE}.status = 'Completed'", "orders"),
+            normalize_sql("${TABLE}.status = 'completed'", "orders"),
+        )
+
+    def test_duplicates_in_file(self):
+        """Test metrics with the same definition under other names are clustered."""
+        exit_code, output = self._run([self.orders])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Metrics with the same type, SQL and filters: "
+                "'unique_customers' in model 'orders', "
+                "'customer_count' in model 'orders' and "
+                "'customers_with_orders' in model 'orders'",
+                "  Metrics with the same type, SQL and filters: "
+                "'completed_revenue' in model 'orders' and "
+                "'paid_revenue' in model 'orders'",
+            ],
+        )
+
+    def test_duplicates_across_project(self):
+        """Test duplicates in other files of the project are reported with their path."""
+        exit_code, output = self._run(
+            [self.customers, "--search-path", self.fixtures_dir]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Metrics with the same type, SQL and filters: "
+                "'ordering_customers' in model 'customers', "
+                f"'unique_customers' in model 'orders' ('{self.orders}'), "
+                f"'customer_count' in model 'orders' ('{self.orders}') and "
+                f"'customers_with_orders' in model 'orders' ('{self.orders}')",
+            ],
+        )
+
+    def test_index_is_incremental(self):
+        """Test the index is persisted and updated when a file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            customers = os.path.join(temp_dir, "customers.yml")
+            shutil.copy(self.customers, customers)
+            cache_dir = os.path.join(temp_dir, "cache")
+            argv = [customers, self.orders, f"--cache-dir={cache_dir}"]
+            first = self._run(argv)
+            self.assertEqual(self._run(argv), first)
+            self.assertIn("'ordering_customers' in model 'customers'", first[1])
+
+            with open(customers, "w", encoding="utf-8") as file:
+                file.write("version: 2\nmodels: []\n")
+            exit_code, output = self._run([customers, f"--cache-dir={cache_dir}"])
+            self.assertEqual((exit_code, output), (0, ""))
+
+    def test_removed_file_leaves_clusters(self):
+        """Test removing a file removes its metrics from their clusters."""
+        index = MetricDefinitionIndex()
+        definition = MetricDefinition("fingerprint", "orders", "a", None)
+        index.update_file("a.yml", [1, 1], [definition])
+        index.update_file("b.yml", [1, 1], [definition])
+        self.assertEqual(len(index.duplicates_in_file("a.yml")), 1)
+        index.remove_file("b.yml")
+        self.assertEqual(index.duplicates_in_file("a.yml"), [])
+        restored = MetricDefinitionIndex.from_dict(index.to_dict())
+        self.assertEqual(restored.indexed_files(), ["a.yml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
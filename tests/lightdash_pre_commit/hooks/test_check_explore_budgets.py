@@ -0,0 +1,116 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from lightdash_pre_commit.hooks.check_explore_budgets import main
+from lightdash_pre_commit.hooks.join_graph import ExploreStats, JoinEdge, JoinGraphIndex
+
+
+class TestCheckExploreBudgets(unittest.TestCase):
+    """Test the check_explore_budgets hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_explore_budgets"
+        )
+        self.orders = os.path.join(self.fixtures_dir, "orders.yml")
+        self.budgets = os.path.join(self.fixtures_dir, "budgets.yaml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_explores_over_budget(self):
+        """Test every budget is checked, with the overrides of each explore."""
+        exit_code, output = self._run([self.orders, f"--config={self.budgets}"])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                # Only the included fields of customers count, with the time
+                # intervals of the included signed_up_at
+                "  Explore 'orders' has 24 fields, over its budget of 20 (max_fields)",
+                # countries is joined on addresses, joined on customers
+                "  Explore 'orders' joins 3 levels deep, over its budget of 2 "
+                "(max_join_depth)",
+                "  Explore 'orders' has 2 joins with always: true, over its budget "
+                "of 1 (max_always_joins)",
+                "  Explore 'orders' has 14 generated time interval fields, over its "
+                "budget of 10 (max_time_fields)",
+                "  Explore 'customers' has 6 generated time interval fields, over its "
+                "budget of 5 (max_time_fields)",
+            ],
+        )
+
+    def test_default_budgets_and_invalid_config(self):
+        """Test the default budgets pass and invalid budgets are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = os.path.join(temp_dir, "config.yaml")
+            with open(config, "w", encoding="utf-8") as file:
+                file.write("explore_budgets: {}\n")
+            self.assertEqual(self._run([self.orders, f"--config={config}"]), (0, ""))
+
+            with open(config, "w", encoding="utf-8") as file:
+                file.write(
+                    "explore_budgets:\n  explores:\n    orders:\n      fields: 1\n"
+                )
+            exit_code, output = self._run([self.orders, f"--config={config}"])
+            self.assertEqual(exit_code, 2)
+            self.assertIn("Invalid explore budgets", output)
+
+    def test_stats_are_incremental(self):
+        """Test only the explores including a changed model are measured again."""
+        index = JoinGraphIndex()
+        edge = JoinEdge("items", "items", True, "${orders.id} = ${items.order_id}")
+        index.update_file("orders.yml", [0, 0], {"orders": [edge]}, {"orders": ["id"]})
+        index.update_file(
+            "items.yml",
+            [0, 0],
+            {"items": []},
+            {"items": ["order_id", "shipped_at"]},
+            {"items": {"shipped_at": ["shipped_at_day", "shipped_at_week"]}},
+        )
+        index.update_file("users.yml", [0, 0], {"users": []}, {"users": ["id"]})
+        stats = index.stats(["orders", "items", "users"])
+        self.assertEqual(stats["orders"], ExploreStats(5, 1, 1, 2))
+        self.assertEqual(index.measured, {"orders", "items", "users"})
+
+        index.update_file(
+            "items.yml",
+            [1, 0],
+            {"items": []},
+            {"items": ["order_id", "shipped_at"]},
+            {"items": {"shipped_at": ["shipped_at_day"]}},
+        )
+        stats = index.stats(["orders", "items", "users"])
+        self.assertEqual(index.measured, {"orders", "items"})
+        self.assertEqual(stats["orders"], ExploreStats(4, 1, 1, 1))
+
+        restored = JoinGraphIndex.from_dict(index.to_dict())
+        self.assertEqual(restored.stats(["orders", "items", "users"]), stats)
+        self.assertEqual(restored.measured, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
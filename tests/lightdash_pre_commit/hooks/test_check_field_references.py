@@ -0,0 +1,135 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from typing import Any, Dict, List, Tuple
+
+from lightdash_pre_commit.hooks.check_field_references import main
+from lightdash_pre_commit.hooks.field_references import (
+    FieldReferenceIndex,
+    empty_model,
+    extract_references,
+)
+
+
+def _model(joins: Dict[str, str], fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Create the index entry of a model."""
+    entry = empty_model()
+    entry["joins"] = joins
+    entry["fields"] = fields
+    entry["dimensions"] = list(fields)
+    return entry
+
+
+class TestCheckFieldReferences(unittest.TestCase):
+    """Test the check_field_references hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_field_references"
+        )
+        self.orders = os.path.join(self.fixtures_dir, "orders.yml")
+        self.customers = os.path.join(self.fixtures_dir, "customers.yml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_extract_references(self):
+        """Test table placeholders, user attributes and repeats are skipped."""
+        self.assertEqual(
+            extract_references(
+                "${TABLE}.a + ${ b } + ${orders.c} + ${b} "
+                "+ ${lightdash.attributes.rate} + ${ld.parameters.currency}"
+            ),
+            ["b", "orders.c"],
+        )
+        self.assertEqual(extract_references(None), [])
+
+    def test_dangling_references_and_cycles(self):
+        """Test unknown tables, fields, default time dimensions and cycles are reported."""
+        expected = [
+            "  Field 'buyer_lifetime_value' of model 'orders' references table "
+            "'customers', which is neither the model nor one of its joins",
+            "  Field 'average_revenue' of model 'orders' references unknown field "
+            "'${total_revenu}' (did you mean 'total_revenue'?)",
+            "  Field 'average_revenue' of model 'orders' references unknown field "
+            "'${order_count}'",
+            "  Default time dimension 'shipped_at' of metric 'average_revenue' in "
+            "model 'orders' is not a dimension of the model",
+            "  Field 'net_amount' of model 'orders' is part of a reference cycle: "
+            "orders.net_amount -> orders.gross_amount -> orders.net_amount",
+        ]
+        # Generated time intervals and fields of joined models resolve
+        exit_code, output = self._run([self.orders, "--search-path", self.fixtures_dir])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output.splitlines()[1:], expected)
+
+        # Joined models missing from the index are left to validate-joins
+        exit_code, output = self._run([self.orders])
+        self.assertEqual(output.splitlines()[1:], expected)
+
+    def test_time_intervals_of_untyped_dimensions(self):
+        """Test dimensions typed by the warehouse may be referenced by any time interval."""
+        exit_code, output = self._run([self.customers])
+        self.assertEqual((exit_code, output), (0, ""))
+
+    def test_index_re_resolves_affected_models(self):
+        """Test only the models reaching a changed model are re-resolved."""
+        index = FieldReferenceIndex()
+        index.update_file(
+            "a.yml", [1, 1], {"a": _model({"b": "b"}, {"x": ["b.y"], "z": []})}
+        )
+        index.update_file("b.yml", [1, 1], {"b": _model({"a": "a"}, {"y": []})})
+        index.update_file("c.yml", [1, 1], {"c": _model({}, {"w": []})})
+        self.assertEqual(index.resolve(["a", "b", "c"]), {"a": [], "b": [], "c": []})
+
+        # A cycle across the joins of two models
+        index.update_file("b.yml", [2, 1], {"b": _model({"a": "a"}, {"y": ["a.x"]})})
+        results = index.resolve(["a", "b", "c"])
+        self.assertEqual(index.resolved, {"a", "b"})
+        self.assertEqual(
+            results["a"],
+            [
+                "Field 'x' of model 'a' is part of a reference cycle: "
+                "a.x -> b.y -> a.x"
+            ],
+        )
+        self.assertEqual(
+            results["b"],
+            [
+                "Field 'y' of model 'b' is part of a reference cycle: "
+                "b.y -> a.x -> b.y"
+            ],
+        )
+
+        # The graph and its diagnostics survive a round trip through the cache
+        restored = FieldReferenceIndex.from_dict(index.to_dict())
+        self.assertEqual(restored.resolve(["a", "b", "c"]), results)
+        self.assertEqual(restored.resolved, set())
+
+        restored.remove_file("b.yml")
+        self.assertEqual(restored.resolve(["a", "c"]), {"a": [], "c": []})
+        self.assertEqual(restored.resolved, {"a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
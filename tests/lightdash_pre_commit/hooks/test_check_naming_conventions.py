@@ -0,0 +1,172 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import random
+import re
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from lightdash_pre_commit.hooks.check_naming_conventions import (
+    METRIC_TYPES,
+    NamingConventionsConfig,
+    NamingRuleSet,
+    main,
+    trie_pattern,
+)
+from lightdash_pre_commit.hooks.config import ConfigError
+
+
+class TestCheckNamingConventions(unittest.TestCase):
+    """Test the check_naming_conventions hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_naming_conventions"
+        )
+        self.config_path = os.path.join(self.fixtures_dir, "config.yml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_conforming_names(self):
+        """Test names following the conventions pass."""
+        exit_code, output = self._run(
+            [
+                "--config",
+                self.config_path,
+                os.path.join(self.fixtures_dir, "conforming_names.yml"),
+            ]
+        )
+        self.assertEqual((exit_code, output), (0, ""))
+
+    def test_violating_names(self):
+        """Test each kind of rule reports its violation."""
+        exit_code, output = self._run(
+            [
+                "--config",
+                self.config_path,
+                os.path.join(self.fixtures_dir, "violating_names.yml"),
+            ]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            "Metric 'revenue' in model 'orders' must start with one of: 'total_'",
+            output,
+        )
+        self.assertIn("Dimension 'userId' in model 'orders' is not snake_case", output)
+        self.assertIn(
+            "Metric 'users_test' in model 'orders' contains the banned word 'test'",
+            output,
+        )
+        self.assertIn(
+            "Additional dimension 'tmp__amount' in model 'orders' matches the forbidden pattern '__'",
+            output,
+        )
+        self.assertIn("must end with one of: '_avg'", output)
+        self.assertIn("is longer than 30 characters", output)
+
+    def test_default_conventions(self):
+        """Test snake_case names are enforced without any configuration."""
+        rule_set = NamingRuleSet(NamingConventionsConfig())
+        self.assertEqual(rule_set.check_name("user_id", "dimensions"), [])
+        self.assertEqual(
+            rule_set.check_name("userId", "dimensions"),
+            ["does not match the pattern '^[a-z][a-z0-9_]*$'"],
+        )
+
+    def test_invalid_config(self):
+        """Test an invalid configuration exits with the setup error code."""
+        with self.assertRaises(ConfigError):
+            NamingRuleSet.from_config(
+                {"naming_conventions": {"metrics": {"prefixes": {"total": ["x_"]}}}}
+            )
+        exit_code, output = self._run(
+            ["--config", os.path.join(self.fixtures_dir, "missing.yml")]
+        )
+        self.assertEqual(exit_code, 2)
+        self.assertIn("Failed to load config", output)
+
+    def test_trie_pattern(self):
+        """Test the trie-factored alternation matches exactly the words."""
+        words = ["tmp", "temp", "test", "tes", "x"]
+        pattern = re.compile(trie_pattern(words))
+        for word in words:
+            self.assertIsNotNone(pattern.fullmatch(word))
+        for word in ["te", "tm", "temps", "y", ""]:
+            self.assertIsNone(pattern.fullmatch(word))
+
+    def test_combined_matcher_agrees_with_rule_by_rule_evaluation(self):
+        """Test hundreds of rules against thousands of names give the same violations."""
+        rng = random.Random(42)
+        syllables = ["ord", "er", "rev", "en", "ue", "tmp", "us", "id", "cnt", "amt"]
+
+        def make_word() -> str:
+            return "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+
+        banned_words = sorted({make_word() for _ in range(200)})
+        forbidden_patterns = [f"^{make_word()}_" for _ in range(50)] + ["__"]
+        prefixes = {
+            metric_type: sorted({make_word() + "_" for _ in range(10)})
+            for metric_type in METRIC_TYPES
+        }
+        config = NamingConventionsConfig.model_validate(
+            {
+                "metrics": {"max_length": 20, "prefixes": prefixes},
+                "banned_words": banned_words,
+                "forbidden_patterns": forbidden_patterns,
+            }
+        )
+        rule_set = NamingRuleSet(config)
+        names = [
+            "_".join(make_word() for _ in range(rng.randint(1, 4))) for _ in range(5000)
+        ]
+
+        default_pattern = re.compile(config.metrics.pattern or "")
+        for name in names:
+            metric_type = rng.choice(sorted(METRIC_TYPES))
+            expected = set()
+            if not default_pattern.match(name):
+                expected.add("pattern")
+            if not name.startswith(tuple(prefixes[metric_type])):
+                expected.add("prefix")
+            if len(name) > 20:
+                expected.add("length")
+            for word in name.split("_"):
+                if word in banned_words:
+                    expected.add(f"banned {word}")
+            for pattern in forbidden_patterns:
+                if re.search(pattern, name):
+                    expected.add(f"forbidden {pattern}")
+
+            actual = set()
+            for violation in rule_set.check_name(name, "metrics", metric_type):
+                if violation.startswith("does not match the pattern"):
+                    actual.add("pattern")
+                elif violation.startswith("must start with"):
+                    actual.add("prefix")
+                elif violation.startswith("is longer than"):
+                    actual.add("length")
+                elif violation.startswith("contains the banned word"):
+                    actual.add("banned " + violation.split("'")[1])
+                else:
+                    actual.add("forbidden " + violation.split("'")[1])
+            self.assertEqual(actual, expected, name)
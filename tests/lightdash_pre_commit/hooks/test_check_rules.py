@@ -0,0 +1,146 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.check_rules import RuleSet, RuleTarget, main
+from lightdash_pre_commit.hooks.config import ConfigError
+
+
+class TestCheckRules(unittest.TestCase):
+    """Test the check_rules hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_rules"
+        )
+        self.config_path = os.path.join(self.fixtures_dir, "config.yml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_conforming(self):
+        """Test a file meeting every rule passes."""
+        exit_code, output = self._run(
+            [
+                f"--config={self.config_path}",
+                os.path.join(self.fixtures_dir, "conforming.yml"),
+            ]
+        )
+        self.assertEqual((exit_code, output), (0, ""))
+
+    def test_violating(self):
+        """Test each kind of node reports the rules it breaks, in order."""
+        exit_code, output = self._run(
+            [
+                f"--config={self.config_path}",
+                os.path.join(self.fixtures_dir, "violating.yml"),
+            ]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Model 'orders' breaks rule 'model-owner': "
+                "Every model must have an owner",
+                "  Metric 'order_count' in model 'orders' breaks rule "
+                "'count-distinct-description': description must be set",
+                "  Column 'order_id' in model 'orders' breaks rule 'column-tests': "
+                "data_tests must be set",
+                "  Dimension 'order_id' in model 'orders' breaks rule "
+                "'dimension-types': type must not be one of \"timestamp\"",
+                "  Metric 'total_orders' in model 'orders' breaks rule "
+                "'short-labels': label must not be longer than 20",
+            ],
+        )
+
+    def test_results_are_cached(self):
+        """Test the results of unchanged models are reused with the same rules."""
+        file_path = os.path.join(self.fixtures_dir, "violating.yml")
+        argv = [f"--config={self.config_path}", file_path]
+        expected = self._run(argv)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                self.assertEqual(
+                    self._run([f"--cache-dir={cache_dir}"] + argv), expected
+                )
+
+    def test_rules_are_indexed(self):
+        """Test a node only evaluates the rules whose equality holds."""
+        rules = [
+            {
+                "id": f"rule-{metric_type}-{index}",
+                "target": "metrics",
+                "where": {"type": metric_type},
+                "require": {"description": {"present": True}},
+            }
+            for index in range(50)
+            for metric_type in ("sum", "count", "max")
+        ]
+        rule_set = RuleSet.from_config({"rules": rules})
+        # Compiled once for identical rules
+        self.assertIs(RuleSet.from_config({"rules": rules}), rule_set)
+
+        target_rules = rule_set.targets[RuleTarget.metrics]
+        metric = {"type": "count"}
+        candidates = target_rules.candidates(lambda path: metric.get(path[0]))
+        self.assertEqual(len(candidates), 50)
+        self.assertEqual(
+            [rule.id for rule in candidates[:2]], ["rule-count-0", "rule-count-1"]
+        )
+
+    def test_invalid_rules(self):
+        """Test invalid rules are reported with their location."""
+        invalid_rules = {
+            "target": [{"id": "a", "target": "sources", "require": {"name": "x"}}],
+            "operator": [
+                {"id": "a", "target": "models", "require": {"name": {"is": 1}}}
+            ],
+            "pattern": [
+                {"id": "a", "target": "models", "require": {"name": {"matches": "("}}}
+            ],
+            "empty": [{"id": "a", "target": "models", "require": {}}],
+            "duplicate": [
+                {"id": "a", "target": "models", "require": {"name": "x"}},
+                {"id": "a", "target": "models", "require": {"name": "y"}},
+            ],
+        }
+        for case, rules in invalid_rules.items():
+            with self.subTest(case=case):
+                with self.assertRaises(ConfigError):
+                    RuleSet.from_config({"rules": rules})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yml")
+            with open(config_path, "w", encoding="utf-8") as file:
+                yaml.safe_dump({"rules": invalid_rules["pattern"]}, file)
+            exit_code, output = self._run([f"--config={config_path}", "schema.yml"])
+        self.assertEqual(exit_code, 2)
+        self.assertIn("Invalid rule 'a' at require.name", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
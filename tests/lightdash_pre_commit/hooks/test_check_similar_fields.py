@@ -0,0 +1,162 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import random
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Set, Tuple
+
+from lightdash_pre_commit.hooks.check_similar_fields import main
+from lightdash_pre_commit.hooks.minhash import (
+    BYTES_PER_BUCKET_ENTRY,
+    BYTES_PER_NEIGHBOR,
+    SimilarityIndex,
+    jaccard,
+    shingles,
+)
+
+WORDS = "total revenue order count customer amount date status net gross".split()
+
+
+class TestCheckSimilarFields(unittest.TestCase):
+    """Test the check_similar_fields hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "check_similar_fields"
+        )
+        self.orders = os.path.join(self.fixtures_dir, "orders.yml")
+        self.payments = os.path.join(self.fixtures_dir, "payments.yml")
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_similar_labels(self):
+        """Test labels sharing most of their words are reported, in any order."""
+        exit_code, output = self._run([self.orders])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  The label of metric 'total_revenue' in model 'orders' "
+                "('Total Revenue') is similar to that of "
+                "metric 'revenue_total' in model 'orders' ('Revenue Total (USD)')",
+            ],
+        )
+
+        exit_code, output = self._run(["--threshold=0.7", self.orders])
+        self.assertEqual((exit_code, output), (0, ""))
+
+    def test_similar_descriptions_across_project(self):
+        """Test texts of the other files of the project are reported with their path."""
+        exit_code, output = self._run(
+            [self.payments, "--search-path", self.fixtures_dir]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  The description of metric 'revenue' in model 'payments' "
+                "('Sum of the amounts of completed orders.') is similar to that of "
+                "metric 'total_revenue' in model 'orders' "
+                f"('Sum of the amounts of the completed orders') ('{self.orders}')",
+            ],
+        )
+
+    def test_index_matches_pairwise_comparison(self):
+        """Test the index finds the similar texts of pairwise comparison, in any number of passes."""
+        rng = random.Random(0)
+        texts = [
+            " ".join(rng.sample(WORDS, rng.randint(2, 4))) + f" {number % 300}"
+            for number in range(1000)
+        ]
+        threshold = 0.6
+        token_sets = [shingles(text) for text in texts]
+        expected = {
+            (left, right)
+            for left in range(len(texts))
+            for right in range(len(texts))
+            if left != right
+            and jaccard(token_sets[left], token_sets[right]) >= threshold
+        }
+
+        def _similar(max_memory: int) -> Tuple[SimilarityIndex[int], Set[Tuple]]:
+            index: SimilarityIndex[int] = SimilarityIndex(threshold, max_memory)
+            for number, text in enumerate(texts):
+                index.add(number, text)
+            found = {
+                (key, other)
+                for key, others in index.similar().items()
+                for other in others
+            }
+            # LSH may miss a few pairs, but never reports dissimilar texts
+            self.assertLessEqual(found, expected)
+            return index, found
+
+        index, found = _similar(1 << 30)
+        self.assertGreaterEqual(len(found) / len(expected), 0.95)
+        self.assertEqual((index.passes, index.truncated), (1, False))
+
+        # Enough memory for the signatures and the pairs found, but only for
+        # the buckets of a few bands per pass
+        max_memory = (
+            index.memory()
+            + len(found) * BYTES_PER_NEIGHBOR
+            + 2 * len(set(token_sets)) * BYTES_PER_BUCKET_ENTRY
+        )
+        index, found_in_passes = _similar(max_memory)
+        self.assertEqual(found_in_passes, found)
+        self.assertFalse(index.truncated)
+        self.assertGreaterEqual(index.passes, index.bands // 2)
+
+    def test_memory_cap_bounds_similar_texts(self):
+        """Test the comparison stops once the similar texts outgrow the memory cap."""
+        # Boilerplate labels are all similar to each other
+        texts = [f"Count of the orders of shop {number}" for number in range(300)]
+        index: SimilarityIndex[int] = SimilarityIndex(0.6, 1 << 30)
+        for number, text in enumerate(texts):
+            index.add(number, text)
+        pairs = sum(len(others) for others in index.similar().values())
+        self.assertEqual(pairs, 300 * 299)
+
+        max_memory = (
+            index.memory() + 300 * BYTES_PER_BUCKET_ENTRY + 1000 * BYTES_PER_NEIGHBOR
+        )
+        index.max_memory = max_memory
+        similar = index.similar()
+        self.assertTrue(index.truncated)
+        self.assertLessEqual(
+            sum(len(others) for others in similar.values()) * BYTES_PER_NEIGHBOR,
+            max_memory - index.memory(),
+        )
+
+        index.max_memory = index.memory() // 2
+        self.assertEqual((index.similar(), index.truncated), ({}, True))
+
+    def test_truncated_comparison_fails(self):
+        """Test the hook fails when the texts cannot all be compared."""
+        exit_code, output = self._run(["--max-memory-mb=0", self.payments])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Stopped comparing the labels at the memory cap of 0 MiB", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
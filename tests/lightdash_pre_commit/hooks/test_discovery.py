@@ -0,0 +1,180 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks import check_duplicate_dimensions_and_metrics_v2
+from lightdash_pre_commit.hooks.discovery import (
+    DiscoveryError,
+    IgnoreRules,
+    discover_files,
+    iter_file_paths,
+    load_project,
+)
+from lightdash_pre_commit.hooks.sharding import ShardReport
+
+DUPLICATE_MODEL = {
+    "name": "orders",
+    "columns": [
+        {
+            "name": "amount",
+            "config": {
+                "meta": {
+                    "dimension": {"type": "number"},
+                    "metrics": {"amount": {"type": "sum"}},
+                }
+            },
+        }
+    ],
+}
+
+
+class TestDiscovery(unittest.TestCase):
+    """Test discovering the schema files of a dbt project."""
+
+    def setUp(self):
+        """Write a dbt project with files ignored at several levels of a git repository."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.repo_dir = temp_dir.name
+        self.project_dir = os.path.join(self.repo_dir, "dbt")
+        os.makedirs(os.path.join(self.repo_dir, ".git"))
+        self._write(".gitignore", "# Scratch files\n*.tmp.yml\n")
+        self._write(
+            "dbt/dbt_project.yml",
+            yaml.safe_dump({"name": "shop", "model-paths": ["models", "marts"]}),
+        )
+        self._write("dbt/.gitignore", "/models/generated/\n")
+        for path in (
+            "dbt/models/orders.yml",
+            "dbt/models/payments.yaml",
+            "dbt/models/generated/events.yml",
+            "dbt/models/scratch.tmp.yml",
+            "dbt/models/staging/ignored.yml",
+            "dbt/models/staging/keep.tmp.yml",
+            "dbt/models/staging/stg_orders.yml",
+            "dbt/marts/customers.yml",
+            "dbt/seeds/countries.yml",
+        ):
+            self._write(path, yaml.safe_dump({"version": 2, "models": []}))
+        self._write("dbt/models/orders.sql", "select 1")
+        self._write("dbt/models/staging/.gitignore", "ignored.yml\n!keep.tmp.yml\n")
+        self._write(
+            "dbt/marts/customers.yml",
+            yaml.safe_dump({"version": 2, "models": [DUPLICATE_MODEL]}),
+        )
+
+    def _write(self, path: str, content: str) -> None:
+        path = os.path.join(self.repo_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+    def _relative(self, paths):
+        return [os.path.relpath(path, self.project_dir) for path in paths]
+
+    def test_discover_files(self):
+        """Test the files of the model paths are found in order, honoring .gitignore."""
+        project = load_project(self.project_dir)
+        self.assertEqual(project.model_paths, ("models", "marts"))
+        self.assertEqual(
+            self._relative(discover_files(project)),
+            [
+                os.path.join("models", "orders.yml"),
+                os.path.join("models", "payments.yaml"),
+                os.path.join("models", "staging", "keep.tmp.yml"),
+                os.path.join("models", "staging", "stg_orders.yml"),
+                os.path.join("marts", "customers.yml"),
+            ],
+        )
+
+    def test_ignore_patterns(self):
+        """Test the gitignore patterns follow git."""
+        rules = IgnoreRules(
+            "/repo",
+            ["target/", "/dbt_packages", "docs/**/*.yml", "a?[!c].yml", r"\#b.yml"],
+        )
+        self.assertTrue(rules.match("/repo/models/target", is_dir=True))
+        self.assertIsNone(rules.match("/repo/models/target", is_dir=False))
+        self.assertTrue(rules.match("/repo/dbt_packages", is_dir=True))
+        self.assertIsNone(rules.match("/repo/models/dbt_packages", is_dir=True))
+        self.assertTrue(rules.match("/repo/docs/schema.yml", is_dir=False))
+        self.assertTrue(rules.match("/repo/docs/a/b/schema.yml", is_dir=False))
+        self.assertTrue(rules.match("/repo/models/abd.yml", is_dir=False))
+        self.assertIsNone(rules.match("/repo/models/abc.yml", is_dir=False))
+        self.assertTrue(rules.match("/repo/#b.yml", is_dir=False))
+        self.assertIsNone(rules.match("/other/docs/schema.yml", is_dir=False))
+
+    def test_files_are_checked_as_discovered(self):
+        """Test the report reads the discovered files one at a time."""
+        report = ShardReport("hook", discover_files(load_project(self.project_dir)))
+        files = iter(report)
+        first = next(files)
+        self.assertEqual(report.file_paths, [first])
+        self.assertEqual(len(list(files)), 4)
+        self.assertEqual(len(report.file_paths), 5)
+        self.assertEqual(list(report), report.file_paths)
+
+    def test_passed_and_discovered_files_are_yielded_once(self):
+        """Test a file passed explicitly and found under the project is checked once."""
+        orders = os.path.join(self.project_dir, "models", "orders.yml")
+        customers = os.path.join(self.project_dir, "marts", "customers.yml")
+        args = argparse.Namespace(
+            filenames=[
+                customers,
+                os.path.join(self.project_dir, "marts", ".", "customers.yml"),
+            ],
+            project_dir=load_project(self.project_dir),
+        )
+        file_paths = list(iter_file_paths(args))
+        self.assertEqual(file_paths[0], customers)
+        self.assertEqual(len(file_paths), 5)
+        self.assertEqual(file_paths.count(customers), 1)
+        self.assertIn(orders, file_paths)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            check_duplicate_dimensions_and_metrics_v2.main(
+                [customers, f"--project-dir={self.project_dir}"]
+            )
+        self.assertEqual(output.getvalue().count("Duplicate name 'amount'"), 1)
+
+    def test_project_dir_option(self):
+        """Test the hooks check the files of a project and reject invalid projects."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = check_duplicate_dimensions_and_metrics_v2.main(
+                [f"--project-dir={self.project_dir}"]
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Duplicate name 'amount'", output.getvalue())
+
+        with self.assertRaises(DiscoveryError):
+            load_project(self.repo_dir)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as context:
+            check_duplicate_dimensions_and_metrics_v2.main(
+                [f"--project-dir={self.repo_dir}"]
+            )
+        self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
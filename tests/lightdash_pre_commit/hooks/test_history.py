@@ -0,0 +1,168 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import Callable, List, Tuple
+from unittest import mock
+
+from lightdash_pre_commit import cli
+from lightdash_pre_commit.hooks import (
+    check_duplicate_dimensions_and_metrics_v2,
+    validate_joins,
+)
+from lightdash_pre_commit.hooks.history import (
+    HISTORY_ENV,
+    percentile,
+    read_history,
+    summarize_history,
+)
+
+
+def _record(hook: str, version: str, duration: float, files: dict) -> dict:
+    return {
+        "format_version": 1,
+        "hook": hook,
+        "version": version,
+        "time": "2025-01-01T00:00:00+00:00",
+        "files": len(files),
+        "cache_hits": 0,
+        "exit_code": 0,
+        "duration": duration,
+        "stages": {"load": duration * 0.75, "check": duration * 0.25},
+        "peak_rss": 64 * 1024 * 1024,
+        "slowest_files": files,
+    }
+
+
+class TestHistory(unittest.TestCase):
+    """Test the local run history of the hooks and its summary."""
+
+    def setUp(self):
+        """Set up the fixture directory path and a history file."""
+        self.fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.history_file = os.path.join(self.temp_dir, "history.jsonl")
+        # The history of the developer running the tests is left alone
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop(HISTORY_ENV, None)
+
+    def _run(self, main: Callable, argv: List[str]) -> Tuple[int, str]:
+        """Run a command and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_hook_appends_one_record_per_run(self):
+        """Test the history is opt-in and records one run per line."""
+        file_path = os.path.join(
+            self.fixtures_dir,
+            "check_duplicate_dimensions_and_metrics_v2",
+            "duplicate_within_metrics.yml",
+        )
+        main = check_duplicate_dimensions_and_metrics_v2.main
+        self._run(main, [file_path])
+        self.assertFalse(os.path.exists(self.history_file))
+
+        self._run(main, [f"--history-file={self.history_file}", file_path])
+        with mock.patch.dict(os.environ, {HISTORY_ENV: self.history_file}):
+            self._run(main, [file_path])
+        records = read_history(self.history_file)
+        self.assertEqual(len(records), 2)
+        record = records[0]
+        self.assertEqual(record["hook"], "check-duplicate-dimensions-and-metrics-v2")
+        self.assertEqual((record["files"], record["exit_code"]), (1, 1))
+        self.assertEqual(set(record["stages"]), {"load", "validate", "check"})
+        self.assertEqual(list(record["slowest_files"]), [os.path.normpath(file_path)])
+        self.assertGreater(record["peak_rss"], 0)
+
+    def test_cache_hits(self):
+        """Test validate-joins records the files found fresh in its cache."""
+        fixtures_dir = os.path.join(self.fixtures_dir, "validate_joins")
+        argv = [
+            f"--history-file={self.history_file}",
+            f"--cache-dir={os.path.join(self.temp_dir, 'cache')}",
+            os.path.join(fixtures_dir, "orders.yml"),
+            os.path.join(fixtures_dir, "customers.yml"),
+        ]
+        self._run(validate_joins.main, argv)
+        self._run(validate_joins.main, argv)
+        records = read_history(self.history_file)
+        self.assertEqual([record["cache_hits"] for record in records], [0, 2])
+        self.assertEqual(len(records[1]["slowest_files"]), 0)
+
+    def test_model_cache_hits(self):
+        """Test the files whose models all reuse their cached errors are recorded."""
+        fixtures_dir = os.path.join(
+            self.fixtures_dir, "check_duplicate_dimensions_and_metrics_v2"
+        )
+        argv = [
+            f"--history-file={self.history_file}",
+            f"--cache-dir={os.path.join(self.temp_dir, 'cache')}",
+            os.path.join(fixtures_dir, "duplicate_within_metrics.yml"),
+        ]
+        first = self._run(check_duplicate_dimensions_and_metrics_v2.main, argv)
+        second = self._run(check_duplicate_dimensions_and_metrics_v2.main, argv)
+        self.assertEqual(second, first)
+        records = read_history(self.history_file)
+        self.assertEqual([record["cache_hits"] for record in records], [0, 1])
+
+    def test_summary(self):
+        """Test the summary reports percentiles, versions and slowing files."""
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        records = [
+            _record("validate-joins", "0.1.0", 1.0, {"a.yml": 0.1, "b.yml": 0.9}),
+            _record("validate-joins", "0.1.0", 1.0, {"a.yml": 0.1, "b.yml": 0.9}),
+            _record("validate-joins", "0.2.0", 2.0, {"a.yml": 0.4, "b.yml": 0.9}),
+            _record("validate-joins", "0.2.0", 2.0, {"a.yml": 0.5, "b.yml": 1.0}),
+            _record("check-naming-conventions", "0.2.0", 0.5, {"c.yml": 0.5}),
+        ]
+        summary = summarize_history(records, hook="validate-joins")
+        self.assertNotIn("check-naming-conventions", summary)
+        self.assertIn("validate-joins: 4 runs", summary)
+        self.assertIn("duration: p50 1.50s, p90 2.00s, p99 2.00s, max 2.00s", summary)
+        self.assertIn("stages: load 4.50s (75%), check 1.50s (25%)", summary)
+        self.assertIn("trend: p50 500.0ms per file in the first 2 runs", summary)
+        self.assertIn("0.2.0: 2 runs, p50 1.00s per file (+100%)", summary)
+        # b.yml only grew by 6%
+        self.assertIn("a.yml: 100.0ms -> 450.0ms (4.5x over 4 runs)", summary)
+        self.assertNotIn("b.yml", summary)
+
+    def test_stats_command(self):
+        """Test the stats command skips broken lines and requires a history."""
+        exit_code, output = self._run(cli.main, ["stats"])
+        self.assertEqual(exit_code, 2)
+        self.assertIn(HISTORY_ENV, output)
+
+        with open(self.history_file, "w", encoding="utf-8") as file:
+            file.write(json.dumps(_record("validate-joins", "0.1.0", 1.0, {})) + "\n")
+            file.write('{"format_version": 1, "hook": "valid')
+        exit_code, output = self._run(
+            cli.main, ["stats", f"--history-file={self.history_file}"]
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertIn("validate-joins: 1 run from", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import Callable, List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks import (
+    check_duplicate_dimensions_and_metrics_v2,
+    check_naming_conventions,
+)
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
+    FindDuplicateDimensionsAndMetricsV2,
+)
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+
+def _model(name: str, metric: str) -> dict:
+    """Make a model with a duplicate name between a metric and a dimension."""
+    return {
+        "name": name,
+        "columns": [
+            {
+                "name": "amount",
+                "config": {
+                    "meta": {
+                        "dimension": {"type": "number"},
+                        "metrics": {metric: {"type": "sum"}},
+                    }
+                },
+            }
+        ],
+    }
+
+
+class TestIncremental(unittest.TestCase):
+    """Test re-checking only the models that changed since the previous run."""
+
+    def setUp(self):
+        """Write a schema file with a few models."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.file_path = os.path.join(self.temp_dir, "schema.yml")
+        self.models = [_model(f"model_{index}", "amount") for index in range(4)]
+        self._write()
+
+    def _write(self, **document) -> None:
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            yaml.safe_dump({"version": 2, "models": self.models, **document}, file)
+
+    def _process(self, cache: ModelResultCache) -> Tuple[List[str], bool]:
+        return process_single_file(
+            self.file_path,
+            LightdashV25,
+            FindDuplicateDimensionsAndMetricsV2,
+            model_cache=cache,
+        )
+
+    def _run(self, main: Callable, argv: List[str]) -> Tuple[int, str]:
+        """Run a hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_only_changed_models_are_checked(self):
+        """Test the stored results of unchanged models are reused in order."""
+        expected = self._process(None)
+        cache = ModelResultCache()
+        self.assertEqual(self._process(cache), expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+        self.assertEqual(self._process(cache), expected)
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+
+        # Fix the duplicate of the second model only
+        self.models[1] = _model("model_1", "total_amount")
+        self._write()
+        errors, success = self._process(cache)
+        self.assertEqual((cache.hits, cache.misses), (7, 5))
+        self.assertEqual((errors, success), self._process(None))
+        self.assertEqual(len(errors), 3)
+        self.assertNotIn("model_1", " ".join(errors))
+
+    def test_invalid_document_is_processed_as_a_whole(self):
+        """Test validation errors keep the locations of the whole document."""
+        cache = ModelResultCache()
+        self._process(cache)
+        self.models[2]["columns"][0]["name"] = ["not", "a", "name"]
+        self._write()
+        errors, success = self._process(cache)
+        self.assertFalse(success)
+        self.assertEqual((errors, success), self._process(None))
+        self.assertIn("models[2].columns[0].name", errors[0])
+        # The rest of the document is validated even if no model changed
+        self.models[2] = _model("model_2", "amount")
+        self._write(metrics=[{"label": "no name"}])
+        errors, _ = self._process(cache)
+        self.assertIn("metrics[0].name: Field required", errors[0])
+
+    def test_cache_between_runs(self):
+        """Test the results persist between runs of the hooks and follow the config."""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        expected = self._run(
+            check_duplicate_dimensions_and_metrics_v2.main, [self.file_path]
+        )
+        for _ in range(2):
+            self.assertEqual(
+                self._run(
+                    check_duplicate_dimensions_and_metrics_v2.main,
+                    [f"--cache-dir={cache_dir}", self.file_path],
+                ),
+                expected,
+            )
+
+        config_path = os.path.join(self.temp_dir, "config.yml")
+        for prefix in ("amount", "total_"):
+            with open(config_path, "w", encoding="utf-8") as file:
+                yaml.safe_dump(
+                    {"naming_conventions": {"metrics": {"pattern": f"^{prefix}"}}},
+                    file,
+                )
+            argv = [f"--config={config_path}", self.file_path]
+            self.assertEqual(
+                self._run(
+                    check_naming_conventions.main, [f"--cache-dir={cache_dir}"] + argv
+                ),
+                self._run(check_naming_conventions.main, argv),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import main
+from lightdash_pre_commit.hooks.limits import (
+    DuplicateKey,
+    ResourceLimitError,
+    ResourceLimits,
+    find_duplicate_keys,
+    load_yaml,
+    time_limit,
+)
+
+DUPLICATE_KEYS = """\
+base: &base
+  type: sum
+  type: count
+metrics:
+  revenue:
+    <<: *base
+    type: max
+  orders:
+    <<: *base
+  revenue: {}
+  1: one
+  "1": quoted
+"""
+
+
+class TestLimits(unittest.TestCase):
+    """Test the resource limits protecting the hooks against pathological files."""
+
+    def setUp(self):
+        """Set up the fixture directory paths."""
+        self.fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+        self.alias_bomb = os.path.join(self.fixtures_dir, "limits", "alias_bomb.yml")
+        self.valid_file = os.path.join(
+            self.fixtures_dir,
+            "check_duplicate_dimensions_and_metrics_v2",
+            "duplicate_within_metrics.yml",
+        )
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_alias_bomb_is_rejected_without_expansion(self):
+        """Test an alias bomb is reported and the remaining files are checked."""
+        start = time.perf_counter()
+        exit_code, output = self._run([self.alias_bomb, self.valid_file])
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            f"Failed to process '{self.alias_bomb}': document has 490329073 nodes "
+            "once aliases are expanded, more than the limit of 5000000 (--max-nodes)",
+            output,
+        )
+        self.assertIn("Duplicate name", output)
+
+    def test_alias_expansion(self):
+        """Test the nodes added by aliases are limited separately."""
+        limits = ResourceLimits(max_nodes=None, max_alias_expansion=1000)
+        with self.assertRaisesRegex(ResourceLimitError, "--max-alias-expansion"):
+            load_yaml(self.alias_bomb, limits)
+        # Files within the limits load as usual
+        data = load_yaml(
+            os.path.join(self.fixtures_dir, "validate_joins", "orders.yml"), limits
+        )
+        self.assertEqual(data["models"][0]["name"], "orders")
+
+    def test_recursive_alias(self):
+        """Test a recursive alias is reported instead of looping."""
+        with self.assertRaisesRegex(
+            ResourceLimitError, "recursive alias of the node at line 3"
+        ):
+            load_yaml(os.path.join(self.fixtures_dir, "limits", "recursive_alias.yml"))
+
+    def test_errors_of_composed_nodes_keep_their_line(self):
+        """Test the errors of the nodes, which only keep their line, locate them."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "unsafe.yml")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("version: 2\nmodels: !!python/name:os.system x\n")
+            with self.assertRaises(yaml.constructor.ConstructorError) as context:
+                load_yaml(path)
+        self.assertIn(f'in "{path}", line 2', str(context.exception))
+
+    def test_file_size_and_depth(self):
+        """Test the file size and depth limits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "deep.yml")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("models: " + "[" * 300 + "]" * 300 + "\n")
+            exit_code, output = self._run(["--max-file-size=100", path])
+            self.assertEqual(exit_code, 1)
+            self.assertIn("file is 609 bytes, more than the limit of 100 bytes", output)
+            exit_code, output = self._run([path])
+            self.assertEqual(exit_code, 1)
+            self.assertIn(
+                "document is nested 301 levels deep, more than the limit of 200",
+                output,
+            )
+
+    def test_duplicate_keys(self):
+        """Test repeated keys are found with any loader, once per aliased node."""
+        loaders = [yaml.SafeLoader]
+        if yaml.__with_libyaml__:
+            loaders.append(yaml.CSafeLoader)
+        for loader in loaders:
+            with self.subTest(loader=loader.__name__):
+                node = yaml.compose(DUPLICATE_KEYS, Loader=loader)
+                # Merge keys override nothing, and keys of other types differ
+                self.assertEqual(
+                    find_duplicate_keys(node),
+                    [DuplicateKey("type", 3, 2), DuplicateKey("revenue", 10, 5)],
+                )
+
+    def test_time_limit(self):
+        """Test the time limit interrupts a runaway file."""
+        start = time.perf_counter()
+        with self.assertRaisesRegex(ResourceLimitError, "--timeout"):
+            with time_limit(0.05):
+                while True:
+                    pass
+        self.assertLess(time.perf_counter() - start, 1)
+        # No limit applies afterwards
+        with time_limit(None):
+            time.sleep(0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,321 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory budgets of the hooks on large synthetic projects.
+
+Each hook is run under tracemalloc over a whole project. The processing of
+every file is metered within the run, with a probe checker added after the
+checkers of the hook: it snapshots the allocations of a file over budget while
+its raw data, validated document and errors are all alive, so that the report
+lists the top allocation sites. The report of a project over budget lists what
+the run left allocated.
+
+The budgets are relative to measured baselines, so that they stay tight
+whatever the size of the synthetic project: a file is budgeted by its size on
+disk, and a run by the peak of its largest file. Both are also held to the
+absolute ceiling of docs/design.md, which the small projects are far below: the
+project of a realistic scale, with thousands of models in multi-MB files, only
+runs when LIGHTDASH_PRE_COMMIT_SLOW_TESTS is set, as it takes minutes under
+tracemalloc.
+"""
+
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from typing import Any, List, Optional, Sequence
+from unittest import mock
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks import (
+    check_duplicate_dimensions_and_metrics_v1,
+    check_duplicate_dimensions_and_metrics_v2,
+    check_naming_conventions,
+    utils,
+    validate_joins,
+)
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.utils import as_checkers, process_single_file
+
+MIB = 1024 * 1024
+
+NUM_FILES = 6
+NUM_MODELS = 4
+NUM_COLUMNS = 25
+# Project of a realistic scale: 2,000 models in files of 2.5 to 2.8 MB
+REALISTIC_NUM_FILES = 5
+REALISTIC_NUM_MODELS = 400
+
+# Environment variable enabling the tests on the project of a realistic scale
+SLOW_TESTS_ENV = "LIGHTDASH_PRE_COMMIT_SLOW_TESTS"
+
+# Peak traced memory of a single file with its raw data, validated document and
+# errors alive, per byte of the file. Files of about 28 KB peak at 0.8 to 1.1 MiB,
+# 34 to 39 times their size.
+FILE_BUDGET_RATIO = 50
+# Peak traced memory of a run over the project, beyond the peak of its largest
+# file. A run holds one file at a time, so the peak stays close to the peak of
+# its largest file rather than growing with the number of files, as it must for
+# the hooks to stay under the 100 MB of docs/design.md on real projects. Runs
+# measure 0.05 to 0.2 MiB above, the join index growing with the project.
+PROJECT_MARGIN = MIB // 2
+# Ceiling of the peak traced memory of a file and of a run, whatever their size:
+# the "Memory usage <100MB for typical projects" of docs/design.md. The files of
+# the project of a realistic scale peak at 49 to 80 MiB, and so do their runs.
+DESIGN_BUDGET = 100 * 1000 * 1000
+# Number of allocation sites reported when a budget is exceeded
+TOP_SITES = 10
+
+
+def make_model(file_index: int, model_index: int, layout: str, num_models: int) -> dict:
+    """Make a model with a dimension and metrics per column, and a few duplicates."""
+    name = f"model_{file_index}_{model_index}"
+    columns = []
+    for column_index in range(NUM_COLUMNS):
+        meta = {
+            "dimension": {"type": "number", "label": f"Column {column_index}"},
+            "metrics": {
+                f"total_{column_index}": {"type": "sum", "description": "Total"},
+                # Duplicated across the columns of the model
+                f"average_{column_index % 5}": {"type": "average"},
+            },
+        }
+        column: dict = {"name": f"column_{column_index}", "description": "A column"}
+        if layout == "1.9":
+            column["meta"] = meta
+        else:
+            column["config"] = {"meta": meta}
+        columns.append(column)
+    model_meta = {
+        "joins": [
+            {
+                "join": f"model_{file_index}_{(model_index + 1) % num_models}",
+                "sql_on": "${a.id} = ${b.id}",
+            }
+        ],
+        "metrics": {"row_count": {"type": "count", "sql": "1"}},
+    }
+    model: dict = {"name": name, "columns": columns}
+    if layout == "1.9":
+        model["meta"] = model_meta
+    else:
+        model["config"] = {"meta": model_meta}
+    return model
+
+
+def write_project(
+    directory: str,
+    layout: str,
+    num_files: int = NUM_FILES,
+    num_models: int = NUM_MODELS,
+) -> List[str]:
+    """Write a synthetic dbt project in the layout of dbt 1.9 or 1.10."""
+    paths = []
+    for file_index in range(num_files):
+        path = os.path.join(directory, f"schema_{file_index}.yml")
+        document = {
+            "version": 2,
+            "models": [
+                make_model(file_index, model_index, layout, num_models)
+                for model_index in range(num_models)
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            yaml.safe_dump(document, file, sort_keys=False)
+        paths.append(path)
+    return paths
+
+
+class SnapshotProbe(BaseChecker):
+    """Snapshot the traced allocations if a file is over budget so far."""
+
+    def __init__(self, baseline: int, budget: int) -> None:
+        super().__init__()
+        self.baseline = baseline
+        self.budget = budget
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def finish_document(self, data) -> List[str]:
+        if tracemalloc.get_traced_memory()[1] - self.baseline > self.budget:
+            self.snapshot = tracemalloc.take_snapshot()
+        return []
+
+
+class FileMeter:
+    """Wrap process_single_file to meter the peak of each file of a run."""
+
+    def __init__(self) -> None:
+        self.run_baseline = tracemalloc.get_traced_memory()[0]
+        self.run_peak = 0
+        # Peak and budget of each file processed, and the snapshot of those
+        # over budget
+        self.peaks: List[Any] = []
+
+    def __call__(self, file_path, validator_class, checker_class, *args, **kwargs):
+        baseline = tracemalloc.get_traced_memory()[0]
+        self.run_peak = max(self.run_peak, self.current_run_peak())
+        tracemalloc.reset_peak()
+        budget = min(FILE_BUDGET_RATIO * os.path.getsize(file_path), DESIGN_BUDGET)
+        probe = SnapshotProbe(baseline, budget)
+        result = process_single_file(
+            file_path,
+            validator_class,
+            as_checkers(checker_class) + [probe],
+            *args,
+            **kwargs,
+        )
+        peak = tracemalloc.get_traced_memory()[1]
+        self.run_peak = max(self.run_peak, peak - self.run_baseline)
+        self.peaks.append((file_path, peak - baseline, budget, probe.snapshot))
+        return result
+
+    def current_run_peak(self) -> int:
+        return tracemalloc.get_traced_memory()[1] - self.run_baseline
+
+
+def top_sites(snapshot: tracemalloc.Snapshot) -> str:
+    """Render the allocation sites holding the most memory in a snapshot."""
+    statistics = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    ).statistics("lineno")
+    return "\n".join(
+        f"  {statistic.size / MIB:7.2f} MiB in {statistic.count:7d} blocks at "
+        f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}"
+        for statistic in statistics[:TOP_SITES]
+    )
+
+
+class MemoryTestCase(unittest.TestCase):
+    """Base of the tests running the hooks over a synthetic project."""
+
+    num_files = NUM_FILES
+    num_models = NUM_MODELS
+
+    @classmethod
+    def setUpClass(cls):
+        """Write a project in each layout."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.projects = {}
+        for layout in ("1.9", "1.10"):
+            directory = os.path.join(cls.temp_dir.name, layout)
+            os.makedirs(directory)
+            cls.projects[layout] = write_project(
+                directory, layout, cls.num_files, cls.num_models
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the projects."""
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        """Start tracing the allocations."""
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+
+    def _check_budgets(
+        self, hook: Any, argv: Sequence[str], caller: Any = None
+    ) -> None:
+        """Run a hook over a project and check the peaks of its files and its run.
+
+        `caller` is the module calling process_single_file, the hook by default.
+        """
+        meter = FileMeter()
+        with mock.patch.object(caller or hook, "process_single_file", meter):
+            with redirect_stdout(io.StringIO()):
+                exit_code = hook.main(list(argv))
+        # Every file holds duplicates or naming violations
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(len(meter.peaks), self.num_files)
+
+        for file_path, peak, budget, snapshot in meter.peaks:
+            if peak > budget:
+                self.fail(
+                    f"Peak of {peak / MIB:.2f} MiB for '{file_path}', more than the "
+                    f"budget of {budget / MIB:.2f} MiB. Top allocation sites:\n"
+                    + top_sites(snapshot)
+                )
+        run_peak = max(meter.run_peak, meter.current_run_peak())
+        project_budget = min(
+            max(peak for _, peak, _, _ in meter.peaks) + PROJECT_MARGIN, DESIGN_BUDGET
+        )
+        if run_peak > project_budget:
+            self.fail(
+                f"Peak of {run_peak / MIB:.2f} MiB for {self.num_files} files, more "
+                f"than the budget of {project_budget / MIB:.2f} MiB. Top allocation "
+                "sites left after the run:\n" + top_sites(tracemalloc.take_snapshot())
+            )
+
+
+class TestMemory(MemoryTestCase):
+    """Test the hooks stay within their memory budgets on large projects."""
+
+    def test_duplicates_v1(self):
+        """Test the duplicates hook on a dbt 1.9 project."""
+        self._check_budgets(
+            check_duplicate_dimensions_and_metrics_v1, self.projects["1.9"]
+        )
+
+    def test_duplicates_v2(self):
+        """Test the duplicates hook on a dbt 1.10 project."""
+        self._check_budgets(
+            check_duplicate_dimensions_and_metrics_v2, self.projects["1.10"]
+        )
+
+    def test_naming_conventions(self):
+        """Test the naming conventions hook with a pattern every metric breaks."""
+        config_path = os.path.join(self.temp_dir.name, "config.yml")
+        with open(config_path, "w", encoding="utf-8") as file:
+            yaml.safe_dump(
+                {"naming_conventions": {"metrics": {"pattern": "^metric_"}}}, file
+            )
+        self._check_budgets(
+            check_naming_conventions,
+            [f"--config={config_path}"] + self.projects["1.10"],
+        )
+
+    def test_validate_joins(self):
+        """Test the join validation hook, which indexes the whole project."""
+        # The files are indexed through utils.update_file_index
+        self._check_budgets(validate_joins, self.projects["1.10"], utils)
+
+
+@unittest.skipUnless(
+    os.environ.get(SLOW_TESTS_ENV), f"set {SLOW_TESTS_ENV} to run the slow tests"
+)
+class TestRealisticMemory(MemoryTestCase):
+    """Test the hooks stay under docs/design.md on a project of a realistic scale."""
+
+    num_files = REALISTIC_NUM_FILES
+    num_models = REALISTIC_NUM_MODELS
+
+    def test_duplicates_v1(self):
+        """Test the duplicates hook on a dbt 1.9 project."""
+        self._check_budgets(
+            check_duplicate_dimensions_and_metrics_v1, self.projects["1.9"]
+        )
+
+    def test_validate_joins(self):
+        """Test the join validation hook, which indexes the whole project."""
+        self._check_budgets(validate_joins, self.projects["1.10"], utils)
+
+
+if __name__ == "__main__":
+    unittest.main()
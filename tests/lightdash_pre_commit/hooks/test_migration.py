@@ -0,0 +1,124 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from lightdash_pre_commit.cli import main
+from lightdash_pre_commit.hooks.migration import migrate_text
+
+
+class TestMigration(unittest.TestCase):
+    """Test the migration of schema files to the dbt 1.10 layout."""
+
+    def setUp(self):
+        """Set up the fixture paths."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "migration"
+        )
+        with open(os.path.join(self.fixtures_dir, "orders.yml"), encoding="utf-8") as f:
+            self.original = f.read()
+        with open(
+            os.path.join(self.fixtures_dir, "orders_migrated.yml"), encoding="utf-8"
+        ) as f:
+            self.migrated = f.read()
+
+    def test_migrate_preserves_formatting(self):
+        """Test only the moved lines change, keeping their comments and layout."""
+        text, result = migrate_text("orders.yml", self.original)
+        self.assertEqual(result.errors, [])
+        # orders, and the order_id and amount columns
+        self.assertEqual(result.migrated, 3)
+        self.assertEqual(text, self.migrated)
+
+        crlf = self.original.replace("\n", "\r\n")
+        self.assertEqual(
+            migrate_text("orders.yml", crlf)[0], self.migrated.replace("\n", "\r\n")
+        )
+
+        # Migrating again changes nothing
+        text, result = migrate_text("orders.yml", self.migrated)
+        self.assertEqual((text, result.migrated, result.errors), (self.migrated, 0, []))
+
+    def test_unsupported_files_are_left_unchanged(self):
+        """Test files the migration cannot patch safely are reported, not rewritten."""
+        cases = {
+            "models:\n  - {name: orders, meta: {}}\n": "Cannot migrate model "
+            "'orders' at line 2: flow mappings are not supported",
+            "models:\n  - name: orders\n    meta: {}\n    config:\n      meta: {}\n": (
+                "Cannot migrate model 'orders' at line 4: 'meta' is set both on it "
+                "and under its 'config'"
+            ),
+            "models:\n  - meta:\n      metrics: {}\n    name: orders\n": (
+                "Cannot move 'meta' of model 'orders' at line 2: it does not start "
+                "its line"
+            ),
+        }
+        for text, error in cases.items():
+            with self.subTest(text=text):
+                migrated, result = migrate_text("schema.yml", text)
+                self.assertEqual(migrated, text)
+                self.assertEqual(result.errors, [error])
+
+        # An anchor moved below one of its aliases would no longer be defined
+        text = (
+            "models:\n  - name: orders\n    meta:\n      metrics: &none {}\n"
+            "    columns:\n      - name: id\n        meta: *none\n"
+            "    config:\n      materialized: table\n"
+        )
+        migrated, result = migrate_text("schema.yml", text)
+        self.assertEqual(migrated, text)
+        # The message of libyaml does not name the alias
+        self.assertEqual(len(result.errors), 1)
+        self.assertRegex(
+            result.errors[0],
+            r"^The migration of 'schema.yml' is invalid: found undefined alias"
+            r"( 'none')? at line 6 of the migrated file$",
+        )
+
+    def test_migrate_command(self):
+        """Test the files are migrated in place across workers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [os.path.join(temp_dir, f"orders_{n}.yml") for n in range(3)]
+            for path in paths:
+                shutil.copy(os.path.join(self.fixtures_dir, "orders.yml"), path)
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exit_code = main(["migrate", "--check", *paths])
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(
+                output.getvalue().splitlines()[-1], "3 of 3 files to migrate"
+            )
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exit_code = main(["migrate", "--jobs=2", *paths])
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(
+                output.getvalue().splitlines(),
+                [f"Migrated '{path}' (3 models and columns)" for path in paths]
+                + ["3 of 3 files migrated"],
+            )
+            for path in paths:
+                with open(path, encoding="utf-8") as file:
+                    self.assertEqual(file.read(), self.migrated)
+
+
+if __name__ == "__main__":
+    unittest.main()
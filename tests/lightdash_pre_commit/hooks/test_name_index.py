@@ -0,0 +1,108 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import unittest
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.name_index import (
+    NameIndex,
+    bounded_levenshtein,
+    did_you_mean,
+)
+from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+
+class TestNameIndex(unittest.TestCase):
+    """Test the nearest-name index."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+
+    def _load_fixture(self, version: str, filename: str) -> dict:
+        """Load a YAML fixture file and return the parsed data."""
+        fixture_path = os.path.join(
+            self.fixtures_dir,
+            f"check_duplicate_dimensions_and_metrics_{version}",
+            filename,
+        )
+        with open(fixture_path, "r", encoding="utf-8") as file:
+            return yaml.safe_load(file)
+
+    def test_bounded_levenshtein(self):
+        """Test the edit distance stops at the bound."""
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 3), 3)
+        self.assertIsNone(bounded_levenshtein("kitten", "sitting", 2))
+        self.assertEqual(bounded_levenshtein("", "ab", 2), 2)
+        self.assertIsNone(bounded_levenshtein("a", "abcd", 2))
+
+    def test_suggestions_from_documents(self):
+        """Test model and field names of both parsers are indexed."""
+        index = NameIndex.from_documents(
+            [
+                LightdashV20.model_validate(
+                    self._load_fixture("v1", "unique_names.yml")
+                ),
+                LightdashV25.model_validate(
+                    self._load_fixture("v2", "unique_names.yml")
+                ),
+            ]
+        )
+        self.assertIn("date_at", index)
+        self.assertIn("Test All Clean - No Duplicates", index)
+        self.assertEqual(index.suggest("revenue_totl"), ["revenue_total"])
+        self.assertEqual(index.suggest("completely_unrelated"), [])
+
+    def test_suggestions_are_ranked_and_limited(self):
+        """Test suggestions are ordered by distance then name."""
+        index = NameIndex(["order_created_at", "order_updated_at", "orders", "order"])
+        self.assertEqual(index.suggest("order_crated_at"), ["order_created_at"])
+        self.assertEqual(index.suggest("ordrs", limit=2), ["orders", "order"])
+        self.assertEqual(index.suggest("order"), ["orders"])
+
+    def test_suggestions_match_brute_force(self):
+        """Test the gram filter never drops a name within the distance bound."""
+        rng = random.Random(7)
+        alphabet = "abcde_"
+        names = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            for _ in range(1000)
+        }
+        index = NameIndex(names)
+        for _ in range(100):
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            expected = sorted(
+                (distance, name)
+                for name in names
+                if name != query
+                for distance in [bounded_levenshtein(query, name, 2)]
+                if distance is not None
+            )
+            self.assertEqual(
+                index.suggest(query, limit=len(names)),
+                [name for _, name in expected],
+                query,
+            )
+
+    def test_did_you_mean(self):
+        """Test the rendering of suggestions."""
+        self.assertEqual(did_you_mean([]), "")
+        self.assertEqual(did_you_mean(["a"]), " (did you mean 'a'?)")
+        self.assertEqual(
+            did_you_mean(["a", "b", "c"]), " (did you mean 'a', 'b' or 'c'?)"
+        )
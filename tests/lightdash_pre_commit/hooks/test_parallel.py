@@ -0,0 +1,182 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Optional, Tuple
+from unittest import mock
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks import (
+    check_duplicate_dimensions_and_metrics_v1,
+    parallel,
+)
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v1 import (
+    FindDuplicateDimensionsAndMetricsV1,
+)
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
+    FindDuplicateDimensionsAndMetricsV2,
+)
+from lightdash_pre_commit.hooks.incremental import ModelResultCache
+from lightdash_pre_commit.hooks.limits import ResourceLimitError, time_limit
+from lightdash_pre_commit.hooks.parallel import ModelPool
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+NUM_MODELS = 13
+
+
+def _model(index: int, layout: str) -> dict:
+    """Make a model whose even columns duplicate a metric as a dimension."""
+    columns = []
+    for column in range(3):
+        metric = f"amount_{column}" if index % 2 == 0 else f"total_{column}"
+        meta = {"dimension": {"type": "number"}, "metrics": {metric: {"type": "sum"}}}
+        entry: dict = {"name": f"amount_{column}"}
+        if layout == "1.9":
+            entry["meta"] = meta
+        else:
+            entry["config"] = {"meta": meta}
+        columns.append(entry)
+    return {"name": f"model_{index}", "columns": columns}
+
+
+class SlowChecker(BaseChecker):
+    """Spend a while on each model."""
+
+    def visit_model(self, node) -> None:
+        time.sleep(0.2)
+
+
+class TestParallel(unittest.TestCase):
+    """Test validating and checking the models of a large file across processes."""
+
+    def setUp(self):
+        """Write a schema file in each layout and start a pool of two workers."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.models = {
+            layout: [_model(index, layout) for index in range(NUM_MODELS)]
+            for layout in ("1.9", "1.10")
+        }
+        self.pool = ModelPool(2, min_models=4)
+        self.addCleanup(self.pool.close)
+
+    def _write(self, layout: str) -> str:
+        file_path = os.path.join(self.temp_dir, f"schema_{layout}.yml")
+        with open(file_path, "w", encoding="utf-8") as file:
+            yaml.safe_dump({"version": 2, "models": self.models[layout]}, file)
+        return file_path
+
+    def _process(
+        self,
+        layout: str,
+        pool: Optional[ModelPool],
+        model_cache: Optional[ModelResultCache] = None,
+    ) -> Tuple[List[str], bool]:
+        if layout == "1.9":
+            parser_class, checker_class = (
+                LightdashV20,
+                FindDuplicateDimensionsAndMetricsV1,
+            )
+        else:
+            parser_class, checker_class = (
+                LightdashV25,
+                FindDuplicateDimensionsAndMetricsV2,
+            )
+        return process_single_file(
+            self._write(layout),
+            parser_class,
+            checker_class,
+            pool=pool,
+            model_cache=model_cache,
+        )
+
+    def test_errors_are_merged_in_order(self):
+        """Test the errors of the chunks are those of a serial run, in order."""
+        for layout in ("1.9", "1.10"):
+            with self.subTest(layout=layout):
+                expected = self._process(layout, None)
+                self.assertEqual(len(expected[0]), 3 * 7)
+                self.assertEqual(self._process(layout, self.pool), expected)
+        self.assertIsNotNone(self.pool.executor)
+
+        # Only the changed models are validated and checked again
+        cache = ModelResultCache()
+        self._process("1.10", self.pool, cache)
+        self.models["1.10"][0] = dict(_model(1, "1.10"), name="model_0")
+        errors, success = self._process("1.10", self.pool, cache)
+        self.assertEqual((errors, success), self._process("1.10", None))
+        self.assertEqual((cache.hits, cache.misses), (12, 14))
+
+    def test_invalid_chunk_is_processed_as_a_whole(self):
+        """Test validation errors keep the locations of the whole document."""
+        self.models["1.10"][11]["columns"][0]["name"] = ["not", "a", "name"]
+        errors, success = self._process("1.10", self.pool)
+        self.assertFalse(success)
+        self.assertEqual((errors, success), self._process("1.10", None))
+        self.assertIn("models[11].columns[0].name", errors[0])
+
+    def test_timeout_cancels_pending_chunks(self):
+        """Test the chunks of a file over --timeout are not left queued in the pool."""
+        rest = {"version": 2}
+        models = self.models["1.10"]
+        # Start the workers
+        errors, _ = self.pool.check(LightdashV25, [], rest, models)
+        self.assertEqual(errors, [[] for _ in models])
+
+        futures = []
+        submit = self.pool.executor.submit
+
+        def _submit(*args, **kwargs):
+            futures.append(submit(*args, **kwargs))
+            return futures[-1]
+
+        # A chunk per model: each worker runs one and the executor queues at most
+        # one more per worker, so the last chunks are still pending at the timeout
+        with mock.patch.object(parallel, "CHUNKS_PER_JOB", NUM_MODELS):
+            with mock.patch.object(self.pool.executor, "submit", _submit):
+                with self.assertRaises(ResourceLimitError), time_limit(0.1):
+                    self.pool.check(LightdashV25, [SlowChecker()], rest, models)
+        self.assertEqual(len(futures), NUM_MODELS)
+        self.assertTrue(futures[-1].cancelled())
+
+        # The pool is still usable by the next file
+        errors, _ = self.pool.check(LightdashV25, [], rest, models)
+        self.assertEqual(errors, [[] for _ in models])
+
+    def test_jobs_option(self):
+        """Test the hook gives the same output with several jobs."""
+        file_path = self._write("1.9")
+        outputs = []
+        for argv in ([file_path], ["--jobs=2", file_path], ["--jobs=0", file_path]):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exit_code = check_duplicate_dimensions_and_metrics_v1.main(argv)
+            outputs.append((exit_code, output.getvalue()))
+        self.assertEqual(outputs[0][0], 1)
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertEqual(outputs[2], outputs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
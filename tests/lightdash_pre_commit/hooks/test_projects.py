@@ -0,0 +1,149 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import re
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from typing import List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks import check_naming_conventions, validate_joins
+from lightdash_pre_commit.hooks.projects import group_by_project
+
+
+def _model(name: str, joins: List[str]) -> dict:
+    return {
+        "name": name,
+        "config": {
+            "meta": {
+                "joins": [
+                    {"join": join, "sql_on": f"${{{name}.id}} = ${{{join}.id}}"}
+                    for join in joins
+                ]
+            }
+        },
+        "columns": [
+            {
+                "name": "id",
+                "config": {"meta": {"metrics": {f"{name}_count": {"type": "count"}}}},
+            }
+        ],
+    }
+
+
+class TestProjects(unittest.TestCase):
+    """Test checking the dbt projects of a monorepo in isolation."""
+
+    def setUp(self):
+        """Write two projects whose models would form a join cycle together."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.shop = os.path.join(self.temp_dir, "shop")
+        self.crm = os.path.join(self.temp_dir, "crm")
+        self.file_paths = [
+            self._write(self.shop, "orders.yml", [_model("orders", ["customers"])]),
+            self._write(self.crm, "customers.yml", [_model("customers", ["orders"])]),
+            self._write(self.shop, "customers.yml", [_model("customers", [])]),
+        ]
+        for root, pattern in ((self.shop, ".*_count"), (self.crm, "customers_.*")):
+            with open(os.path.join(root, "dbt_project.yml"), "w") as file:
+                yaml.safe_dump({"name": os.path.basename(root)}, file)
+            with open(os.path.join(root, ".lightdash-pre-commit.yaml"), "w") as file:
+                yaml.safe_dump(
+                    {"naming_conventions": {"metrics": {"pattern": pattern}}}, file
+                )
+
+    def _write(self, root: str, name: str, models: List[dict]) -> str:
+        path = os.path.join(root, "models", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            yaml.safe_dump({"version": 2, "models": models}, file)
+        return path
+
+    def _run(self, main, argv: List[str]) -> Tuple[int, str]:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        # The time spent on each project varies between runs
+        return exit_code, re.sub(r" in \d+\.\d+s", "", output.getvalue())
+
+    def test_group_by_project(self):
+        """Test files are grouped by their nearest dbt project, in order."""
+        outside = self._write(self.temp_dir, "other.yml", [])
+        groups = group_by_project(self.file_paths + [outside])
+        self.assertEqual(
+            groups,
+            {
+                self.shop: [self.file_paths[0], self.file_paths[2]],
+                self.crm: [self.file_paths[1]],
+                None: [outside],
+            },
+        )
+
+    def test_projects_are_isolated(self):
+        """Test each project has its own index, cache and summary."""
+        exit_code, output = self._run(validate_joins.main, self.file_paths)
+        self.assertEqual(exit_code, 1)
+        self.assertIn("join cycle", output)
+
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        argv = ["--per-project", f"--cache-dir={cache_dir}"] + self.file_paths
+        exit_code, output = self._run(validate_joins.main, argv)
+        self.assertEqual(exit_code, 1)
+        self.assertNotIn("join cycle", output)
+        self.assertIn(f"== {self.crm} ==", output)
+        self.assertIn(
+            "Join target 'orders' of explore 'customers' does not exist", output
+        )
+        self.assertIn(f"  {self.shop}: 2 files, passed", output)
+        self.assertIn(f"  {self.crm}: 1 file, failed (1)", output)
+        self.assertIn("2 projects, 1 failed", output)
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, "projects"))), 2)
+
+        # The projects give the same output in one process
+        self.assertEqual(
+            self._run(validate_joins.main, ["--project-jobs=1"] + argv),
+            (exit_code, output),
+        )
+
+    def test_project_configuration(self):
+        """Test each project is checked with the configuration at its root."""
+        exit_code, output = self._run(
+            check_naming_conventions.main, ["--per-project"] + self.file_paths
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertIn("2 projects, 0 failed", output)
+
+        config_path = os.path.join(self.crm, ".lightdash-pre-commit.yaml")
+        exit_code, output = self._run(
+            check_naming_conventions.main,
+            ["--per-project", f"--config={config_path}"] + self.file_paths,
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Metric 'orders_count'", output)
+
+    def test_shard_is_rejected(self):
+        """Test the projects cannot be sharded."""
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as context:
+            validate_joins.main(["--per-project", "--shard=1/2"] + self.file_paths)
+        self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import Callable, List, Tuple
+
+from lightdash_pre_commit import cli
+from lightdash_pre_commit.hooks import check_duplicate_dimensions_and_metrics_v1
+from lightdash_pre_commit.hooks.sharding import parse_shard, partition_by_size
+
+
+class TestSharding(unittest.TestCase):
+    """Test sharding the files of the hooks and merging their results."""
+
+    def setUp(self):
+        """Set up the fixture directory path and a temporary directory."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__),
+            "fixtures",
+            "check_duplicate_dimensions_and_metrics_v1",
+        )
+        self.file_paths = [
+            os.path.join(self.fixtures_dir, name)
+            for name in sorted(os.listdir(self.fixtures_dir))
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _run(self, main: Callable, argv: List[str]) -> Tuple[int, str]:
+        """Run a command and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def _write_file(self, name: str, size: int) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("x" * size)
+        return path
+
+    def test_parse_shard(self):
+        """Test shards are numbered from 1."""
+        shard = parse_shard("2/4")
+        self.assertEqual((shard.index, shard.count), (2, 4))
+        for value in ["0/4", "5/4", "1", "a/b", "1/0"]:
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    parse_shard(value)
+
+    def test_partition_by_size(self):
+        """Test the partition balances sizes and ignores the input order."""
+        paths = [
+            self._write_file(f"file_{i}.yml", size)
+            for i, size in enumerate([100, 10, 60, 40, 50, 30])
+        ]
+        shards = partition_by_size(paths, 2)
+        self.assertEqual(
+            [sum(os.path.getsize(path) for path in shard) for shard in shards],
+            [150, 140],
+        )
+        # Each shard keeps the input order
+        for shard in shards:
+            self.assertEqual(shard, sorted(shard, key=paths.index))
+        self.assertEqual(
+            [sorted(shard) for shard in partition_by_size(paths[::-1], 2)],
+            [sorted(shard) for shard in shards],
+        )
+
+    def test_shards_merge_into_unsharded_report(self):
+        """Test merging all the shards reports the errors of an unsharded run."""
+        main = check_duplicate_dimensions_and_metrics_v1.main
+        expected_exit_code, expected_output = self._run(main, self.file_paths)
+
+        partials = []
+        covered: List[str] = []
+        for index in range(1, 4):
+            partial = os.path.join(self.temp_dir.name, f"shard_{index}.json")
+            partials.append(partial)
+            self._run(
+                main,
+                [f"--shard={index}/3", f"--shard-output={partial}"] + self.file_paths,
+            )
+            with open(partial, "r", encoding="utf-8") as file:
+                covered.extend(result["file"] for result in json.load(file)["results"])
+        self.assertEqual(len(covered), len(set(covered)))
+
+        exit_code, output = self._run(cli.main, ["merge"] + partials[::-1])
+        self.assertEqual((exit_code, output), (expected_exit_code, expected_output))
+
+    def test_merge_deduplicates_findings(self):
+        """Test an error reported by several shards is only reported once."""
+        partials = []
+        for index, errors in [(1, ["a", "b"]), (2, ["b", "c"])]:
+            partial = os.path.join(self.temp_dir.name, f"shard_{index}.json")
+            partials.append(partial)
+            with open(partial, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "format_version": 1,
+                        "hook": "validate-joins",
+                        "shard": {"index": index, "count": 2},
+                        "files": ["first.yml", "second.yml"],
+                        "results": [{"file": "second.yml", "errors": errors}]
+                        + (
+                            [{"file": "first.yml", "errors": ["d"]}]
+                            if index == 2
+                            else []
+                        ),
+                        "exit_code": 1,
+                    },
+                    file,
+                )
+        exit_code, output = self._run(cli.main, ["merge"] + partials)
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output,
+            "Errors found in 'first.yml':\n  d\n"
+            "Errors found in 'second.yml':\n  a\n  b\n  c\n",
+        )
+
+    def test_merge_missing_shard(self):
+        """Test merging an incomplete set of shards fails."""
+        partial = os.path.join(self.temp_dir.name, "shard_1.json")
+        self._run(
+            check_duplicate_dimensions_and_metrics_v1.main,
+            ["--shard=1/2", f"--shard-output={partial}"] + self.file_paths,
+        )
+        exit_code, output = self._run(cli.main, ["merge", partial])
+        self.assertEqual(exit_code, 2)
+        self.assertIn(
+            "Missing shards of 'check-duplicate-dimensions-and-metrics-v1': 2/2",
+            output,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from typing import List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from lightdash_pre_commit.hooks.base import BaseChecker
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v1 import (
+    FindDuplicateDimensionsAndMetricsV1,
+)
+from lightdash_pre_commit.hooks.check_duplicate_dimensions_and_metrics_v2 import (
+    FindDuplicateDimensionsAndMetricsV2,
+)
+from lightdash_pre_commit.hooks.traversal import (
+    ColumnNode,
+    DimensionNode,
+    MetricNode,
+    ModelNode,
+    run_checkers,
+)
+from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+
+class RecordingChecker(BaseChecker):
+    """Record every visited node."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.visits: List[Tuple[str, str]] = []
+
+    def visit_model(self, node: ModelNode) -> None:
+        self.visits.append(("model", node.name))
+
+    def leave_model(self, node: ModelNode) -> None:
+        self.visits.append(("leave", node.name))
+
+    def visit_column(self, node: ColumnNode) -> None:
+        self.visits.append(("column", node.name))
+
+    def visit_metric(self, node: MetricNode) -> None:
+        self.visits.append(("metric", node.name))
+
+    def visit_dimension(self, node: DimensionNode) -> None:
+        kind = "additional_dimension" if node.additional else "dimension"
+        self.visits.append((kind, node.name))
+
+
+class MetricOnlyChecker(BaseChecker):
+    """Only register a metric callback."""
+
+    def visit_metric(self, node: MetricNode) -> None:
+        self.errors.append(f"metric '{node.name}' in model '{node.model.name}'")
+
+
+class TestTraversal(unittest.TestCase):
+    """Test the single-traversal visitor engine."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+
+    def _load_fixture(self, version: str, filename: str) -> dict:
+        """Load a YAML fixture file and return the parsed data."""
+        fixture_path = os.path.join(
+            self.fixtures_dir,
+            f"check_duplicate_dimensions_and_metrics_{version}",
+            filename,
+        )
+        with open(fixture_path, "r", encoding="utf-8") as file:
+            return yaml.safe_load(file)
+
+    def test_visit_order_is_the_same_for_both_layouts(self):
+        """Test dbt 1.9 and dbt 1.10 layouts are visited in the same order."""
+        v1_data = LightdashV20.model_validate(
+            self._load_fixture("v1", "multiple_duplicates.yml")
+        )
+        v2_data = LightdashV25.model_validate(
+            self._load_fixture("v2", "multiple_duplicates.yml")
+        )
+        v1_checker = RecordingChecker()
+        v2_checker = RecordingChecker()
+        run_checkers(v1_data, [v1_checker])
+        run_checkers(v2_data, [v2_checker])
+
+        self.assertEqual(v1_checker.visits, v2_checker.visits)
+        self.assertEqual(v2_checker.visits[0], ("model", "Test Multiple Duplicates"))
+        self.assertEqual(v2_checker.visits[1], ("metric", "total_count"))
+        self.assertEqual(v2_checker.visits[2], ("column", "user_id"))
+        self.assertEqual(v2_checker.visits[-1], ("leave", "Test Multiple Duplicates"))
+        self.assertIn(("additional_dimension", "user_id"), v2_checker.visits)
+
+    def test_multiple_checkers_share_one_traversal(self):
+        """Test errors of all checkers are collected in order with timings."""
+        data = LightdashV25.model_validate(
+            self._load_fixture("v2", "multiple_duplicates.yml")
+        )
+        result = run_checkers(
+            data, [FindDuplicateDimensionsAndMetricsV2(), MetricOnlyChecker()]
+        )
+
+        duplicate_errors = result.errors_by_checker[
+            "FindDuplicateDimensionsAndMetricsV2"
+        ]
+        metric_errors = result.errors_by_checker["MetricOnlyChecker"]
+        self.assertEqual(result.errors, duplicate_errors + metric_errors)
+        self.assertEqual(len(metric_errors), 4)
+        self.assertEqual(
+            set(result.timings),
+            {"FindDuplicateDimensionsAndMetricsV2", "MetricOnlyChecker"},
+        )
+        self.assertTrue(all(elapsed >= 0 for elapsed in result.timings.values()))
+
+    def test_only_overridden_callbacks_are_registered(self):
+        """Test checkers are not called for nodes they do not handle."""
+        self.assertEqual(
+            list(MetricOnlyChecker().registered_callbacks()), ["visit_metric"]
+        )
+
+    def test_checker_rejects_unexpected_document_type(self):
+        """Test a checker rejects documents of another parser."""
+        data = LightdashV25.model_validate(self._load_fixture("v2", "unique_names.yml"))
+        with self.assertRaises(ValueError):
+            FindDuplicateDimensionsAndMetricsV1.check(data=data)
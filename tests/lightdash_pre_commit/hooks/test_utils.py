@@ -0,0 +1,96 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import tempfile
+import unittest
+
+from lightdash_pre_commit.hooks.history import RunRecorder
+from lightdash_pre_commit.hooks.join_graph import JoinGraphIndex
+from lightdash_pre_commit.hooks.utils import read_project_files, update_file_index
+from lightdash_pre_commit.hooks.validate_joins import JoinCollector
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+VALID = "version: 2\nmodels:\n  - name: orders\n"
+INVALID = "version: 2\nmodels:\n  - name: orders\n    columns: 5\n"
+
+
+class TestProjectIndexing(unittest.TestCase):
+    """Test the indexing shared by the project-wide hooks."""
+
+    def setUp(self):
+        """Write a git repository with a vendored package ignored by git."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.repo_dir = temp_dir.name
+        os.makedirs(os.path.join(self.repo_dir, ".git"))
+        self._write(".gitignore", "dbt_packages/\n")
+        self.orders = self._write("models/orders.yml", VALID)
+        self.invalid = self._write("models/invalid.yml", INVALID)
+        self._write("dbt_packages/pkg/models/vendored.yml", VALID)
+
+    def _write(self, path: str, content: str) -> str:
+        path = os.path.join(self.repo_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def _update(self, index: JoinGraphIndex, recorder: RunRecorder):
+        def _store(file_path, signature, collector):
+            index.update_file(file_path, signature, collector.models)
+
+        return update_file_index(
+            index,
+            [self.orders, self.invalid],
+            LightdashV25,
+            JoinCollector,
+            _store,
+            recorder=recorder,
+        )
+
+    def test_read_project_files(self):
+        """Test the search paths skip the files ignored by git."""
+        args = argparse.Namespace(
+            filenames=[self.orders],
+            project_dir=None,
+            search_path=[self.repo_dir],
+            shard=None,
+            shard_output=None,
+            history_file=None,
+        )
+        deleted = os.path.join(self.repo_dir, "models", "deleted.yml")
+        report, project_paths, recorder = read_project_files(
+            "hook", args, [deleted, self.orders]
+        )
+        self.assertEqual(report.file_paths, [self.orders])
+        self.assertEqual(project_paths, [self.orders, self.invalid, deleted])
+        self.assertEqual(recorder.file_paths, project_paths)
+
+    def test_failed_files_are_not_fresh(self):
+        """Test a file failing validation is parsed and reported again."""
+        index = JoinGraphIndex()
+        first = self._update(index, RunRecorder("hook", []))
+        self.assertEqual(list(first), [self.invalid])
+        self.assertEqual(index.indexed_files(), [self.orders])
+
+        restored = JoinGraphIndex.from_dict(index.to_dict())
+        recorder = RunRecorder("hook", [])
+        self.assertEqual(self._update(restored, recorder), first)
+        self.assertEqual(recorder.cache_hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
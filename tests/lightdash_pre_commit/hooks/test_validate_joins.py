@@ -0,0 +1,234 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from lightdash_pre_commit.hooks.join_graph import JoinEdge, JoinGraphIndex
+from lightdash_pre_commit.hooks.validate_joins import main
+
+
+def _edge(target: str, source: str) -> JoinEdge:
+    """Create a join edge with a valid sql_on."""
+    return JoinEdge(
+        target=target,
+        alias=target,
+        always=False,
+        sql_on=f"${{{source}.{target}_id}} = ${{{target}.id}}",
+    )
+
+
+class TestValidateJoins(unittest.TestCase):
+    """Test the validate_joins hook."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "validate_joins"
+        )
+
+    def _fixture(self, filename: str) -> str:
+        return os.path.join(self.fixtures_dir, filename)
+
+    def _run(self, argv: List[str]) -> Tuple[int, str]:
+        """Run the hook and capture its output."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            exit_code = main(argv)
+        return exit_code, output.getvalue()
+
+    def test_valid_joins(self):
+        """Test joins to existing models with unique aliases pass."""
+        exit_code, output = self._run(
+            [self._fixture("orders.yml"), self._fixture("customers.yml")]
+        )
+        self.assertEqual(output, "")
+        self.assertEqual(exit_code, 0)
+
+    def test_join_target_resolved_from_search_path(self):
+        """Test join targets defined in files that are not checked are resolved."""
+        exit_code, output = self._run(
+            [self._fixture("orders.yml"), "--search-path", self.fixtures_dir]
+        )
+        # Only the explores of the files passed are reported
+        self.assertEqual(output, "")
+        self.assertEqual(exit_code, 0)
+
+    def test_missing_join_target(self):
+        """Test a join to a model that is not defined anywhere."""
+        exit_code, output = self._run([self._fixture("orders.yml")])
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            "Join target 'customers' of explore 'orders' does not exist", output
+        )
+
+    def test_invalid_joins(self):
+        """Test duplicate aliases, reference syntax and unknown tables."""
+        exit_code, output = self._run(
+            [self._fixture("invalid_joins.yml"), self._fixture("customers.yml")]
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            "Join target 'customer' of explore 'payments' does not exist "
+            "(did you mean 'customers'?)",
+            output,
+        )
+        self.assertIn(
+            "Duplicate join alias 'orders' used 2 times in explore 'payments'", output
+        )
+        self.assertIn(
+            "Join alias 'payments' conflicts with the base model of explore 'payments'",
+            output,
+        )
+        self.assertIn("does not use the ${table.field} reference syntax", output)
+        self.assertIn(
+            "references unknown table 'order' in sql_on (did you mean 'orders'?)",
+            output,
+        )
+
+    def test_join_cycle(self):
+        """Test explores joining each other are reported as a cycle."""
+        exit_code, output = self._run([self._fixture("join_cycle.yml")])
+        self.assertEqual(exit_code, 1)
+        self.assertIn(
+            "Explore 'sessions' is part of a join cycle: sessions -> users -> sessions",
+            output,
+        )
+        self.assertIn(
+            "Explore 'users' is part of a join cycle: users -> sessions -> users",
+            output,
+        )
+
+    def test_field_id_collision(self):
+        """Test fields of joined models deriving the same field ID are reported."""
+        exit_code, output = self._run([self._fixture("field_id_collision.yml")])
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            output.splitlines()[1:],
+            [
+                "  Field ID 'carts_items_count' of explore 'carts' is derived from "
+                "both 'carts.items_count' and 'carts_items.count'",
+                "  Field ID 'carts_returned_cart_id' of explore 'carts' is derived "
+                "from both 'carts.returned_cart_id' and 'carts_returned.cart_id'",
+            ],
+        )
+
+    def test_cached_index_resolves_unchanged_files(self):
+        """Test the persisted join graph resolves targets of files not passed again."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            for filename in ("orders.yml", "customers.yml"):
+                shutil.copy(self._fixture(filename), tmp_dir)
+            orders = os.path.join(tmp_dir, "orders.yml")
+            customers = os.path.join(tmp_dir, "customers.yml")
+
+            exit_code, _ = self._run([orders, customers, "--cache-dir", cache_dir])
+            self.assertEqual(exit_code, 0)
+            exit_code, output = self._run([orders, "--cache-dir", cache_dir])
+            self.assertEqual((exit_code, output), (0, ""))
+
+            # Deleting the join target is detected through the cached index
+            os.remove(customers)
+            exit_code, output = self._run([orders, "--cache-dir", cache_dir])
+            self.assertEqual(exit_code, 1)
+            self.assertIn("Join target 'customers' of explore 'orders'", output)
+
+
+class TestJoinGraphIndex(unittest.TestCase):
+    """Test the incremental join graph index."""
+
+    def _build_chain_index(self, size: int) -> JoinGraphIndex:
+        """Build an index of models joining the next one, one model per file."""
+        index = JoinGraphIndex()
+        for i in range(size):
+            joins = [_edge(f"model_{i + 1}", f"model_{i}")] if i + 1 < size else []
+            index.update_file(f"file_{i}.yml", [0, i], {f"model_{i}": joins})
+        return index
+
+    def test_only_affected_explores_are_re_resolved(self):
+        """Test an update only re-resolves explores reaching the changed model."""
+        index = self._build_chain_index(1000)
+        explores = index.model_names()
+        self.assertEqual(all(not e for e in index.resolve(explores).values()), True)
+        self.assertEqual(len(index.resolved), 1000)
+
+        # Nothing changed
+        index.resolve(explores)
+        self.assertEqual(index.resolved, set())
+
+        # An unrelated model joining the tail of the chain only affects itself
+        index.update_file("extra.yml", [0, 0], {"extra": [_edge("model_999", "extra")]})
+        index.resolve(explores + ["extra"])
+        self.assertEqual(index.resolved, {"extra"})
+
+        # Changing a model invalidates the explores that can reach it
+        index.update_file("file_997.yml", [1, 997], {"model_997": []})
+        index.resolve(explores)
+        self.assertEqual(index.resolved, {f"model_{i}" for i in range(998)})
+
+    def test_only_explores_including_changed_fields_are_re_expanded(self):
+        """Test a change of fields only re-expands the explores joining the model."""
+        index = self._build_chain_index(1000)
+        explores = index.model_names()
+        index.resolve(explores)
+        self.assertEqual(len(index.expanded), 1000)
+
+        # model_499 is only included in its own explore and that of model_498
+        index.update_file(
+            "file_499.yml",
+            [1, 499],
+            {"model_499": [_edge("model_500", "model_499")]},
+            {"model_499": ["id"]},
+        )
+        index.resolve(explores)
+        self.assertEqual(index.resolved, set())
+        self.assertEqual(index.expanded, {"model_498", "model_499"})
+
+        index.update_file(
+            "file_500.yml",
+            [1, 500],
+            {"model_500": [_edge("model_501", "model_500")]},
+            {"model_500": ["id"]},
+        )
+        index.resolve(explores)
+        self.assertEqual(index.resolved, set())
+        self.assertEqual(index.expanded, {"model_499", "model_500"})
+
+    def test_touched_file_does_not_invalidate(self):
+        """Test a new signature with the same models keeps the resolved errors."""
+        index = self._build_chain_index(10)
+        index.resolve(index.model_names())
+        index.update_file(
+            "file_5.yml", [9, 9], {"model_5": [_edge("model_6", "model_5")]}
+        )
+        index.resolve(index.model_names())
+        self.assertEqual(index.resolved, set())
+        self.assertTrue(index.is_fresh("file_5.yml", [9, 9]))
+
+    def test_serialization_round_trip(self):
+        """Test a restored index keeps its models and resolved errors."""
+        index = self._build_chain_index(10)
+        index.update_file(
+            "cycle.yml", [0, 0], {"model_9": [_edge("model_0", "model_9")]}
+        )
+        errors = index.resolve(index.model_names())
+        restored = JoinGraphIndex.from_dict(index.to_dict())
+        self.assertEqual(restored.resolve(index.model_names()), errors)
+        self.assertEqual(restored.resolved, set())
+        self.assertIn("join cycle", errors["model_0"][0])
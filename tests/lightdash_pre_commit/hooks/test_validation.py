@@ -0,0 +1,100 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+from pydantic import ValidationError
+
+from lightdash_pre_commit.hooks.utils import process_single_file
+from lightdash_pre_commit.hooks.validation import (
+    render_validation_error,
+    union_tag_positions,
+)
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import LightdashV25
+
+
+class TestValidation(unittest.TestCase):
+    """Test rendering pydantic validation errors."""
+
+    def setUp(self):
+        """Set up the fixture directory path."""
+        self.fixtures_dir = os.path.join(
+            os.path.dirname(__file__), "fixtures", "validation"
+        )
+
+    def _validation_error(self, data) -> ValidationError:
+        with self.assertRaises(ValidationError) as context:
+            LightdashV25.model_validate(data)
+        return context.exception
+
+    def test_union_tag_positions(self):
+        """Test union tags are told apart from field names."""
+        self.assertEqual(
+            union_tag_positions(
+                LightdashV25,
+                ("models", 0, "Models1", "columns", 3, "Columns", "name"),
+            ),
+            (2, 5),
+        )
+        self.assertEqual(
+            union_tag_positions(
+                LightdashV25,
+                ("models", 0, "Models1", "config", "meta", "metrics", "x", "type"),
+            ),
+            (2,),
+        )
+
+    def test_most_plausible_branches(self):
+        """Test each failing union is reduced to its most plausible branch."""
+        file_path = os.path.join(self.fixtures_dir, "invalid_schema.yml")
+        errors, success = process_single_file(file_path, LightdashV25, [])
+        self.assertFalse(success)
+        self.assertEqual(
+            errors,
+            [
+                f"Validation error in '{file_path}':\n"
+                "    models[0].columns[0].name: Input should be a valid string\n"
+                "    models[0].config.meta.metrics.Total_Revenue (key): "
+                "String should match pattern '^[a-z0-9_]+$' (input: 'Total_Revenue')\n"
+                "    models[1]: Input should be a valid dictionary or instance of "
+                "Models (input: 'just a model name')"
+            ],
+        )
+
+    def test_rendering_is_bounded(self):
+        """Test a file with many errors renders a bounded report."""
+        data = {
+            "version": 2,
+            "models": [
+                {"name": f"model_{index}", "columns": [{"name": index}] * 50}
+                for index in range(100)
+            ],
+        }
+        error = self._validation_error(data)
+        self.assertEqual(error.error_count(), 100 * 50 * 9)
+        rendered = render_validation_error("schema.yml", error, LightdashV25)
+        lines = rendered.splitlines()
+        self.assertEqual(lines[0], "Validation error in 'schema.yml':")
+        self.assertEqual(
+            lines[1],
+            "    models[0].columns[0].name: Input should be a valid string (input: 0)",
+        )
+        self.assertEqual(lines[-1], "    ... and at least 129 more invalid locations")
+        self.assertEqual(len(lines), 22)
+        self.assertLess(len(rendered), len(str(error)) / 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
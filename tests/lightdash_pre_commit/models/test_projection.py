@@ -0,0 +1,95 @@
+# Copyright 2025 Ubie, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import os
+import unittest
+
+from pydantic import ValidationError
+
+from lightdash_pre_commit.parsers.lightdash_dbt_2_0 import LightdashV20
+from lightdash_pre_commit.parsers.lightdash_dbt_2_5 import (
+    Columns,
+    LightdashV25,
+    Models,
+)
+from lightdash_pre_commit.parsers.projection import (
+    NON_LIGHTDASH_FIELDS,
+    NON_LIGHTDASH_RESOURCES,
+    project_document,
+    validate_projection,
+)
+from tests.lightdash_pre_commit.utils import get_test_root_dir, load_yaml
+
+
+class TestProjection(unittest.TestCase):
+    """Test validating the projection of documents onto what Lightdash reads."""
+
+    def _load(self, layout: str, name: str) -> dict:
+        return load_yaml(
+            os.path.join(get_test_root_dir(), "models", "fixtures", layout, name)
+        )
+
+    def _errors(self, parser_class, data) -> list:
+        with self.assertRaises(ValidationError) as context:
+            parser_class.model_validate(data)
+        return context.exception.errors()
+
+    def test_projected_fields_exist_in_parsers(self):
+        """Test the projected fields still exist in the generated parsers."""
+        for parser_class in (LightdashV20, LightdashV25):
+            self.assertLessEqual(
+                NON_LIGHTDASH_RESOURCES, set(parser_class.model_fields)
+            )
+        for parser_class in (Models, Columns):
+            self.assertLessEqual(NON_LIGHTDASH_FIELDS, set(parser_class.model_fields))
+
+    def test_valid_documents_parse_the_same(self):
+        """Test the projection of a valid document parses into the same Lightdash data."""
+        for layout, parser_class in (
+            ("dbt_1_9", LightdashV20),
+            ("dbt_1_10", LightdashV25),
+        ):
+            with self.subTest(layout=layout):
+                data = self._load(layout, "simple_model.yml")
+                full = parser_class.model_validate(data)
+                projected = validate_projection(parser_class, data)
+                self.assertEqual(
+                    projected.model_dump(exclude=set(NON_LIGHTDASH_RESOURCES)),
+                    full.model_dump(exclude=set(NON_LIGHTDASH_RESOURCES)),
+                )
+
+    def test_lightdash_errors_are_preserved(self):
+        """Test the errors of the parts Lightdash reads are preserved exactly."""
+        data = self._load("dbt_1_10", "test_heavy_model.yml")
+        original = copy.deepcopy(data)
+        full_errors = self._errors(LightdashV25, data)
+        projected_errors = self._errors(LightdashV25, project_document(data))
+
+        self.assertEqual(data, original)
+        self.assertTrue(projected_errors)
+        self.assertEqual(
+            projected_errors,
+            [
+                error
+                for error in full_errors
+                if error["loc"][0] not in NON_LIGHTDASH_RESOURCES
+            ],
+        )
+        # The dbt tests and sources are left unvalidated
+        self.assertLess(len(projected_errors), len(full_errors))
+
+
+if __name__ == "__main__":
+    unittest.main()